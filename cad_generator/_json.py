@@ -0,0 +1,20 @@
+"""
+JSON helpers with an optional orjson fast path.
+
+orjson parses and serialises several times faster than the stdlib module and
+accepts bytes directly, skipping a decode step. It is optional: without it
+the stdlib json module is used. Both variants of dumps() return str.
+"""
+
+from __future__ import annotations
+
+try:
+    import orjson
+
+    loads = orjson.loads
+
+    def dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+except ImportError:  # pragma: no cover - depends on the environment
+    from json import dumps, loads  # noqa: F401
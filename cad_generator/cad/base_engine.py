@@ -10,19 +10,22 @@ the specific CAD tool in use.
 from __future__ import annotations
 
 import abc
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Sequence
 
+# (piece_code, parameters, output_dir, revision_code) — the generate() args
+GenerationJob = tuple[str, dict, Path, str]
 
-@dataclass
+
+@dataclass(slots=True)
 class GenerationResult:
     """Outcome of a CAD generation run."""
     success: bool
     fcstd_path: Optional[Path] = None
     step_path: Optional[Path] = None
     error_message: Optional[str] = None
-    warnings: list[str] = field(default_factory=list)
+    warnings: tuple[str, ...] = ()
     elapsed_seconds: float = 0.0
 
 
@@ -54,6 +57,15 @@ class ICADEngine(abc.ABC):
         """
         ...
 
+    def generate_many(self, jobs: Sequence[GenerationJob]) -> list[GenerationResult]:
+        """
+        Run several generations and return their results in job order.
+
+        The default runs the jobs one after another; engines that can work
+        on distinct pieces concurrently override this.
+        """
+        return [self.generate(*job) for job in jobs]
+
     @abc.abstractmethod
     def is_available(self) -> bool:
         """Return True if the underlying CAD engine is installed and reachable."""
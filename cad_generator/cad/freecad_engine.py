@@ -3,11 +3,22 @@ FreeCAD CAD engine adapter.
 
 Calls FreeCAD as a subprocess using freecadcmd.exe.
 
-Communication protocol:
-  1. Write parameters to a temp JSON file.
-  2. Invoke: freecadcmd.exe <freecad_generate.py> <params.json>
-  3. Read result.json written by the script to output_dir.
-  4. Clean up the temp params file.
+Communication protocol (persistent worker, default):
+  1. On first use, launch one long-lived freecadcmd.exe child running
+     freecad_generate.py with stdin/stdout connected to pipes.
+  2. Per request, write one JSON line to the child's stdin.
+  3. Read lines from the child's stdout until the reply line (prefixed with
+     _REPLY_PREFIX) arrives; any other output is FreeCAD console noise.
+  4. A watchdog kills the child if it exceeds freecad_timeout_seconds; the
+     next request respawns it.
+
+The interpreter and the FreeCAD/Part modules stay resident between calls,
+so only the first generation pays the freecadcmd.exe startup cost.
+
+One-shot protocol (settings.freecad_persistent_worker = False):
+  1. Invoke: freecadcmd.exe <freecad_generate.py>, writing a single request
+     line to its stdin and closing it.
+  2. The script replies once on stdout, writes result.json and exits.
 
 This subprocess isolation is REQUIRED because FreeCAD 1.0 bundles its own
 Python 3.11 interpreter, which conflicts with the project's Python 3.12.
@@ -15,19 +26,147 @@ Python 3.11 interpreter, which conflicts with the project's Python 3.12.
 
 from __future__ import annotations
 
-import json
+import collections
 import os
+import queue
 import subprocess
-import tempfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Optional, Sequence
 
-from cad_generator.cad.base_engine import GenerationResult, ICADEngine
+from cad_generator._json import dumps, loads
+from cad_generator.cad.base_engine import GenerationJob, GenerationResult, ICADEngine
 from cad_generator.config.settings import settings
 
+# Must match _REPLY_PREFIX in scripts/freecad_generate.py
+_REPLY_PREFIX = "@@RESULT "
+# Set in a persistent worker's environment (see _WORKER_ENV in the script)
+_WORKER_ENV = "FREECAD_WORKER"
+
+
+class _WorkerError(RuntimeError):
+    """The worker process died or replied with something unreadable."""
+
+
+class _WorkerTimeout(_WorkerError):
+    """The watchdog killed the worker because a request took too long."""
+
+
+class _FreeCADWorker:
+    """
+    One resident freecadcmd.exe process serving newline-delimited JSON
+    requests over stdin/stdout. Calls are serialised with a lock.
+    """
+
+    def __init__(self, env: dict[str, str]) -> None:
+        self.proc: Optional[subprocess.Popen] = None
+        # Tells the script it will serve many requests, so warming up pays off
+        self._env = {**env, _WORKER_ENV: "1"}
+        self._lock = threading.Lock()
+        self._timed_out = False
+        self._stderr_tail: collections.deque[str] = collections.deque(maxlen=50)
+
+    def is_alive(self) -> bool:
+        return self.proc is not None and self.proc.poll() is None
+
+    def ensure_started(self) -> None:
+        """Spawn the process now if it is not running (no request is sent)."""
+        with self._lock:
+            if not self.is_alive():
+                self._spawn()
+
+    def call(self, payload: dict, timeout: float) -> dict:
+        """Send one request and block until its reply (or the watchdog fires)."""
+        with self._lock:
+            if not self.is_alive():
+                self._spawn()
+            proc = self.proc
+            self._timed_out = False
+
+            try:
+                proc.stdin.write(dumps(payload) + "\n")
+                proc.stdin.flush()
+            except OSError as exc:
+                self._kill()
+                raise _WorkerError(f"No se pudo enviar la solicitud: {exc}") from exc
+
+            watchdog = threading.Timer(timeout, self._on_timeout, args=(proc,))
+            watchdog.daemon = True
+            watchdog.start()
+            try:
+                while True:
+                    line = proc.stdout.readline()
+                    if not line:
+                        if self._timed_out:
+                            raise _WorkerTimeout()
+                        raise _WorkerError(
+                            f"FreeCAD worker termin\u00f3 inesperadamente "
+                            f"(returncode={proc.poll()}).\n"
+                            f"stderr: {self._stderr_text()[:500]}"
+                        )
+                    if line.startswith(_REPLY_PREFIX):
+                        return loads(line[len(_REPLY_PREFIX):])
+                    # Anything else is FreeCAD console output — ignore it.
+            finally:
+                watchdog.cancel()
+
+    def close(self) -> None:
+        with self._lock:
+            self._kill()
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _spawn(self) -> None:
+        self._stderr_tail.clear()
+        self.proc = subprocess.Popen(
+            [str(settings.freecad_bin), str(settings.freecad_script)],
+            env=self._env,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding="utf-8",
+            bufsize=1,
+        )
+        # Drain stderr continuously so a chatty child never blocks on a
+        # full pipe; keep only the tail for error messages.
+        threading.Thread(
+            target=self._drain_stderr, args=(self.proc,), daemon=True
+        ).start()
+
+    def _drain_stderr(self, proc: subprocess.Popen) -> None:
+        for line in proc.stderr:
+            self._stderr_tail.append(line)
+
+    def _stderr_text(self) -> str:
+        return "".join(self._stderr_tail)
+
+    def _on_timeout(self, proc: subprocess.Popen) -> None:
+        self._timed_out = True
+        proc.kill()
+
+    def _kill(self) -> None:
+        if self.proc is not None and self.proc.poll() is None:
+            self.proc.kill()
+            self.proc.wait()
+        self.proc = None
+
 
 class FreeCADEngine(ICADEngine):
 
+    def __init__(self) -> None:
+        # Built once and passed verbatim to every child process. Payloads
+        # may contain non-ASCII text, so the child's stdio is forced to
+        # UTF-8 regardless of the platform's console code page.
+        self._env = {**os.environ, "PYTHONIOENCODING": "utf-8"}
+        self._env.pop(_WORKER_ENV, None)    # one-shot runs never warm up
+        self._worker = _FreeCADWorker(self._env)
+        self._available = False
+
     def generate(
         self,
         piece_code: str,
@@ -37,86 +176,170 @@ class FreeCADEngine(ICADEngine):
     ) -> GenerationResult:
         output_dir.mkdir(parents=True, exist_ok=True)
         start = time.monotonic()
+        if settings.export_fcstd and "_export_fcstd" not in parameters:
+            parameters = {**parameters, "_export_fcstd": True}
+        payload = {
+            "piece_code": piece_code,
+            "parameters": parameters,
+            "output_dir": str(output_dir),
+            "revision_code": revision_code,
+        }
 
-        # Write parameters to a temporary JSON file
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".json", delete=False, encoding="utf-8"
-        ) as tmp:
-            json.dump(
-                {
-                    "piece_code": piece_code,
-                    "parameters": parameters,
-                    "output_dir": str(output_dir),
-                    "revision_code": revision_code,
-                },
-                tmp,
-                ensure_ascii=False,
-            )
-            params_file = Path(tmp.name)
+        if not settings.freecad_persistent_worker:
+            return self._generate_oneshot(payload, output_dir, start)
 
         try:
-            # Pass the params path via env var — NOT as a positional argument.
-            # freecadcmd.exe treats positional args as documents to open and
-            # dispatches .json files to FEM importers, causing failures.
-            env = os.environ.copy()
-            env["FREECAD_PARAMS"] = str(params_file)
+            result_data = self._call_worker(payload)
+        except _WorkerTimeout:
+            return self._timeout_result()
+        except (_WorkerError, OSError, ValueError) as exc:
+            return GenerationResult(
+                success=False,
+                error_message=f"FreeCAD worker fall\u00f3: {exc}",
+                elapsed_seconds=time.monotonic() - start,
+            )
+        return self._to_result(result_data, time.monotonic() - start)
+
+    def ensure_started(self) -> None:
+        """
+        Launch the resident worker ahead of the first request, so the
+        freecadcmd.exe startup and its warm-up overlap with user input.
+        No-op in one-shot mode or when FreeCAD is not installed.
+        """
+        if settings.freecad_persistent_worker and self.is_available():
+            self._worker.ensure_started()
+
+    def is_running(self) -> bool:
+        """True while the resident worker process is alive."""
+        return self._worker.is_alive()
+
+    def close(self) -> None:
+        """Terminate the resident FreeCAD worker, if any."""
+        self._worker.close()
 
+    def _call_worker(self, payload: dict) -> dict:
+        return self._worker.call(payload, settings.freecad_timeout_seconds)
+
+    def is_available(self) -> bool:
+        # Only a positive answer is cached: the binary does not disappear
+        # mid-run, but it may be installed while the app is open.
+        if not self._available:
+            self._available = settings.freecad_bin.exists()
+        return self._available
+
+    def get_engine_name(self) -> str:
+        return "FreeCAD 1.0"
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _generate_oneshot(
+        self, payload: dict, output_dir: Path, start: float
+    ) -> GenerationResult:
+        # The script serves every stdin line and exits at EOF, so a single
+        # request line makes it a one-shot run. No temp params file needed.
+        try:
             proc = subprocess.run(
                 [
                     str(settings.freecad_bin),
                     str(settings.freecad_script),
                 ],
-                env=env,
+                input=dumps(payload) + "\n",
+                env=self._env,
                 capture_output=True,
                 text=True,
+                encoding="utf-8",
                 timeout=settings.freecad_timeout_seconds,
             )
+        except subprocess.TimeoutExpired:
+            return self._timeout_result()
 
-            elapsed = time.monotonic() - start
-            result_file = output_dir / "result.json"
+        elapsed = time.monotonic() - start
+        for line in proc.stdout.splitlines():
+            if line.startswith(_REPLY_PREFIX):
+                return self._to_result(loads(line[len(_REPLY_PREFIX):]), elapsed)
 
-            if proc.returncode != 0 or not result_file.exists():
-                return GenerationResult(
-                    success=False,
-                    error_message=(
-                        f"FreeCAD subprocess fall\u00f3 (returncode={proc.returncode}).\n"
-                        f"stderr: {proc.stderr[:500]}"
-                    ),
-                    elapsed_seconds=elapsed,
-                )
+        return GenerationResult(
+            success=False,
+            error_message=(
+                f"FreeCAD subprocess fall\u00f3 (returncode={proc.returncode}).\n"
+                f"stderr: {proc.stderr[:500]}"
+            ),
+            elapsed_seconds=elapsed,
+        )
 
-            result_data = json.loads(result_file.read_text(encoding="utf-8"))
-            return GenerationResult(
-                success=result_data.get("success", False),
-                fcstd_path=(
-                    Path(result_data["fcstd_path"])
-                    if result_data.get("fcstd_path")
-                    else None
-                ),
-                step_path=(
-                    Path(result_data["step_path"])
-                    if result_data.get("step_path")
-                    else None
-                ),
-                error_message=result_data.get("error_message"),
-                warnings=result_data.get("warnings", []),
-                elapsed_seconds=elapsed,
-            )
+    @staticmethod
+    def _to_result(result_data: dict, elapsed: float) -> GenerationResult:
+        return GenerationResult(
+            success=result_data.get("success", False),
+            fcstd_path=(
+                Path(result_data["fcstd_path"])
+                if result_data.get("fcstd_path")
+                else None
+            ),
+            step_path=(
+                Path(result_data["step_path"])
+                if result_data.get("step_path")
+                else None
+            ),
+            error_message=result_data.get("error_message"),
+            warnings=tuple(result_data.get("warnings") or ()),
+            elapsed_seconds=elapsed,
+        )
 
-        except subprocess.TimeoutExpired:
-            return GenerationResult(
-                success=False,
-                error_message=(
-                    f"FreeCAD agot\u00f3 el tiempo l\u00edmite "
-                    f"({settings.freecad_timeout_seconds}s)."
-                ),
-                elapsed_seconds=float(settings.freecad_timeout_seconds),
-            )
-        finally:
-            params_file.unlink(missing_ok=True)
+    @staticmethod
+    def _timeout_result() -> GenerationResult:
+        return GenerationResult(
+            success=False,
+            error_message=(
+                f"FreeCAD agot\u00f3 el tiempo l\u00edmite "
+                f"({settings.freecad_timeout_seconds}s)."
+            ),
+            elapsed_seconds=float(settings.freecad_timeout_seconds),
+        )
 
-    def is_available(self) -> bool:
-        return settings.freecad_bin.exists()
 
-    def get_engine_name(self) -> str:
-        return "FreeCAD 1.0"
+class FreeCADEnginePool(FreeCADEngine):
+    """
+    FreeCAD engine backed by several persistent workers.
+
+    Generations of distinct pieces share no state, so generate_many() runs
+    them concurrently, one job per worker. Workers are checked out of a
+    queue and their processes are only spawned the first time they are used.
+    """
+
+    def __init__(self, size: Optional[int] = None) -> None:
+        super().__init__()
+        self._size = max(1, size or os.cpu_count() or 1)
+        self._workers = [self._worker] + [
+            _FreeCADWorker(self._env) for _ in range(self._size - 1)
+        ]
+        self._idle: queue.Queue[_FreeCADWorker] = queue.Queue()
+        for worker in self._workers:
+            self._idle.put(worker)
+
+    def generate_many(self, jobs: Sequence[GenerationJob]) -> list[GenerationResult]:
+        if len(jobs) <= 1:
+            return [self.generate(*job) for job in jobs]
+        with ThreadPoolExecutor(max_workers=min(self._size, len(jobs))) as pool:
+            return list(pool.map(lambda job: self.generate(*job), jobs))
+
+    def ensure_started(self) -> None:
+        if settings.freecad_persistent_worker and self.is_available():
+            for worker in self._workers:
+                worker.ensure_started()
+
+    def is_running(self) -> bool:
+        return all(worker.is_alive() for worker in self._workers)
+
+    def close(self) -> None:
+        for worker in self._workers:
+            worker.close()
+
+    def _call_worker(self, payload: dict) -> dict:
+        worker = self._idle.get()
+        try:
+            return worker.call(payload, settings.freecad_timeout_seconds)
+        finally:
+            self._idle.put(worker)
@@ -2,7 +2,18 @@
 IMPORTANT: This script runs inside FreeCAD's bundled Python 3.11 interpreter.
            It CANNOT import from cad_generator/. It is fully standalone.
 
-Invocation by FreeCADEngine (via environment variable):
+Invocation by FreeCADEngine (persistent worker, default):
+    freecadcmd.exe freecad_generate.py
+    The script then serves requests until stdin is closed: one params JSON
+    object per stdin line, one reply line per request on stdout, prefixed
+    with _REPLY_PREFIX so the engine can skip FreeCAD's own console output.
+
+    The engine sets FREECAD_WORKER=1 for a persistent worker; only then is
+    OCCT warmed up before the first request. A one-shot run is the same
+    thing with a single request line and no FREECAD_WORKER, so it does not
+    pay for the warm-up.
+
+Legacy invocation (via environment variable, kept for compatibility):
     # FreeCADEngine sets FREECAD_PARAMS before launching:
     FREECAD_PARAMS=/tmp/params.json freecadcmd.exe freecad_generate.py
 
@@ -11,15 +22,18 @@ WHY env var instead of sys.argv?
     document to open (it dispatches .json to importYamlJsonMesh, etc.).
     Passing the params file via an environment variable avoids that conflict.
 
-Expected params JSON (written by FreeCADEngine to a temp file):
+Expected params JSON (one stdin line, or the FREECAD_PARAMS file):
     {
         "piece_code": "base_plate",
         "parameters": { "largo": 300.0, "ancho": 200.0, ... },
         "output_dir": "C:/path/to/output",
         "revision_code": "A"
     }
+    Parameters starting with "_" are generation options, not geometry:
+        "_export_fcstd": true   also save the editable FCStd document
 
-Always writes result.json to output_dir (even on failure):
+Always writes result.json to output_dir (even on failure); the same object
+is the reply line in worker mode:
     {
         "success": true,
         "fcstd_path": "C:/path/to/output/base_plate_A.FCStd",
@@ -29,23 +43,87 @@ Always writes result.json to output_dir (even on failure):
     }
 """
 
+import functools
 import json
 import os
+import sys
+import time
 import traceback
 from pathlib import Path
 
+import numpy as np  # bundled with FreeCAD
+
+try:
+    # Optional: pip-installed into FreeCAD's Python for faster serialisation
+    import orjson
+
+    def _dumps_bytes(obj) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    def _dumps_bytes(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+# Must match _REPLY_PREFIX and _WORKER_ENV in freecad_engine.py
+_REPLY_PREFIX = "@@RESULT "
+_WORKER_ENV = "FREECAD_WORKER"
+
 
 def main():
     params_env = os.environ.get("FREECAD_PARAMS")
-    if not params_env:
-        raise RuntimeError(
-            "Env var FREECAD_PARAMS no definida. "
-            "El script debe ser invocado por FreeCADEngine."
-        )
+    if params_env:
+        payload = json.loads(Path(params_env).read_text(encoding="utf-8"))
+        _run_job(payload)
+        return
+
+    # Serve one request per stdin line until EOF; a persistent worker
+    # (as opposed to a one-shot run) warms up first
+    if os.environ.get(_WORKER_ENV) == "1":
+        _warm_up()
+    while True:
+        line = sys.stdin.readline()
+        if not line:
+            break
+        if not line.strip():
+            continue
+        try:
+            result = _run_job(json.loads(line))
+        except Exception as exc:
+            # Malformed request — reply anyway so the engine never hangs
+            result = {
+                "success": False,
+                "fcstd_path": None,
+                "step_path": None,
+                "warnings": [],
+                "error_message": f"{type(exc).__name__}: {exc}",
+            }
+        sys.stdout.write(_REPLY_PREFIX + json.dumps(result) + "\n")
+        sys.stdout.flush()
+
+
+def _warm_up():
+    """
+    Import FreeCAD/Part and run a throwaway boolean so the one-time OCCT
+    initialisation is not charged to the first real request.
+    """
+    start = time.perf_counter()
+    try:
+        import FreeCAD
+        import Part
 
-    params_path = Path(params_env)
-    payload = json.loads(params_path.read_text(encoding="utf-8"))
+        warm = Part.makeBox(1, 1, 1).cut(Part.makeCylinder(
+            0.1, 1.2, FreeCAD.Vector(0.5, 0.5, -0.1), FreeCAD.Vector(0, 0, 1)
+        ))
+        del warm
+    except Exception as exc:
+        # Not fatal: the request itself will report the real problem
+        sys.stderr.write(f"warm-up failed: {type(exc).__name__}: {exc}\n")
+        return
+    sys.stderr.write(f"warm-up done in {time.perf_counter() - start:.3f}s\n")
+    sys.stderr.flush()
 
+
+def _run_job(payload):
+    """Generate one piece and write result.json; return the result dict."""
     piece_code = payload["piece_code"]
     parameters = payload["parameters"]
     output_dir = Path(payload["output_dir"])
@@ -75,49 +153,76 @@ def main():
         )
 
     finally:
-        result_path = output_dir / "result.json"
-        result_path.write_text(
-            json.dumps(result, ensure_ascii=False, indent=2), encoding="utf-8"
-        )
+        # Machine-read file: compact bytes, no pretty-printing
+        (output_dir / "result.json").write_bytes(_dumps_bytes(result))
+
+    return result
 
 
 # ---------------------------------------------------------------------------
 # Hole pattern helpers
 # ---------------------------------------------------------------------------
 
-def _hole_positions(patron: str, largo: float, ancho: float, margen: float) -> list:
+def _axis(lo: float, hi: float, n: int):
+    """n evenly spaced coordinates from lo to hi; a single one is centred."""
+    if n == 1:
+        return np.array([(lo + hi) / 2.0])
+    return np.linspace(lo, hi, n)
+
+
+def _grid(nx: int, ny: int):
     """
-    Return (x, y) centre coordinates for holes given the pattern name.
+    Pattern generator for an nx × ny grid of holes inset by the margin.
+
+    The grid is built with meshgrid, so dense patterns cost two linspace
+    calls regardless of the number of holes.
+    """
+    def generate(L: float, W: float, e: float):
+        xx, yy = np.meshgrid(_axis(e, L - e, nx), _axis(e, W - e, ny))
+        return np.column_stack((xx.ravel(), yy.ravel()))
+    return generate
+
+
+def _no_holes(L: float, W: float, e: float):
+    return np.empty((0, 2))
+
+
+# patron_perforaciones value -> generator(L, W, e) returning (N, 2) centres
+_pattern_registry = {
+    "none":          _no_holes,
+    "rectangular_4": _grid(2, 2),   # four corners
+    "rectangular_6": _grid(3, 2),   # four corners + long-edge mid-points
+    "lineal_2":      _grid(2, 1),   # two holes on the longitudinal centre line
+}
+# "personalizado" and unknown patterns fall back to rectangular_4
+_default_pattern = _pattern_registry["rectangular_4"]
+
+
+@functools.lru_cache(maxsize=512)
+def _hole_positions(patron: str, largo: float, ancho: float, margen: float):
+    """
+    Return hole centre coordinates as an (N, 2) float64 array of (x, y) rows.
 
     Coordinate system: origin at the bottom-left corner of the plate top face.
     X = largo direction, Y = ancho direction.
+
+    Results are memoised for the life of the (persistent) worker process, so
+    the returned array is shared and marked read-only.
     """
-    e, L, W = margen, largo, ancho
-
-    if patron == "none":
-        return []
-    elif patron == "rectangular_4":
-        # Four corners
-        return [(e, e), (L - e, e), (e, W - e), (L - e, W - e)]
-    elif patron == "rectangular_6":
-        # Four corners + two mid-points on the long edges
-        return [
-            (e, e), (L - e, e),
-            (e, W - e), (L - e, W - e),
-            (L / 2, e), (L / 2, W - e),
-        ]
-    elif patron == "lineal_2":
-        # Two holes along the longitudinal axis (centre line)
-        return [(e, W / 2), (L - e, W / 2)]
-    else:
-        # "personalizado" and unknown patterns → fall back to rectangular_4
-        return [(e, e), (L - e, e), (e, W - e), (L - e, W - e)]
+    generate = _pattern_registry.get(patron, _default_pattern)
+    centers = generate(largo, ancho, margen).astype(np.float64)
+    centers.flags.writeable = False
+    return centers
 
 
 # ---------------------------------------------------------------------------
 # Base plate generator
 # ---------------------------------------------------------------------------
 
+# Drilling axis, created on first use: FreeCAD is not importable at module
+# import time, and in the persistent worker the vector lives for the process.
+_Z_AXIS = None
+
 def _generate_base_plate(FreeCAD, Part, params, output_dir, revision_code, result):
     """
     Generate a parametric base plate solid using FreeCAD Part workbench.
@@ -127,6 +232,9 @@ def _generate_base_plate(FreeCAD, Part, params, output_dir, revision_code, resul
         - Through-holes drilled perpendicular to the plate face (Z axis)
         - Optional adjustment slots on the two longitudinal edges (±Y)
 
+    Holes and slots are collected into one compound and subtracted with a
+    single cut, instead of one boolean operation per feature.
+
     All boolean subtractions use a small overcut (0.5 mm on each side) to
     avoid coincident-face artefacts common in CSG kernels.
     """
@@ -149,43 +257,46 @@ def _generate_base_plate(FreeCAD, Part, params, output_dir, revision_code, resul
     plate = Part.makeBox(largo, ancho, espesor)
 
     # ------------------------------------------------------------------
-    # 2. Holes — cylinder subtraction per pattern
+    # 2. Holes — one cylinder per centre of the pattern
     # ------------------------------------------------------------------
+    global _Z_AXIS
+    if _Z_AXIS is None:
+        _Z_AXIS = FreeCAD.Vector(0, 0, 1)
+
     hole_centers = _hole_positions(patron, largo, ancho, margen)
     radius = d_hole / 2.0
 
-    for (x, y) in hole_centers:
-        cyl = Part.makeCylinder(
+    tools = [
+        Part.makeCylinder(
             radius,
             espesor + 2 * OVERCUT,
-            FreeCAD.Vector(x, y, -OVERCUT),
-            FreeCAD.Vector(0, 0, 1),
+            FreeCAD.Vector(float(x), float(y), -OVERCUT),
+            _Z_AXIS,
         )
-        plate = plate.cut(cyl)
+        for x, y in hole_centers
+    ]
 
     # ------------------------------------------------------------------
-    # 3. Slots — box subtraction on longitudinal edges (Y = 0 and Y = W)
+    # 3. Slots — boxes on longitudinal edges (Y = 0 and Y = W)
     # ------------------------------------------------------------------
     if tiene_ranuras:
         cx = largo / 2.0 - largo_ranura / 2.0   # centred on the plate length
 
         # Slot on -Y edge (opens toward Y = 0)
-        slot_minus_y = Part.makeBox(
+        tools.append(Part.makeBox(
             largo_ranura,
             ancho_ranura,
             espesor + 2 * OVERCUT,
             FreeCAD.Vector(cx, -OVERCUT, -OVERCUT),
-        )
-        plate = plate.cut(slot_minus_y)
+        ))
 
         # Slot on +Y edge (opens toward Y = ancho)
-        slot_plus_y = Part.makeBox(
+        tools.append(Part.makeBox(
             largo_ranura,
             ancho_ranura,
             espesor + 2 * OVERCUT,
             FreeCAD.Vector(cx, ancho - ancho_ranura + OVERCUT, -OVERCUT),
-        )
-        plate = plate.cut(slot_plus_y)
+        ))
 
         # Warn if slot length is longer than 60 % of plate length
         if largo_ranura > largo * 0.6:
@@ -194,6 +305,12 @@ def _generate_base_plate(FreeCAD, Part, params, output_dir, revision_code, resul
                 "Verifique la rigidez residual."
             )
 
+    # Subtract every hole and slot in a single boolean operation; a lone
+    # tool needs no compound wrapper
+    if tools:
+        tool = tools[0] if len(tools) == 1 else Part.Compound(tools)
+        plate = plate.cut(tool)
+
     # ------------------------------------------------------------------
     # 4. Geometry validity check
     # ------------------------------------------------------------------
@@ -206,17 +323,23 @@ def _generate_base_plate(FreeCAD, Part, params, output_dir, revision_code, resul
         return
 
     # ------------------------------------------------------------------
-    # 5. Export FCStd (FreeCAD native format, editable)
+    # 5. Export FCStd (FreeCAD native format, editable) — opt-in, since
+    #    the document round-trip is the most expensive step
     # ------------------------------------------------------------------
     stem = f"base_plate_{revision_code}"
     fcstd_path = output_dir / f"{stem}.FCStd"
     step_path  = output_dir / f"{stem}.step"
 
-    doc = FreeCAD.newDocument("BasePlate")
-    obj = doc.addObject("Part::Feature", "BasePlate")
-    obj.Shape = plate
-    doc.recompute()
-    doc.saveAs(str(fcstd_path))
+    if params.get("_export_fcstd", False):
+        doc = FreeCAD.newDocument("BasePlate")
+        obj = doc.addObject("Part::Feature", "BasePlate")
+        obj.Shape = plate
+        doc.recompute()
+        doc.saveAs(str(fcstd_path))
+        # The worker process is long-lived: release the document once saved
+        FreeCAD.closeDocument(doc.Name)
+    else:
+        fcstd_path = None
 
     # ------------------------------------------------------------------
     # 6. Export STEP (universal exchange format)
@@ -227,15 +350,12 @@ def _generate_base_plate(FreeCAD, Part, params, output_dir, revision_code, resul
     # 7. Write success result
     # ------------------------------------------------------------------
     result["success"]    = True
-    result["fcstd_path"] = str(fcstd_path)
+    result["fcstd_path"] = str(fcstd_path) if fcstd_path else None
     result["step_path"]  = str(step_path)
     result["warnings"]   = warnings
 
 
 # NOTE: freecadcmd.exe sets __name__ to the module name (e.g. "freecad_generate"),
-# NOT to "__main__". The guard below is kept for completeness but the unconditional
-# call ensures execution in both contexts.
-if __name__ == "__main__":
-    main()
-else:
-    main()
+# NOT to "__main__", so an `if __name__ == "__main__"` guard would never fire.
+# The script is only ever executed, never imported: call main() exactly once.
+main()
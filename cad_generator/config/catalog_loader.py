@@ -9,31 +9,45 @@ Usage:
     loader = CatalogLoader()
     piece = loader.get_piece("base_plate")
     params = loader.get_parameters("base_plate")
-    rules  = loader.get_validation_rules("base_plate")
+    rules  = loader.get_compiled_rules("base_plate")
 """
 
 from __future__ import annotations
 
-import json
+import os
+import pickle
+import struct
 from dataclasses import dataclass, field
-from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
+from cad_generator._json import loads
 from cad_generator.config.settings import settings
+from cad_generator.core.validation_engine import (
+    CompiledRuleSet,
+    ValidationEngine,
+    ValidationResult,
+    compile_rules,
+)
+
+# Parsed-catalog cache written next to the JSON file. The header holds the
+# JSON's (mtime_ns, size) and _CACHE_VERSION; bump the version whenever a
+# dataclass below changes shape so stale pickles are ignored.
+_CACHE_VERSION = 5
+_CACHE_HEADER = struct.Struct("=QQQ")
 
 
 # ---------------------------------------------------------------------------
 # Data classes for typed access to catalog data
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ParameterOption:
     value: str
     label: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ParameterSpec:
     name: str
     display_name: str
@@ -52,7 +66,7 @@ class ParameterSpec:
     depends_on: dict = field(default_factory=dict)   # e.g. {"tiene_ranuras": True}
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ValidationRule:
     rule_id: str
     description: str
@@ -61,7 +75,7 @@ class ValidationRule:
     message: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BOMTemplateItem:
     item_number: int
     part_code: str
@@ -73,7 +87,7 @@ class BOMTemplateItem:
     observations: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PieceSpec:
     code: str
     display_name: str
@@ -85,9 +99,14 @@ class PieceSpec:
     bom_template: list[BOMTemplateItem]
     cad_script: str
     drawing_views: list[str]
+    # name -> ParameterSpec index; parameters are never mutated after parsing
+    _by_name: dict = field(default=None, init=False, compare=False, repr=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_by_name", {p.name: p for p in self.parameters})
 
     def get_parameter(self, name: str) -> Optional[ParameterSpec]:
-        return next((p for p in self.parameters if p.name == name), None)
+        return self._by_name.get(name)
 
     def get_defaults(self) -> dict:
         """Return a dict of {param_name: default_value} for all parameters."""
@@ -101,59 +120,202 @@ class PieceSpec:
 class CatalogLoader:
     """
     Loads and parses piece_catalog.json.
-    The parsed catalog is cached in memory after the first load.
+    Raw piece dicts are indexed by code on first use and each PieceSpec is
+    parsed the first time it is requested, then kept in memory.
     """
 
     def __init__(self, catalog_path: Optional[Path] = None) -> None:
         self._path = catalog_path or settings.catalog_path
         self._pieces: dict[str, PieceSpec] = {}
-        self._raw: dict = {}
+        self._raw_by_code: dict[str, dict] = {}
+        self._catalog_version = "1.0"
         self._loaded = False
+        self._cache_path = self._path.with_suffix(".cache.pkl")
+        self._cache_header = b""
+        self._assets_dir = self._path.parent.parent / "assets" / "schematics"
+        # image_rel -> resolved path (or None); assets don't change at runtime
+        self._schematic_paths: dict[str, Optional[Path]] = {}
+        # code -> CompiledRules; in memory only (code objects don't pickle)
+        self._compiled_rules: dict[str, CompiledRuleSet] = {}
+        # code -> (default values, their ValidationResult)
+        self._default_results: dict[str, tuple[dict, ValidationResult]] = {}
+        self._sorted_rows: Optional[list[tuple[str, str, str, str, str]]] = None
 
     def _ensure_loaded(self) -> None:
-        if self._loaded:
+        """
+        Index the raw piece dicts by code; PieceSpecs are parsed on demand.
+
+        Each call does one stat() of the JSON file and reloads it when its
+        mtime or size changed, so catalog edits are picked up without a
+        restart.
+        """
+        try:
+            stat = self._path.stat()
+        except OSError:
+            if self._loaded:
+                return      # file gone: keep serving what was loaded
+            raise
+        header = _CACHE_HEADER.pack(stat.st_mtime_ns, stat.st_size, _CACHE_VERSION)
+        if self._loaded and header == self._cache_header:
             return
-        raw = json.loads(self._path.read_text(encoding="utf-8"))
-        self._raw = raw
-        for piece_data in raw.get("pieces", []):
-            self._pieces[piece_data["code"]] = self._parse_piece(piece_data)
+
+        # Build the new state in locals so a failed parse (e.g. a half-written
+        # JSON file) keeps the previous catalog and is retried on next call.
+        cached = self._load_cache(header)
+        if cached is not None:
+            raw_by_code, pieces, catalog_version = cached
+        else:
+            raw = loads(self._path.read_bytes())
+            raw_by_code = {p["code"]: p for p in raw.get("pieces", [])}
+            pieces = {}
+            catalog_version = raw.get("catalog_version", "1.0")
+
+        self._cache_header = header
+        self._raw_by_code = raw_by_code
+        self._pieces = pieces
+        self._catalog_version = catalog_version
+        self._compiled_rules = {}
+        self._default_results = {}
+        self._sorted_rows = None
         self._loaded = True
 
+    def _ensure_all_parsed(self) -> None:
+        """Parse every piece (and refresh the cache) before a full scan."""
+        self._ensure_loaded()
+        if len(self._pieces) == len(self._raw_by_code):
+            return
+        for code, piece_data in self._raw_by_code.items():
+            if code not in self._pieces:
+                self._pieces[code] = self._parse_piece(piece_data)
+        self._store_cache()
+
+    def _load_cache(
+        self, header: bytes
+    ) -> Optional[tuple[dict[str, dict], dict[str, PieceSpec], str]]:
+        """Return the parsed catalog from the cache, or None if it is stale."""
+        try:
+            data = self._cache_path.read_bytes()
+            if data[:_CACHE_HEADER.size] != header:
+                return None
+            return pickle.loads(data[_CACHE_HEADER.size:])
+        except Exception:
+            # Missing, truncated or incompatible cache — just re-parse.
+            return None
+
+    def _store_cache(self) -> None:
+        """Atomically write the parsed catalog; a read-only install is fine."""
+        tmp_path = self._cache_path.with_name(
+            f"{self._cache_path.name}.{os.getpid()}.tmp"
+        )
+        try:
+            tmp_path.write_bytes(
+                self._cache_header
+                + pickle.dumps(
+                    (self._raw_by_code, self._pieces, self._catalog_version),
+                    protocol=5,
+                )
+            )
+            os.replace(tmp_path, self._cache_path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
 
-    def get_all_pieces(self) -> list[PieceSpec]:
+    @property
+    def catalog_version(self) -> str:
         self._ensure_loaded()
-        return list(self._pieces.values())
+        return self._catalog_version
+
+    def get_all_pieces(self) -> list[PieceSpec]:
+        self._ensure_all_parsed()
+        return [self._pieces[code] for code in self._raw_by_code]
 
     def get_piece(self, code: str) -> Optional[PieceSpec]:
         self._ensure_loaded()
-        return self._pieces.get(code)
+        spec = self._pieces.get(code)
+        if spec is None and code in self._raw_by_code:
+            spec = self._pieces[code] = self._parse_piece(self._raw_by_code[code])
+        return spec
 
     def get_parameters(self, code: str) -> list[ParameterSpec]:
         piece = self.get_piece(code)
         return piece.parameters if piece else []
 
     def get_validation_rules(self, code: str) -> list[dict]:
-        """Return validation rules as raw dicts (for ValidationEngine.validate())."""
+        """Return validation rules as raw dicts, exactly as in the JSON."""
         self._ensure_loaded()
-        piece_data = next(
-            (p for p in self._raw.get("pieces", []) if p["code"] == code), None
-        )
+        piece_data = self._raw_by_code.get(code)
         return piece_data.get("validation_rules", []) if piece_data else []
 
+    def get_compiled_rules(self, code: str) -> CompiledRuleSet:
+        """
+        Return the piece's rules as a CompiledRuleSet, built once per
+        catalog load, so ValidationEngine.validate() does no per-rule parsing.
+        """
+        self._ensure_loaded()
+        rules = self._compiled_rules.get(code)
+        if rules is None:
+            rules = self._compiled_rules[code] = compile_rules(
+                self.get_validation_rules(code)
+            )
+        return rules
+
+    def get_default_validation(self, code: str) -> tuple[dict, ValidationResult]:
+        """
+        Return the piece's default input values and their ValidationResult,
+        computed once per catalog load: every form opens on the defaults.
+        Each call gets its own copies, so callers may mutate them freely.
+        """
+        self._ensure_loaded()
+        entry = self._default_results.get(code)
+        if entry is None:
+            defaults = {
+                spec.name: spec.default
+                for spec in self.get_parameters(code)
+                if spec.type in ("float", "enum", "bool")
+            }
+            # Same engine settings as the parameter form that consumes it
+            result = ValidationEngine(jit=settings.validation_jit).validate(
+                defaults, self.get_compiled_rules(code)
+            )
+            entry = self._default_results[code] = (defaults, result)
+        defaults, result = entry
+        return dict(defaults), ValidationResult(result.is_valid, list(result.messages))
+
+    def iter_pieces_sorted(self) -> Iterator[tuple[str, str, str, str, str]]:
+        """
+        Yield (discipline, category, display_name, code, description) for
+        every piece, ordered by the first three fields — ready for
+        itertools.groupby. Reads the raw dicts, so no PieceSpec is parsed;
+        the sorted rows are kept until the catalog file changes.
+        """
+        self._ensure_loaded()
+        if self._sorted_rows is None:
+            self._sorted_rows = sorted(
+                (
+                    p["discipline"],
+                    p["category"],
+                    p["display_name"],
+                    p["code"],
+                    p.get("description", ""),
+                )
+                for p in self._raw_by_code.values()
+            )
+        return iter(self._sorted_rows)
+
     def get_disciplines(self) -> list[str]:
         """Return sorted list of unique disciplines in the catalog."""
-        self._ensure_loaded()
+        self._ensure_all_parsed()
         return sorted({p.discipline for p in self._pieces.values()})
 
     def get_pieces_by_discipline(self, discipline: str) -> list[PieceSpec]:
-        self._ensure_loaded()
+        self._ensure_all_parsed()
         return [p for p in self._pieces.values() if p.discipline == discipline]
 
     def get_pieces_by_category(self, discipline: str, category: str) -> list[PieceSpec]:
-        self._ensure_loaded()
+        self._ensure_all_parsed()
         return [
             p for p in self._pieces.values()
             if p.discipline == discipline and p.category == category
@@ -163,9 +325,13 @@ class CatalogLoader:
         """Resolve a schematic image relative path to an absolute asset path."""
         if not image_rel:
             return None
-        assets_dir = self._path.parent.parent / "assets" / "schematics"
-        full_path = assets_dir / image_rel
-        return full_path if full_path.exists() else None
+        try:
+            return self._schematic_paths[image_rel]
+        except KeyError:
+            full_path = self._assets_dir / image_rel
+            resolved = full_path if full_path.exists() else None
+            self._schematic_paths[image_rel] = resolved
+            return resolved
 
     # ------------------------------------------------------------------
     # Parsing helpers
@@ -42,6 +42,12 @@ class Settings(BaseSettings):
     freecad_bin: Path = Path(r"C:/Program Files/FreeCAD 1.0/bin/freecadcmd.exe")
     freecad_script: Optional[Path] = None   # resolved in model_post_init
     freecad_timeout_seconds: int = 60
+    freecad_persistent_worker: bool = True  # False = one freecadcmd per call
+    freecad_pool_size: int = 1              # >1 runs batch generations in parallel
+    export_fcstd: bool = False              # also save the editable .FCStd (slower)
+
+    # --- Validation ---
+    validation_jit: bool = False            # numba-compile rules (needs numba)
 
     # --- Output directories ---
     outputs_dir: Optional[Path] = None      # resolved in model_post_init
@@ -82,7 +88,8 @@ class Settings(BaseSettings):
             )
 
         # Ensure output directory exists at settings load time
-        self.outputs_dir.mkdir(parents=True, exist_ok=True)
+        if not self.outputs_dir.is_dir():
+            self.outputs_dir.mkdir(parents=True, exist_ok=True)
 
 
 # Module-level singleton. Import this object; never instantiate Settings directly.
@@ -14,12 +14,14 @@ This enforces the layered architecture and keeps GUI tests simple.
 
 from __future__ import annotations
 
-import json
 import re
+import threading
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
+from sqlalchemy import select
+
 from cad_generator.config.settings import settings
 from cad_generator.data.database import get_session
 from cad_generator.data.models import Design, PieceType, Revision
@@ -30,56 +32,100 @@ from cad_generator.data.repositories import (
     RevisionRepository,
 )
 
+# Characters not allowed in output directory names
+_SAFE_NAME_RE = re.compile(r"[^\w\-]")
+
 
-@dataclass
+@dataclass(slots=True)
 class GenerationRequest:
     design_id: int
     parameters: dict
     description: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class GenerationResponse:
     success: bool
     revision_id: Optional[int] = None
     revision_code: Optional[str] = None
     output_dir: Optional[Path] = None
+    fcstd_path: Optional[Path] = None
+    step_path: Optional[Path] = None
     errors: list[str] = field(default_factory=list)
     warnings: list[str] = field(default_factory=list)
     elapsed_seconds: float = 0.0
 
 
+@dataclass(slots=True)
+class _PreparedJob:
+    """A validated request with its revision row, ready for the CAD engine."""
+    revision_id: int
+    revision_code: str
+    piece_code: str
+    parameters: dict
+    output_dir: Path
+    warnings: list[str]
+
+
 class PieceController:
     """
     Facade for all piece-related operations.
     Instantiate once and reuse; it is stateless between calls.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, prewarm: bool = False) -> None:
+        """
+        Args:
+            prewarm: Start the FreeCAD worker in the background right away
+                and respawn it whenever it is found dead, so generations
+                never wait for freecadcmd.exe to boot. Used by the GUI.
+        """
         self._engine = None
+        self._prewarm = prewarm
+        if prewarm:
+            self._engine = self._create_engine()
+            self._start_engine_async()
 
     @property
     def engine(self):
         if self._engine is None:
-            from cad_generator.cad.freecad_engine import FreeCADEngine
-            self._engine = FreeCADEngine()
+            self._engine = self._create_engine()
+        elif (
+            self._prewarm
+            and settings.freecad_persistent_worker   # one-shot: nothing stays up
+            and not self._engine.is_running()
+            and self._engine.is_available()
+        ):
+            # Health check: the worker crashed or the watchdog killed it
+            self._start_engine_async()
         return self._engine
 
+    @staticmethod
+    def _create_engine():
+        from cad_generator.cad.freecad_engine import (
+            FreeCADEngine,
+            FreeCADEnginePool,
+        )
+        if settings.freecad_pool_size > 1:
+            return FreeCADEnginePool(settings.freecad_pool_size)
+        return FreeCADEngine()
+
+    def _start_engine_async(self) -> None:
+        threading.Thread(
+            target=self._engine.ensure_started,
+            name="freecad-prewarm",
+            daemon=True,
+        ).start()
+
     def get_all_piece_types(self) -> list:
-        with get_session() as session:
-            repo = PieceTypeRepository(session)
-            results = repo.get_all_active()
-            for pt in results:
-                session.expunge(pt)
-            return results
+        with get_session(readonly=True) as session:
+            # Cached piece types are already detached: no expunge needed
+            return PieceTypeRepository(session).get_all_active()
 
     def get_piece_type_by_code(self, code: str):
-        with get_session() as session:
-            repo = PieceTypeRepository(session)
-            pt = repo.get_by_code(code)
-            if pt:
-                session.expunge(pt)
-            return pt
+        with get_session(readonly=True) as session:
+            # Detached either way: cached, or released when the session closes
+            return PieceTypeRepository(session).get_by_code(code)
 
     def create_design(
         self,
@@ -105,14 +151,68 @@ class PieceController:
             return design
 
     def get_all_designs(self) -> list[Design]:
-        with get_session() as session:
+        with get_session(readonly=True) as session:
             repo = DesignRepository(session)
             designs = repo.get_all()
             for d in designs:
                 session.expunge(d)
             return designs
 
-    def generate(self, request: GenerationRequest) -> GenerationResponse:
+    # ------------------------------------------------------------------
+    # Lightweight read-only listings (plain dicts, no ORM hydration)
+    # ------------------------------------------------------------------
+
+    def list_piece_types_lite(self) -> list[dict]:
+        """Active piece types as dicts, for list views that only read fields."""
+        stmt = (
+            select(
+                PieceType.id,
+                PieceType.code,
+                PieceType.display_name,
+                PieceType.discipline,
+                PieceType.category,
+            )
+            .where(PieceType.is_active == 1)
+            .order_by(PieceType.discipline, PieceType.category, PieceType.display_name)
+        )
+        with get_session(readonly=True) as session:
+            return [dict(row) for row in session.execute(stmt).mappings()]
+
+    def list_designs_lite(self) -> list[dict]:
+        """All designs as dicts (most recently updated first), for list views."""
+        stmt = (
+            select(
+                Design.id,
+                Design.name,
+                Design.drawing_number,
+                Design.piece_type_id,
+                Design.updated_at,
+            )
+            .order_by(Design.updated_at.desc())
+        )
+        with get_session(readonly=True) as session:
+            return [dict(row) for row in session.execute(stmt).mappings()]
+
+    def list_revisions_lite(self, design_id: int) -> list[dict]:
+        """A design's revisions as dicts (oldest first), for the history table."""
+        stmt = (
+            select(
+                Revision.id,
+                Revision.revision_code,
+                Revision.generated_at,
+                Revision.generated_by,
+                Revision.eco_status,
+                Revision.step_path,
+            )
+            .where(Revision.design_id == design_id)
+            .order_by(Revision.revision_seq)
+        )
+        with get_session(readonly=True) as session:
+            return [dict(row) for row in session.execute(stmt).mappings()]
+
+    def generate(
+        self, request: GenerationRequest, *, defer_commit: bool = False
+    ) -> GenerationResponse:
         """
         Full generation pipeline:
         1. Resolve design → piece_type → piece_code
@@ -121,34 +221,99 @@ class PieceController:
         4. Run CAD engine subprocess
         5. Update revision with output file paths
         6. Return GenerationResponse
+
+        By default the revision is committed before the CAD run, so a crash
+        mid-run still leaves it recorded. defer_commit=True keeps one
+        session open across the run and commits revision and output paths
+        together — one transaction instead of two, meant for short runs,
+        since the SQLite write lock is held meanwhile.
+        """
+        if not defer_commit:
+            job = self._prepare(request)
+            if isinstance(job, GenerationResponse):
+                return job
+            return self._finalize(job, self._run_cad(job))
+
+        with get_session() as session:
+            job = self._prepare_in(request, session)
+            if isinstance(job, GenerationResponse):
+                return job
+            return self._finalize(job, self._run_cad(job), session)
+
+    def _run_cad(self, job: _PreparedJob):
+        return self.engine.generate(
+            piece_code=job.piece_code,
+            parameters=job.parameters,
+            output_dir=job.output_dir,
+            revision_code=job.revision_code,
+        )
+
+    def generate_batch(
+        self, requests: list[GenerationRequest]
+    ) -> list[GenerationResponse]:
         """
+        Run the generation pipeline for several requests.
+
+        Validation and revision bookkeeping happen per request, as in
+        generate(); the CAD runs of all valid requests are handed to the
+        engine in one generate_many() call so a pooled engine can work on
+        them in parallel. Responses are returned in request order.
+        """
+        prepared = [self._prepare(request) for request in requests]
+        jobs = [p for p in prepared if isinstance(p, _PreparedJob)]
+
+        cad_results = iter(self.engine.generate_many([
+            (job.piece_code, job.parameters, job.output_dir, job.revision_code)
+            for job in jobs
+        ]))
+        return [
+            p if isinstance(p, GenerationResponse)
+            else self._finalize(p, next(cad_results))
+            for p in prepared
+        ]
+
+    def _prepare(self, request: GenerationRequest) -> _PreparedJob | GenerationResponse:
+        """Steps 1-4 in their own transaction, committed before the CAD run."""
+        with get_session() as session:
+            job = self._prepare_in(request, session)
+            if isinstance(job, _PreparedJob):
+                session.commit()
+            return job
+
+    def _prepare_in(
+        self, request: GenerationRequest, session
+    ) -> _PreparedJob | GenerationResponse:
+        """Steps 1-4 of the pipeline: everything before the CAD run (flush only)."""
         from cad_generator.config.catalog_loader import catalog
         from cad_generator.core.validation_engine import ValidationEngine
 
         # ------------------------------------------------------------------
-        # Step 1 — resolve design and piece type
+        # Step 1 — resolve design and piece type in one query. The outer
+        # join tells a missing design apart from a missing piece type.
         # ------------------------------------------------------------------
-        with get_session() as session:
-            design = DesignRepository(session).get_by_id(request.design_id)
-            if design is None:
-                return GenerationResponse(
-                    success=False, errors=["Diseño no encontrado."]
-                )
-            piece_type = session.get(PieceType, design.piece_type_id)
-            if piece_type is None:
-                return GenerationResponse(
-                    success=False, errors=["Tipo de pieza no encontrado."]
-                )
-            piece_code  = piece_type.code
-            design_name = design.name
-            session.expunge(design)
-            session.expunge(piece_type)
+        row = session.execute(
+            select(Design.name, PieceType.code)
+            .outerjoin(PieceType, Design.piece_type_id == PieceType.id)
+            .where(Design.id == request.design_id)
+        ).first()
+        if row is None:
+            return GenerationResponse(
+                success=False, errors=["Diseño no encontrado."]
+            )
+        design_name, piece_code = row
+        if piece_code is None:
+            return GenerationResponse(
+                success=False, errors=["Tipo de pieza no encontrado."]
+            )
 
         # ------------------------------------------------------------------
-        # Step 2 — validate parameters (no side-effects)
+        # Step 2 — validate parameters (no side-effects). The form already
+        # shows every issue live, so stop at the first error here.
         # ------------------------------------------------------------------
-        rules      = catalog.get_validation_rules(piece_code)
-        validation = ValidationEngine().validate(request.parameters, rules)
+        rules      = catalog.get_compiled_rules(piece_code)
+        validation = ValidationEngine(jit=settings.validation_jit).validate(
+            request.parameters, rules, fail_fast=True
+        )
 
         if not validation.is_valid:
             return GenerationResponse(
@@ -162,78 +327,96 @@ class PieceController:
         # ------------------------------------------------------------------
         # Step 3 — create revision record (code is assigned here: A, B, …)
         # ------------------------------------------------------------------
-        with get_session() as session:
-            rev_repo = RevisionRepository(session)
-            rev = rev_repo.create(
-                design_id=request.design_id,
-                parameters=request.parameters,
-                description=request.description,
-            )
-            rev.validation_passed = 1
-            rev.validation_warnings_json = (
-                json.dumps(warning_msgs) if warning_msgs else None
-            )
-            session.commit()
-            revision_id   = rev.id
-            revision_code = rev.revision_code
-            session.expunge(rev)
+        rev_repo = RevisionRepository(session)
+        rev = rev_repo.create(
+            design_id=request.design_id,
+            parameters=request.parameters,
+            description=request.description,
+            validation_passed=True,
+            validation_warnings=warning_msgs or None,
+        )
+        revision_id   = rev.id
+        revision_code = rev.revision_code
 
         # ------------------------------------------------------------------
-        # Step 4 — build output directory and run CAD engine
+        # Step 4 — build output directory (the CAD run is the caller's)
         # ------------------------------------------------------------------
-        safe_name  = re.sub(r"[^\w\-]", "_", design_name)
+        safe_name  = _SAFE_NAME_RE.sub("_", design_name)
         output_dir = settings.outputs_dir / piece_code / safe_name / revision_code
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        cad_result = self.engine.generate(
+        return _PreparedJob(
+            revision_id=revision_id,
+            revision_code=revision_code,
             piece_code=piece_code,
             parameters=request.parameters,
             output_dir=output_dir,
-            revision_code=revision_code,
+            warnings=warning_msgs,
         )
 
+    def _finalize(
+        self, job: _PreparedJob, cad_result, session=None
+    ) -> GenerationResponse:
+        """
+        Steps 5-6 of the pipeline: persist outputs and build the response.
+        With the session of a deferred-commit run, the revision is committed
+        here together with its output paths (also when the CAD run failed).
+        """
         # ------------------------------------------------------------------
-        # Step 5 — persist output paths (even on partial success)
+        # Step 5 — persist output paths (nothing to write on failure)
         # ------------------------------------------------------------------
-        with get_session() as session:
-            rev_repo = RevisionRepository(session)
+        if session is not None:
             if cad_result.success:
-                rev_repo.update_output_paths(
-                    revision_id,
-                    {
-                        "fcstd": str(cad_result.fcstd_path) if cad_result.fcstd_path else None,
-                        "step":  str(cad_result.step_path)  if cad_result.step_path  else None,
-                    },
-                )
+                self._store_output_paths(session, job, cad_result)
             session.commit()
+        elif cad_result.success:
+            with get_session() as session:
+                self._store_output_paths(session, job, cad_result)
+                session.commit()
 
         # ------------------------------------------------------------------
         # Step 6 — return result
         # ------------------------------------------------------------------
-        all_warnings = warning_msgs + cad_result.warnings
+        all_warnings = [*job.warnings, *cad_result.warnings]
 
         if cad_result.success:
             return GenerationResponse(
                 success=True,
-                revision_id=revision_id,
-                revision_code=revision_code,
-                output_dir=output_dir,
+                revision_id=job.revision_id,
+                revision_code=job.revision_code,
+                output_dir=job.output_dir,
+                fcstd_path=cad_result.fcstd_path,
+                step_path=cad_result.step_path,
                 warnings=all_warnings,
                 elapsed_seconds=cad_result.elapsed_seconds,
             )
         else:
             return GenerationResponse(
                 success=False,
-                revision_id=revision_id,
-                revision_code=revision_code,
-                output_dir=output_dir,
+                revision_id=job.revision_id,
+                revision_code=job.revision_code,
+                output_dir=job.output_dir,
                 errors=[cad_result.error_message or "Error desconocido en el motor CAD."],
                 warnings=all_warnings,
                 elapsed_seconds=cad_result.elapsed_seconds,
             )
 
+    @staticmethod
+    def _store_output_paths(session, job: _PreparedJob, cad_result) -> None:
+        RevisionRepository(session).update_output_paths(
+            job.revision_id,
+            {
+                "fcstd": str(cad_result.fcstd_path) if cad_result.fcstd_path else None,
+                "step":  str(cad_result.step_path)  if cad_result.step_path  else None,
+            },
+        )
+
     def get_revisions_for_design(self, design_id: int) -> list[Revision]:
-        with get_session() as session:
+        """
+        Detached revisions for listing. Deferred payload columns (parameters,
+        validation warnings, description, eco_reason) are not loaded.
+        """
+        with get_session(readonly=True) as session:
             repo = RevisionRepository(session)
             revisions = repo.get_by_design(design_id)
             for rev in revisions:
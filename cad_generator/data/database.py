@@ -11,34 +11,91 @@ Usage:
 """
 
 from contextlib import contextmanager
+from datetime import datetime, timezone
 from typing import Generator
 
-from sqlalchemy import create_engine, event
+from sqlalchemy import create_engine, event, insert, inspect
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import QueuePool
 
+from cad_generator._json import dumps, loads
 from cad_generator.config.settings import settings
 from cad_generator.data.models import Base
 
 # Module-level engine singleton.
 # check_same_thread=False required for SQLite when sessions are created
 # in background threads (e.g., during CAD generation subprocess management).
+# A small explicit QueuePool keeps connections (and their PRAGMA setup)
+# alive between sessions. StaticPool is avoided on purpose: the GUI thread
+# and the generation worker would share one connection — and its open
+# transaction — concurrently.
 _engine = create_engine(
     f"sqlite:///{settings.db_path}",
     connect_args={"check_same_thread": False},
+    poolclass=QueuePool,
+    pool_size=4,
+    max_overflow=8,
+    insertmanyvalues_page_size=1000,   # bulk INSERTs (BOM items) per statement
+    query_cache_size=1200,             # compiled-SQL cache entries (default 500)
+    json_serializer=dumps,
+    json_deserializer=loads,
     echo=settings.db_echo,
 )
 
 
 @event.listens_for(_engine, "connect")
 def _configure_sqlite(dbapi_connection, connection_record):
-    """Enable WAL mode and enforce foreign key constraints on every connection."""
+    """
+    Configure each new pooled connection.
+
+    journal_mode=WAL is persistent in the database file (re-issuing it is a
+    no-op); the remaining PRAGMAs are per-connection. synchronous=NORMAL is
+    safe under WAL: a power loss can drop the last commits but never
+    corrupts the database.
+    """
+    # Let SQLAlchemy, not the sqlite3 module, delimit transactions (see
+    # _begin_transaction below)
+    dbapi_connection.isolation_level = None
     cursor = dbapi_connection.cursor()
     cursor.execute("PRAGMA journal_mode=WAL")
     cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")   # 256 MiB
+    cursor.execute("PRAGMA cache_size=-64000")     # ~64 MB page cache
     cursor.close()
 
 
+@event.listens_for(_engine, "begin")
+def _begin_transaction(conn) -> None:
+    """
+    Open a real SQLite transaction when SQLAlchemy begins one.
+
+    The sqlite3 module only emits BEGIN before INSERT/UPDATE/DELETE, so
+    every SELECT of a read-only session ran as its own implicit
+    transaction. With an explicit BEGIN, all reads of a session (e.g.
+    everything a UI refresh loads) share one transaction and one WAL
+    snapshot.
+
+    Read-only sessions (get_session(readonly=True)) use a DEFERRED BEGIN,
+    so they never take the write lock and never block the generation
+    worker's writes. Every other transaction uses BEGIN IMMEDIATE: a
+    deferred transaction that reads and then writes fails with
+    SQLITE_BUSY_SNAPSHOT (no busy-timeout retry) when another connection
+    committed in between; taking the write lock up front makes it wait
+    for the lock instead.
+    """
+    if conn.get_execution_options().get("sqlite_readonly"):
+        conn.exec_driver_sql("BEGIN")
+    else:
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+
+
+# Same engine and pool; only changes the BEGIN emitted above
+_readonly_engine = _engine.execution_options(sqlite_readonly=True)
+
 _SessionFactory = sessionmaker(bind=_engine, expire_on_commit=False)
+_ReadOnlySessionFactory = sessionmaker(bind=_readonly_engine, expire_on_commit=False)
 
 
 def init_db() -> None:
@@ -47,13 +104,98 @@ def init_db() -> None:
     Safe to call multiple times (idempotent).
     """
     Base.metadata.create_all(_engine)
+    _add_revision_seq_column()
+    _create_missing_indexes()
+    _normalize_legacy_timestamps()
     _seed_piece_types()
 
 
+def _add_revision_seq_column() -> None:
+    """
+    Databases created before revisions.revision_seq existed get the column
+    added and back-filled from revision_code, before its unique index is
+    created. (SQLite cannot add a NOT NULL column without a default; new
+    rows always supply it.)
+    """
+    from cad_generator.data.models import _revision_seq
+
+    with _engine.begin() as conn:
+        columns = {c["name"] for c in inspect(conn).get_columns("revisions")}
+        if "revision_seq" in columns:
+            return
+        conn.exec_driver_sql("ALTER TABLE revisions ADD COLUMN revision_seq INTEGER")
+        rows = conn.exec_driver_sql("SELECT id, revision_code FROM revisions").all()
+        if rows:
+            conn.exec_driver_sql(
+                "UPDATE revisions SET revision_seq = ? WHERE id = ?",
+                [(_revision_seq(code), rev_id) for rev_id, code in rows],
+            )
+
+
+# Indexes dropped from the models because a newer index covers them
+_SUPERSEDED_INDEXES = (
+    "idx_revisions_design_id",
+    "idx_designs_piece_type_id",
+    "idx_revisions_design_id_desc",     # by uq_revisions_design_seq
+    "idx_revisions_design_generated",   # by uq_revisions_design_seq
+)
+
+
+def _create_missing_indexes() -> None:
+    """
+    create_all() skips tables that already exist, so indexes added to the
+    models after a database was created are emitted here (IF NOT EXISTS),
+    and superseded ones are dropped.
+    """
+    with _engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(conn, checkfirst=True)
+        for name in _SUPERSEDED_INDEXES:
+            conn.exec_driver_sql(f"DROP INDEX IF EXISTS {name}")
+
+
+# Timestamp columns that used to hold isoformat() strings ("...T...+00:00")
+_TIMESTAMP_COLUMNS = {
+    "piece_types": ("created_at", "updated_at"),
+    "designs": ("created_at", "updated_at"),
+    "revisions": ("generated_at",),
+}
+
+
+# PRAGMA user_version from which _normalize_legacy_timestamps() has run
+_TIMESTAMPS_NORMALIZED_VERSION = 1
+
+
+def _normalize_legacy_timestamps() -> None:
+    """
+    Rewrite ISO-8601 strings written by older versions into the DateTime
+    storage format, so old and new rows sort together. Microseconds are
+    kept when present; otherwise SQLite's strftime() converts to UTC.
+    Runs once per database: PRAGMA user_version records that it did, so
+    later startups skip the full-table scans.
+    """
+    with _engine.begin() as conn:
+        version = conn.exec_driver_sql("PRAGMA user_version").scalar()
+        if version >= _TIMESTAMPS_NORMALIZED_VERSION:
+            return
+        for table, columns in _TIMESTAMP_COLUMNS.items():
+            for col in columns:
+                conn.exec_driver_sql(
+                    f"UPDATE {table} SET {col} = CASE "
+                    f"WHEN substr({col}, 20, 1) = '.' "
+                    f"THEN replace(substr({col}, 1, 26), 'T', ' ') "
+                    f"ELSE strftime('%Y-%m-%d %H:%M:%f', {col}) END "
+                    f"WHERE {col} LIKE '____-__-__T%'"
+                )
+        conn.exec_driver_sql(
+            f"PRAGMA user_version = {_TIMESTAMPS_NORMALIZED_VERSION}"
+        )
+
+
 def _seed_piece_types() -> None:
     """Populate piece_types table from piece_catalog.json if the table is empty."""
-    import json
-
+    from cad_generator.config.catalog_loader import catalog
     from cad_generator.data.models import PieceType
 
     with get_session() as session:
@@ -65,33 +207,45 @@ def _seed_piece_types() -> None:
         if not catalog_path.exists():
             return  # catalog not yet created; skip silently
 
-        data = json.loads(catalog_path.read_text(encoding="utf-8"))
-        for piece_data in data.get("pieces", []):
-            pt = PieceType(
-                code=piece_data["code"],
-                display_name=piece_data["display_name"],
-                discipline=piece_data["discipline"],
-                category=piece_data["category"],
-                description=piece_data.get("description", ""),
-                catalog_version=data.get("catalog_version", "1.0"),
-            )
-            session.add(pt)
+        # Reuse the shared (cached) catalog instead of re-parsing the file.
+        # One executemany INSERT; timestamps are set explicitly so every
+        # seeded row carries the same value.
+        now = datetime.now(timezone.utc)
+        version = catalog.catalog_version
+        rows = [
+            {
+                "code": piece.code,
+                "display_name": piece.display_name,
+                "discipline": piece.discipline,
+                "category": piece.category,
+                "description": piece.description,
+                "catalog_version": version,
+                "is_active": 1,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for piece in catalog.get_all_pieces()
+        ]
+        if rows:
+            session.execute(insert(PieceType), rows)
         session.commit()
 
 
 @contextmanager
-def get_session() -> Generator[Session, None, None]:
+def get_session(readonly: bool = False) -> Generator[Session, None, None]:
     """
     Context manager providing a transactional database session.
 
     Automatically rolls back on exception and always closes the session.
+    Pass readonly=True for sessions that never write: their transaction
+    does not take the SQLite write lock (see _begin_transaction).
 
     Usage:
         with get_session() as session:
             session.add(obj)
             session.commit()
     """
-    session = _SessionFactory()
+    session = (_ReadOnlySessionFactory if readonly else _SessionFactory)()
     try:
         yield session
     except Exception:
@@ -2,21 +2,29 @@
 SQLAlchemy ORM models for py-param-cad.
 
 Uses SQLAlchemy 2.0 declarative style with Mapped[] type annotations.
-All timestamps are stored as UTC strings in ISO-8601 format.
-Parameters are serialized to JSON text columns.
+All timestamps are UTC datetimes in DateTime columns (SQLite stores them as
+sortable 'YYYY-MM-DD HH:MM:SS.ffffff' text and returns naive values).
+Parameters and validation warnings use JSON columns (SQLite JSON1, JSONB on
+PostgreSQL): the driver serializes them once per load/flush and
+json_extract() can query them.
 
 Relationships:
     piece_types (1) ──< designs (1) ──< revisions (1) ──< bom_items
+
+All relationships are lazy="raise": touching one that was not eager-loaded
+raises instead of silently issuing one query per object (N+1). Load them
+explicitly, e.g. DesignRepository.get_with_revisions().
 """
 
 from __future__ import annotations
 
-import json
 from datetime import datetime, timezone
 from typing import Optional
 
 from sqlalchemy import (
     CheckConstraint,
+    DateTime,
+    JSON,
     ForeignKey,
     Index,
     Integer,
@@ -24,12 +32,35 @@ from sqlalchemy import (
     Text,
     UniqueConstraint,
 )
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
+from cad_generator._json import dumps, loads
+
+
+def _utcnow() -> datetime:
+    """Return the current UTC time as an aware datetime."""
+    return datetime.now(timezone.utc)
+
+
+def _revision_seq(code: str) -> int:
+    """1-based revision number of an alphabetic code: 'A' -> 1, 'AA' -> 27."""
+    n = 0
+    for c in code.upper():
+        n = n * 26 + (ord(c) - 64)
+    return n
+
+
+def _seq_from_code(context) -> int:
+    """Column default for Revision.revision_seq."""
+    return _revision_seq(context.get_current_parameters()["revision_code"])
 
-def _utcnow_str() -> str:
-    """Return current UTC time as ISO-8601 string."""
-    return datetime.now(timezone.utc).isoformat()
+
+# JSON text on SQLite (JSON1); binary JSONB if the database is PostgreSQL,
+# which stores the document pre-parsed and can index its keys (GIN).
+# Either way the engine's json_serializer (orjson) encodes it once.
+_JSONDocument = JSON().with_variant(JSONB(), "postgresql")
 
 
 class Base(DeclarativeBase):
@@ -53,10 +84,16 @@ class PieceType(Base):
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     catalog_version: Mapped[str] = mapped_column(String(16), nullable=False, default="1.0")
     is_active: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
-    created_at: Mapped[str] = mapped_column(String(32), nullable=False, default=_utcnow_str)
-    updated_at: Mapped[str] = mapped_column(String(32), nullable=False, default=_utcnow_str)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, default=_utcnow
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, default=_utcnow, onupdate=_utcnow
+    )
 
-    designs: Mapped[list[Design]] = relationship("Design", back_populates="piece_type")
+    designs: Mapped[list[Design]] = relationship(
+        "Design", back_populates="piece_type", lazy="raise"
+    )
 
     def __repr__(self) -> str:
         return f"<PieceType code={self.code!r} name={self.display_name!r}>"
@@ -79,17 +116,27 @@ class Design(Base):
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     drawing_number: Mapped[Optional[str]] = mapped_column(String(32), nullable=True)
-    created_at: Mapped[str] = mapped_column(String(32), nullable=False, default=_utcnow_str)
-    updated_at: Mapped[str] = mapped_column(String(32), nullable=False, default=_utcnow_str)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, default=_utcnow
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, default=_utcnow, onupdate=_utcnow
+    )
 
-    piece_type: Mapped[PieceType] = relationship("PieceType", back_populates="designs")
+    piece_type: Mapped[PieceType] = relationship(
+        "PieceType", back_populates="designs", lazy="raise"
+    )
     revisions: Mapped[list[Revision]] = relationship(
-        "Revision", back_populates="design", order_by="Revision.generated_at"
+        "Revision", back_populates="design", order_by="Revision.revision_seq",
+        lazy="raise",
     )
 
     @property
     def latest_revision(self) -> Optional[Revision]:
-        """Returns the most recently generated revision, or None."""
+        """
+        Returns the highest revision (by revision_seq), or None.
+        Requires revisions to be eager-loaded (see get_with_revisions()).
+        """
         return self.revisions[-1] if self.revisions else None
 
     def __repr__(self) -> str:
@@ -114,10 +161,24 @@ class Revision(Base):
     design_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("designs.id"), nullable=False
     )
+    # 1-based position of the revision within its design; revision_code is
+    # its spreadsheet-column spelling (1 -> "A", 27 -> "AA"). Both are
+    # assigned inside the INSERT (see RevisionRepository.create); rows added
+    # directly through the ORM derive the number from their code.
+    revision_seq: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=_seq_from_code
+    )
     revision_code: Mapped[str] = mapped_column(String(8), nullable=False)
-    parameters_json: Mapped[str] = mapped_column(Text, nullable=False)
-    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    generated_at: Mapped[str] = mapped_column(String(32), nullable=False, default=_utcnow_str)
+    # Attribute "parameters", stored in the historical "parameters_json" column.
+    # The JSON/Text payload columns are deferred: listings and revision-code
+    # lookups never pay for them; they load on first access (or undefer()).
+    parameters: Mapped[dict] = mapped_column(
+        "parameters_json", _JSONDocument, nullable=False, deferred=True
+    )
+    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True, deferred=True)
+    generated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, default=_utcnow
+    )
     generated_by: Mapped[str] = mapped_column(String(64), nullable=False, default="Fede")
     # Output file paths (relative to outputs/ dir)
     fcstd_path: Mapped[Optional[str]] = mapped_column(String(512), nullable=True)
@@ -128,33 +189,53 @@ class Revision(Base):
     bom_pdf_path: Mapped[Optional[str]] = mapped_column(String(512), nullable=True)
     # ECO fields
     eco_number: Mapped[Optional[str]] = mapped_column(String(32), nullable=True)
-    eco_reason: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    eco_reason: Mapped[Optional[str]] = mapped_column(Text, nullable=True, deferred=True)
     eco_status: Mapped[str] = mapped_column(String(16), nullable=False, default="draft")
     # Validation snapshot
     validation_passed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
-    validation_warnings_json: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    _validation_warnings: Mapped[Optional[list]] = mapped_column(
+        "validation_warnings_json", _JSONDocument, nullable=True, deferred=True
+    )
 
-    design: Mapped[Design] = relationship("Design", back_populates="revisions")
+    design: Mapped[Design] = relationship(
+        "Design", back_populates="revisions", lazy="raise"
+    )
     bom_items: Mapped[list[BOMItem]] = relationship(
-        "BOMItem", back_populates="revision", order_by="BOMItem.item_number"
+        "BOMItem", back_populates="revision", order_by="BOMItem.item_number",
+        lazy="raise",
     )
 
     @property
-    def parameters(self) -> dict:
-        """Deserialize parameters JSON to dict."""
-        return json.loads(self.parameters_json)
+    def parameters_json(self) -> str:
+        """Parameters as JSON text, as stored in the parameters_json column."""
+        return dumps(self.parameters)
 
-    @parameters.setter
-    def parameters(self, value: dict) -> None:
-        """Serialize parameters dict to JSON."""
-        self.parameters_json = json.dumps(value, ensure_ascii=False)
+    @parameters_json.setter
+    def parameters_json(self, value: str) -> None:
+        self.parameters = loads(value)
 
-    @property
+    @hybrid_property
     def validation_warnings(self) -> list[str]:
-        """Deserialize warnings JSON to list."""
-        if not self.validation_warnings_json:
-            return []
-        return json.loads(self.validation_warnings_json)
+        """Validation warnings; [] when none were stored (NULL column)."""
+        return self._validation_warnings or []
+
+    @validation_warnings.inplace.setter
+    def _validation_warnings_setter(self, value: Optional[list[str]]) -> None:
+        self._validation_warnings = value or None
+
+    @validation_warnings.inplace.expression
+    @classmethod
+    def _validation_warnings_expression(cls):
+        return cls._validation_warnings
+
+    @property
+    def validation_warnings_json(self) -> Optional[str]:
+        """Warnings as JSON text, or None, as stored in validation_warnings_json."""
+        return dumps(self._validation_warnings) if self._validation_warnings else None
+
+    @validation_warnings_json.setter
+    def validation_warnings_json(self, value: Optional[str]) -> None:
+        self._validation_warnings = loads(value) if value else None
 
     def __repr__(self) -> str:
         return (
@@ -187,7 +268,9 @@ class BOMItem(Base):
     unit_weight_kg: Mapped[Optional[float]] = mapped_column(nullable=True)
     observations: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
-    revision: Mapped[Revision] = relationship("Revision", back_populates="bom_items")
+    revision: Mapped[Revision] = relationship(
+        "Revision", back_populates="bom_items", lazy="raise"
+    )
 
     @property
     def total_weight_kg(self) -> Optional[float]:
@@ -203,7 +286,14 @@ class BOMItem(Base):
 
 
 # Explicit index definitions (SQLAlchemy emits CREATE INDEX on create_all)
-Index("idx_revisions_design_id", Revision.design_id)
+# revision_seq orders a design's revisions everywhere: next-revision lookups
+# are a MAX() seek here, the latest revision a backward first-row read, and
+# listings an ordered range scan. Unique, so two concurrent creates for the
+# same design cannot both get the same number.
+Index("uq_revisions_design_seq", Revision.design_id, Revision.revision_seq, unique=True)
+Index("idx_revisions_generated_at", Revision.generated_at)
 Index("idx_revisions_eco_status", Revision.eco_status)
 Index("idx_bom_items_revision_id", BOMItem.revision_id)
-Index("idx_designs_piece_type_id", Design.piece_type_id)
+# "Recent designs" listings (overall and per piece type) read these in order
+Index("idx_designs_updated_at", Design.updated_at.desc())
+Index("idx_designs_piece_type_updated", Design.piece_type_id, Design.updated_at.desc())
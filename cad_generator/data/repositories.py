@@ -13,46 +13,247 @@ Example:
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from dataclasses import dataclass
 from typing import Optional
-
-from sqlalchemy.orm import Session
-
-from cad_generator.data.models import BOMItem, Design, PieceType, Revision
+from weakref import WeakKeyDictionary
+
+from sqlalchemy import (
+    String,
+    Text,
+    bindparam,
+    case,
+    event,
+    func,
+    insert,
+    literal,
+    select,
+    update,
+)
+from sqlalchemy.orm import Session, make_transient_to_detached, selectinload, undefer
+from sqlalchemy.orm.util import identity_key
+
+from cad_generator.data.models import (
+    BOMItem,
+    Design,
+    PieceType,
+    Revision,
+    _revision_seq,
+    _utcnow,
+)
+
+
+# ---------------------------------------------------------------------------
+# Hot-path SELECTs, built once at import with bindparam() placeholders.
+# Each call only binds values; SQLAlchemy's compiled cache (keyed on the
+# statement structure) skips re-compiling the SQL, and SQLite's statement
+# cache reuses the prepared statement for the identical SQL string.
+# ---------------------------------------------------------------------------
+
+_PIECE_TYPE_BY_CODE = select(PieceType).where(PieceType.code == bindparam("code"))
+
+_DESIGNS_RECENT = select(Design).order_by(Design.updated_at.desc())
+
+_DESIGNS_BY_PIECE_TYPE = (
+    select(Design)
+    .where(Design.piece_type_id == bindparam("piece_type_id"))
+    .order_by(Design.updated_at.desc())
+)
+
+_REVISIONS_BY_DESIGN = (
+    select(Revision)
+    .where(Revision.design_id == bindparam("design_id"))
+    .order_by(Revision.revision_seq.asc())
+)
+
+_LATEST_REVISION = (
+    select(Revision)
+    .where(Revision.design_id == bindparam("design_id"))
+    .order_by(Revision.revision_seq.desc())
+    .limit(1)
+)
+
+_BOM_BY_REVISION = (
+    select(BOMItem)
+    .where(BOMItem.revision_id == bindparam("revision_id"))
+    .order_by(BOMItem.item_number.asc())
+)
 
 
 class PieceTypeRepository:
-    """Read-only access to piece type catalog."""
+    """
+    Read-only access to piece type catalog.
+
+    Active piece types are a small catalog written once at seeding time, so
+    they are loaded with one SELECT and kept in a per-database cache shared
+    by all sessions. Cached instances are detached and fully loaded; they
+    can be read after their session closes without expunge(). The cache is
+    dropped whenever a session flushes or bulk-writes PieceType rows (and on
+    rollback of such a transaction), or via invalidate_cache().
+    """
+
+    # bind (Engine/Connection) -> _PieceTypeCache; weak so that disposed
+    # engines (e.g. per-test in-memory databases) drop their entry
+    _caches: WeakKeyDictionary = WeakKeyDictionary()
 
     def __init__(self, session: Session) -> None:
         self._session = session
 
+    @classmethod
+    def invalidate_cache(cls, bind=None) -> None:
+        """Forget cached piece types for one bind, or for all when None."""
+        if bind is None:
+            cls._caches.clear()
+        else:
+            cls._caches.pop(bind, None)
+
     def get_all_active(self) -> list[PieceType]:
-        return (
-            self._session.query(PieceType)
-            .filter(PieceType.is_active == 1)
-            .order_by(PieceType.discipline, PieceType.category, PieceType.display_name)
-            .all()
-        )
+        return list(self._cache().all_active)
 
     def get_by_code(self, code: str) -> Optional[PieceType]:
+        pt = self._cache().by_code.get(code)
+        if pt is not None:
+            return pt
+        # Inactive (or unknown) codes are not cached
         return (
-            self._session.query(PieceType)
-            .filter(PieceType.code == code)
+            self._session.execute(_PIECE_TYPE_BY_CODE, {"code": code})
+            .scalars()
             .first()
         )
 
     def get_by_discipline(self, discipline: str) -> list[PieceType]:
-        return (
-            self._session.query(PieceType)
-            .filter(PieceType.discipline == discipline, PieceType.is_active == 1)
-            .order_by(PieceType.category, PieceType.display_name)
-            .all()
-        )
+        # all_active is sorted by (discipline, category, display_name), so
+        # filtering keeps the (category, display_name) order
+        return [
+            pt for pt in self._cache().all_active if pt.discipline == discipline
+        ]
+
+    def _cache(self) -> _PieceTypeCache:
+        bind = self._session.get_bind()
+        cache = self._caches.get(bind)
+        if cache is None:
+            rows = self._session.execute(
+                select(PieceType.__table__)
+                .where(PieceType.is_active == 1)
+                .order_by(PieceType.discipline, PieceType.category, PieceType.display_name)
+            )
+            # Built from plain rows and marked detached, so the caller's
+            # session identity map is left untouched
+            all_active = []
+            for row in rows:
+                pt = PieceType(**row._mapping)
+                make_transient_to_detached(pt)
+                all_active.append(pt)
+            cache = self._caches[bind] = _PieceTypeCache(
+                all_active=tuple(all_active),
+                by_code={pt.code: pt for pt in all_active},
+            )
+        return cache
+
+
+@dataclass(slots=True, frozen=True)
+class _PieceTypeCache:
+    all_active: tuple[PieceType, ...]
+    by_code: dict[str, PieceType]
+
+
+_PIECE_TYPES_TOUCHED = "piece_types_touched"
+
+
+@event.listens_for(Session, "after_flush")
+def _piece_types_flushed(session: Session, flush_context) -> None:
+    if any(
+        isinstance(obj, PieceType)
+        for obj in (*session.new, *session.dirty, *session.deleted)
+    ):
+        session.info[_PIECE_TYPES_TOUCHED] = True
+        PieceTypeRepository.invalidate_cache(session.get_bind())
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _piece_types_bulk_written(state) -> None:
+    if (state.is_insert or state.is_update or state.is_delete) and any(
+        m.class_ is PieceType for m in state.all_mappers
+    ):
+        state.session.info[_PIECE_TYPES_TOUCHED] = True
+        PieceTypeRepository.invalidate_cache(state.session.get_bind())
+
+
+@event.listens_for(Session, "after_rollback")
+def _piece_types_rolled_back(session: Session) -> None:
+    # The cache may have been refilled with rows this rollback just undid
+    if session.info.pop(_PIECE_TYPES_TOUCHED, False):
+        PieceTypeRepository.invalidate_cache(session.get_bind())
+
+
+@event.listens_for(Session, "after_commit")
+def _piece_types_committed(session: Session) -> None:
+    session.info.pop(_PIECE_TYPES_TOUCHED, None)
+
+
+# ---------------------------------------------------------------------------
+# Per-session memoization of list queries
+# ---------------------------------------------------------------------------
+
+_QUERY_MEMO = "query_memo"
+
+
+def _memoized(session: Session, model: type, key: tuple, run_query) -> list:
+    """
+    Return run_query() and remember the primary keys it returned, keyed by
+    (model, *key), for the rest of the session's transaction.
+
+    On a repeat call the instances are taken back from the session identity
+    map, so no SQL is issued; if any of them has been garbage-collected the
+    query simply runs again. Only primary keys are stored, never instances,
+    so nothing outlives the session that loaded it.
+    """
+    memo = session.info.setdefault(_QUERY_MEMO, {})
+    pks = memo.get((model, *key))
+    if pks is not None:
+        identity_map = session.identity_map
+        objs = [identity_map.get(identity_key(model, pk)) for pk in pks]
+        if None not in objs:
+            return objs
+    objs = run_query()
+    memo[(model, *key)] = tuple(obj.id for obj in objs)
+    return objs
+
+
+def _forget_memoized(session: Session, models: set[type]) -> None:
+    memo = session.info.get(_QUERY_MEMO)
+    if memo:
+        for key in [k for k in memo if k[0] in models]:
+            del memo[key]
+
+
+@event.listens_for(Session, "after_flush")
+def _memo_flushed(session: Session, flush_context) -> None:
+    _forget_memoized(
+        session,
+        {type(obj) for obj in (*session.new, *session.dirty, *session.deleted)},
+    )
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _memo_bulk_written(state) -> None:
+    if state.is_insert or state.is_update or state.is_delete:
+        _forget_memoized(state.session, {m.class_ for m in state.all_mappers})
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _memo_transaction_ended(session: Session) -> None:
+    # Committed instances are expired and rolled-back ones may be stale
+    session.info.pop(_QUERY_MEMO, None)
 
 
 class DesignRepository:
-    """CRUD operations for Design entities."""
+    """
+    CRUD operations for Design entities.
+
+    List queries are memoized per session until the next flush or bulk
+    write touching Design rows, or the end of the transaction.
+    """
 
     def __init__(self, session: Session) -> None:
         self._session = session
@@ -60,20 +261,35 @@ class DesignRepository:
     def get_by_id(self, design_id: int) -> Optional[Design]:
         return self._session.get(Design, design_id)
 
-    def get_all(self) -> list[Design]:
-        return (
-            self._session.query(Design)
-            .order_by(Design.updated_at.desc())
-            .all()
+    def get_with_revisions(self, design_id: int) -> Optional[Design]:
+        """
+        Design with its revisions and their BOM items, eager-loaded in three
+        SELECTs total (selectinload batches each level into one IN query).
+        """
+        return self._session.get(
+            Design,
+            design_id,
+            options=[selectinload(Design.revisions).selectinload(Revision.bom_items)],
         )
 
-    def get_by_piece_type(self, piece_type_id: int) -> list[Design]:
-        return (
-            self._session.query(Design)
-            .filter(Design.piece_type_id == piece_type_id)
-            .order_by(Design.updated_at.desc())
-            .all()
-        )
+    def get_all(self, limit: Optional[int] = None) -> list[Design]:
+        """Most recently modified first; limit returns only the first N."""
+        # Served by idx_designs_updated_at: an index walk that stops after
+        # `limit` rows instead of a full-table sort
+        return _memoized(self._session, Design, ("all", limit), lambda: list(
+            self._session.scalars(_DESIGNS_RECENT.limit(limit))
+        ))
+
+    def get_by_piece_type(
+        self, piece_type_id: int, limit: Optional[int] = None
+    ) -> list[Design]:
+        key = ("piece_type", piece_type_id, limit)
+        return _memoized(self._session, Design, key, lambda: list(
+            self._session.scalars(
+                _DESIGNS_BY_PIECE_TYPE.limit(limit),
+                {"piece_type_id": piece_type_id},
+            )
+        ))
 
     def create(
         self,
@@ -93,11 +309,14 @@ class DesignRepository:
         return design
 
     def update_name(self, design_id: int, name: str) -> Optional[Design]:
-        design = self.get_by_id(design_id)
-        if design:
-            design.name = name
-            design.updated_at = datetime.now(timezone.utc).isoformat()
-        return design
+        # Single UPDATE ... RETURNING; no prior SELECT of the design.
+        # updated_at is stamped by the column's onupdate.
+        return self._session.scalars(
+            update(Design)
+            .where(Design.id == design_id)
+            .values(name=name)
+            .returning(Design)
+        ).first()
 
     def delete(self, design_id: int) -> bool:
         design = self.get_by_id(design_id)
@@ -113,34 +332,42 @@ class RevisionRepository:
     def __init__(self, session: Session) -> None:
         self._session = session
 
-    def get_by_id(self, revision_id: int) -> Optional[Revision]:
-        return self._session.get(Revision, revision_id)
+    def get_by_id(
+        self, revision_id: int, with_payload: bool = False
+    ) -> Optional[Revision]:
+        """
+        Args:
+            with_payload: Also load the deferred columns (parameters,
+                warnings, description, eco_reason) in the same SELECT.
+                Needed when the revision is used after its session closes.
+        """
+        options = [undefer("*")] if with_payload else []
+        return self._session.get(Revision, revision_id, options=options)
 
-    def get_by_design(self, design_id: int) -> list[Revision]:
-        return (
-            self._session.query(Revision)
-            .filter(Revision.design_id == design_id)
-            .order_by(Revision.generated_at.asc())
-            .all()
+    def get_with_bom(self, revision_id: int) -> Optional[Revision]:
+        """Revision with its BOM items eager-loaded (one extra SELECT)."""
+        return self._session.get(
+            Revision, revision_id, options=[selectinload(Revision.bom_items)]
         )
 
+    def get_by_design(self, design_id: int) -> list[Revision]:
+        # Memoized like DesignRepository.get_all()
+        return _memoized(self._session, Revision, ("design", design_id), lambda: list(
+            self._session.scalars(_REVISIONS_BY_DESIGN, {"design_id": design_id})
+        ))
+
     def get_latest_for_design(self, design_id: int) -> Optional[Revision]:
-        # Order by id (monotonically increasing autoincrement) — safer than
-        # generated_at which can collide when two revisions are created within
-        # the same millisecond (common in tests and fast bulk operations).
-        return (
-            self._session.query(Revision)
-            .filter(Revision.design_id == design_id)
-            .order_by(Revision.id.desc())
-            .first()
-        )
+        # Order by revision_seq, unique per design — unlike generated_at,
+        # which can collide when two revisions are created within the same
+        # millisecond (common in tests and fast bulk operations).
+        return self._session.scalars(
+            _LATEST_REVISION, {"design_id": design_id}
+        ).first()
 
     def get_next_revision_code(self, design_id: int) -> str:
         """Generate the next alphabetic revision code for a design (A, B, ... Z, AA, ...)."""
-        revisions = self.get_by_design(design_id)
-        if not revisions:
-            return "A"
-        return _increment_revision_code(revisions[-1].revision_code)
+        last = self._session.scalar(_max_revision_seq(design_id))
+        return _revision_code(last + 1)
 
     def create(
         self,
@@ -148,18 +375,36 @@ class RevisionRepository:
         parameters: dict,
         description: str = "",
         generated_by: str = "Fede",
+        validation_passed: bool = False,
+        validation_warnings: Optional[list[str]] = None,
     ) -> Revision:
-        revision_code = self.get_next_revision_code(design_id)
-        rev = Revision(
-            design_id=design_id,
-            revision_code=revision_code,
-            description=description,
-            generated_by=generated_by,
+        """
+        Insert the design's next revision with one INSERT ... SELECT ...
+        RETURNING: revision_seq and revision_code are computed by the
+        database from MAX(revision_seq) in the same statement, so there is
+        no read-then-write window and no separate lookup round-trip.
+        """
+        seq = select((_max_revision_seq(design_id) + 1).label("seq")).subquery()
+        columns, values = zip(
+            (Revision.design_id, literal(design_id)),
+            (Revision.revision_seq, seq.c.seq),
+            (Revision.revision_code, _revision_code_sql(seq.c.seq)),
+            (Revision.parameters, literal(parameters, Revision.parameters.type)),
+            (Revision.description, literal(description, Text)),
+            (Revision.generated_at, literal(_utcnow(), Revision.generated_at.type)),
+            (Revision.generated_by, literal(generated_by)),
+            (Revision.eco_status, literal("draft")),
+            (Revision.validation_passed, literal(int(validation_passed))),
+            (
+                Revision.validation_warnings,
+                literal(validation_warnings, Revision.validation_warnings.type),
+            ),
         )
-        rev.parameters = parameters  # uses the property setter to serialize JSON
-        self._session.add(rev)
-        self._session.flush()
-        return rev
+        return self._session.scalars(
+            insert(Revision)
+            .from_select(columns, select(*values))
+            .returning(Revision)
+        ).one()
 
     def update_eco_status(
         self,
@@ -172,14 +417,12 @@ class RevisionRepository:
         allowed = {"draft", "issued", "obsolete"}
         if status not in allowed:
             raise ValueError(f"eco_status must be one of {allowed}, got {status!r}")
-        rev = self.get_by_id(revision_id)
-        if rev:
-            rev.eco_status = status
-            if eco_number is not None:
-                rev.eco_number = eco_number
-            if eco_reason is not None:
-                rev.eco_reason = eco_reason
-        return rev
+        values = {"eco_status": status}
+        if eco_number is not None:
+            values["eco_number"] = eco_number
+        if eco_reason is not None:
+            values["eco_reason"] = eco_reason
+        return self._update(revision_id, values)
 
     def update_output_paths(self, revision_id: int, paths: dict) -> Optional[Revision]:
         """
@@ -189,15 +432,28 @@ class RevisionRepository:
             paths: dict with optional keys: 'fcstd', 'step', 'dxf', 'pdf',
                    'bom_xlsx', 'bom_pdf'. Values are path strings.
         """
-        rev = self.get_by_id(revision_id)
-        if rev:
-            rev.fcstd_path = paths.get("fcstd")
-            rev.step_path = paths.get("step")
-            rev.dxf_path = paths.get("dxf")
-            rev.pdf_path = paths.get("pdf")
-            rev.bom_xlsx_path = paths.get("bom_xlsx")
-            rev.bom_pdf_path = paths.get("bom_pdf")
-        return rev
+        return self._update(revision_id, {
+            "fcstd_path": paths.get("fcstd"),
+            "step_path": paths.get("step"),
+            "dxf_path": paths.get("dxf"),
+            "pdf_path": paths.get("pdf"),
+            "bom_xlsx_path": paths.get("bom_xlsx"),
+            "bom_pdf_path": paths.get("bom_pdf"),
+        })
+
+    def _update(self, revision_id: int, values: dict) -> Optional[Revision]:
+        """
+        UPDATE ... RETURNING by primary key: one round-trip whether or not
+        the revision was loaded before (e.g. by the session that created
+        it). An instance already in this session's identity map is
+        refreshed in place and returned. None if the id does not exist.
+        """
+        return self._session.scalars(
+            update(Revision)
+            .where(Revision.id == revision_id)
+            .values(**values)
+            .returning(Revision)
+        ).first()
 
 
 class BOMRepository:
@@ -207,11 +463,8 @@ class BOMRepository:
         self._session = session
 
     def get_by_revision(self, revision_id: int) -> list[BOMItem]:
-        return (
-            self._session.query(BOMItem)
-            .filter(BOMItem.revision_id == revision_id)
-            .order_by(BOMItem.item_number.asc())
-            .all()
+        return list(
+            self._session.scalars(_BOM_BY_REVISION, {"revision_id": revision_id})
         )
 
     def create_items(self, revision_id: int, items: list[dict]) -> list[BOMItem]:
@@ -222,24 +475,80 @@ class BOMRepository:
             items: list of dicts with keys matching BOMItem columns.
                    item_number is auto-assigned based on list order (1-based).
         """
-        created = []
-        for idx, item_data in enumerate(items, start=1):
-            bom_item = BOMItem(
-                revision_id=revision_id,
-                item_number=idx,
-                description=item_data["description"],
-                quantity=item_data.get("quantity", 1.0),
-                unit=item_data.get("unit", "UN"),
-                part_code=item_data.get("part_code"),
-                material=item_data.get("material"),
-                standard=item_data.get("standard"),
-                unit_weight_kg=item_data.get("unit_weight_kg"),
-                observations=item_data.get("observations"),
+        if not items:
+            return []
+        rows = [
+            {
+                "revision_id": revision_id,
+                "item_number": idx,
+                "description": item_data["description"],
+                "quantity": item_data.get("quantity", 1.0),
+                "unit": item_data.get("unit", "UN"),
+                "part_code": item_data.get("part_code"),
+                "material": item_data.get("material"),
+                "standard": item_data.get("standard"),
+                "unit_weight_kg": item_data.get("unit_weight_kg"),
+                "observations": item_data.get("observations"),
+            }
+            for idx, item_data in enumerate(items, start=1)
+        ]
+        # One executemany-style INSERT (insertmanyvalues) instead of one
+        # unit-of-work entry per row; RETURNING hands back the instances.
+        return list(self._session.scalars(
+            insert(BOMItem).returning(BOMItem, sort_by_parameter_order=True),
+            rows,
+        ))
+
+
+def _max_revision_seq(design_id: int):
+    """Scalar subquery: highest revision_seq of a design, 0 if it has none."""
+    return (
+        select(func.coalesce(func.max(Revision.revision_seq), 0))
+        .where(Revision.design_id == design_id)
+        .scalar_subquery()
+    )
+
+
+# Revision codes are bijective base 26 (spreadsheet-column style):
+# A=1 ... Z=26, AA=27 ... ZZ=702, AAA=703
+_ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+# As many letters as revision_code holds, so the CASE in _revision_code_sql()
+# spells every code the column can store (ZZZZZZZZ = 217180147158)
+_MAX_CODE_LETTERS = Revision.revision_code.type.length
+
+
+def _revision_code(seq: int) -> str:
+    """
+    Alphabetic code of a 1-based revision number: 1 -> 'A', 27 -> 'AA'.
+    Inverse of models._revision_seq().
+    """
+    out = []
+    while seq:
+        seq, r = divmod(seq - 1, 26)
+        out.append(_ALPHABET[r])
+    return "".join(reversed(out))
+
+
+def _revision_code_sql(seq):
+    """
+    SQL expression computing _revision_code(seq) with CASE, integer
+    division and substr() only, so it runs on any backend without a UDF.
+    seq must be an INTEGER expression: // then renders as a plain "/",
+    which is integer division on SQLite and PostgreSQL alike.
+    """
+    whens = []
+    first = 1   # smallest seq spelled with `letters` letters
+    for letters in range(1, _MAX_CODE_LETTERS + 1):
+        offset = seq - first
+        code = None
+        for power in range(letters - 1, -1, -1):
+            letter = func.substr(
+                _ALPHABET, (offset // 26 ** power) % 26 + 1, 1, type_=String
             )
-            self._session.add(bom_item)
-            created.append(bom_item)
-        self._session.flush()
-        return created
+            code = letter if code is None else code + letter
+        first += 26 ** letters
+        whens.append((seq < first, code))
+    return case(*whens)
 
 
 def _increment_revision_code(code: str) -> str:
@@ -253,16 +562,4 @@ def _increment_revision_code(code: str) -> str:
         'AZ' -> 'BA'
         'ZZ' -> 'AAA'
     """
-    chars = list(code.upper())
-    carry = True
-    idx = len(chars) - 1
-    while carry and idx >= 0:
-        if chars[idx] == "Z":
-            chars[idx] = "A"
-            idx -= 1
-        else:
-            chars[idx] = chr(ord(chars[idx]) + 1)
-            carry = False
-    if carry:
-        chars.insert(0, "A")
-    return "".join(chars)
+    return _revision_code(_revision_seq(code) + 1)
@@ -4,12 +4,19 @@ DXFGenerator — 2D drawing generation using ezdxf.
 Generates DXF files with standard views (top, front, side, isometric),
 IRAM 4505 title block, dimensions, tolerances, and technical notes.
 
+Output is rendered into an in-memory buffer and written with a single
+call (see _write_document), instead of ezdxf streaming many small writes
+to the file. The generator touches no Qt objects, so callers may run it
+from a QThreadPool worker and keep the GUI thread responsive.
+
 TODO Semana 10: Implement DXF generation and PDF export.
 """
 
 from __future__ import annotations
 
+import io
 from pathlib import Path
+from typing import BinaryIO, Optional
 
 
 class DXFGenerator:
@@ -22,19 +29,52 @@ class DXFGenerator:
         output_path: Path,
         drawing_number: str = "",
         revision_code: str = "A",
+        stream: Optional[BinaryIO] = None,
     ) -> bool:
         """
         Generate a DXF drawing file.
 
+        Args:
+            stream: If given, the encoded DXF is written there instead of
+                    to output_path (e.g. a BytesIO for previews or tests).
+
         Returns True on success.
-        TODO Semana 10: implement with ezdxf + IRAM 4505 title block.
+        TODO Semana 10: implement with ezdxf + IRAM 4505 title block, then
+        finish with self._write_document(doc, output_path, stream).
         """
         raise NotImplementedError(
             "Generaci\u00f3n DXF — implementar en Semana 10 con ezdxf."
         )
 
     def export_pdf(self, dxf_path: Path, pdf_path: Path) -> bool:
-        """Convert a DXF to PDF. Returns True on success."""
+        """
+        Convert a DXF to PDF. Returns True on success.
+
+        TODO Semana 10: render with ezdxf.addons.drawing's PyMuPDF backend
+        (C-accelerated), not the pure-Python matplotlib one.
+        """
         raise NotImplementedError(
             "Exportaci\u00f3n PDF — implementar en Semana 10."
         )
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _write_document(
+        doc, output_path: Path, stream: Optional[BinaryIO] = None
+    ) -> None:
+        """
+        Serialise an ezdxf document in memory, then emit it in one write.
+
+        ezdxf writes DXF as text tag by tag; the buffer turns those
+        thousands of small writes into a single file write.
+        """
+        buf = io.StringIO()
+        doc.write(buf)
+        data = buf.getvalue().encode(doc.output_encoding, errors="dxfreplace")
+        if stream is not None:
+            stream.write(data)
+        else:
+            Path(output_path).write_bytes(data)
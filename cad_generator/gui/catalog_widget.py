@@ -1,22 +1,30 @@
 """
 CatalogWidget — Piece type catalog browser.
 
-Displays available piece types in a QTreeWidget organized by:
+Displays available piece types in a QTreeView organized by:
   Discipline (e.g., "Estructural")
     └─ Category (e.g., "Base")
          └─ Piece (e.g., "Placa Base Estructural")
 
 Emits piece_selected(piece_code) when the user double-clicks a piece.
+
+The tree's QStandardItemModel is built once per catalog content and shared
+by every CatalogWidget; it is rebuilt only when the catalog reloads.
 """
 
 from __future__ import annotations
 
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont, QIcon
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
+from typing import Optional
+
+from PyQt6.QtCore import QModelIndex, Qt, pyqtSignal
+from PyQt6.QtGui import QFont, QStandardItem, QStandardItemModel
 from PyQt6.QtWidgets import (
+    QAbstractItemView,
     QLabel,
-    QTreeWidget,
-    QTreeWidgetItem,
+    QTreeView,
     QVBoxLayout,
     QWidget,
 )
@@ -40,6 +48,103 @@ _CATEGORY_LABELS: dict[str, str] = {
 }
 
 
+# Assigned once per widget; kept as a constant so the text is not rebuilt
+_TREE_STYLESHEET = """
+    QTreeView {
+        border: none;
+        background-color: #F5F5F5;
+        font-size: 13px;
+    }
+    QTreeView::item {
+        padding: 4px 6px;
+    }
+    QTreeView::item:selected {
+        background-color: #0070C0;
+        color: white;
+    }
+    QTreeView::item:hover:!selected {
+        background-color: #DDEEFF;
+    }
+"""
+
+
+@lru_cache(maxsize=None)
+def _bold_font(point_size: int = -1) -> QFont:
+    """
+    Shared bold QFont (built lazily: QFont needs the QApplication).
+    point_size -1 keeps the default size.
+    """
+    font = QFont()
+    font.setBold(True)
+    if point_size > 0:
+        font.setPointSize(point_size)
+    return font
+
+
+@lru_cache(maxsize=None)
+def _discipline_text(discipline: str) -> str:
+    """Tree text for a discipline node, built once per discipline code."""
+    return f"📐  {_DISCIPLINE_LABELS.get(discipline, discipline.title())}"
+
+
+@lru_cache(maxsize=None)
+def _category_text(category: str) -> str:
+    """Tree text for a category node, built once per category code."""
+    return f"  {_CATEGORY_LABELS.get(category, category.title())}"
+
+
+# Shared tree model and the catalog rows it was built from
+_cached_model: Optional[QStandardItemModel] = None
+_cached_rows: Optional[list[tuple[str, str, str, str, str]]] = None
+
+
+def _catalog_model() -> QStandardItemModel:
+    """
+    Return the shared tree model, building it on first use and again only
+    after the catalog content changed (CatalogLoader reloads the JSON when
+    the file changes, which yields new rows).
+    """
+    global _cached_model, _cached_rows
+    rows = list(catalog.iter_pieces_sorted())
+    if _cached_model is None or rows != _cached_rows:
+        _cached_model = _build_model(rows)
+        _cached_rows = rows
+    return _cached_model
+
+
+def _build_model(rows: list[tuple[str, str, str, str, str]]) -> QStandardItemModel:
+    model = QStandardItemModel()
+    root = model.invisibleRootItem()
+    # Rows arrive sorted by (discipline, category, display_name), so
+    # groupby builds each tree level in a single pass; children are
+    # attached with appendRows() so each level is inserted in one batch.
+    for discipline, disc_rows in groupby(rows, key=itemgetter(0)):
+        disc_item = _node(_discipline_text(discipline))
+        disc_item.setFont(_bold_font())
+
+        cat_items = []
+        for category, cat_rows in groupby(disc_rows, key=itemgetter(1)):
+            cat_item = _node(_category_text(category))
+            piece_items = []
+            for _, _, display_name, code, description in cat_rows:
+                piece_item = _node(f"    {display_name}", code)
+                piece_item.setToolTip(description)
+                piece_items.append(piece_item)
+            cat_item.appendRows(piece_items)
+            cat_items.append(cat_item)
+
+        disc_item.appendRows(cat_items)
+        root.appendRow(disc_item)
+    return model
+
+
+def _node(text: str, piece_code: Optional[str] = None) -> QStandardItem:
+    item = QStandardItem(text)
+    item.setEditable(False)
+    item.setData(piece_code, Qt.ItemDataRole.UserRole)
+    return item
+
+
 class CatalogWidget(QWidget):
     """
     Sidebar catalog browser.
@@ -63,80 +168,33 @@ class CatalogWidget(QWidget):
         layout.setSpacing(4)
 
         title = QLabel("Catálogo de Piezas")
-        title_font = QFont()
-        title_font.setBold(True)
-        title_font.setPointSize(10)
-        title.setFont(title_font)
+        title.setFont(_bold_font(10))
         title.setContentsMargins(8, 8, 8, 4)
 
-        self._tree = QTreeWidget()
+        self._tree = QTreeView()
         self._tree.setHeaderHidden(True)
         self._tree.setRootIsDecorated(True)
         self._tree.setExpandsOnDoubleClick(False)
+        self._tree.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self._tree.setMinimumWidth(200)
-        self._tree.setStyleSheet("""
-            QTreeWidget {
-                border: none;
-                background-color: #F5F5F5;
-                font-size: 13px;
-            }
-            QTreeWidget::item {
-                padding: 4px 6px;
-            }
-            QTreeWidget::item:selected {
-                background-color: #0070C0;
-                color: white;
-            }
-            QTreeWidget::item:hover:!selected {
-                background-color: #DDEEFF;
-            }
-        """)
-        self._tree.itemDoubleClicked.connect(self._on_item_double_clicked)
+        self._tree.setStyleSheet(_TREE_STYLESHEET)
+        self._tree.doubleClicked.connect(self._on_item_double_clicked)
 
         layout.addWidget(title)
         layout.addWidget(self._tree)
 
     def _populate(self) -> None:
-        """Load pieces from the catalog and populate the tree."""
-        self._tree.clear()
-
-        # Organize pieces: discipline → category → [pieces]
-        organized: dict[str, dict[str, list]] = {}
-        for piece in catalog.get_all_pieces():
-            disc = organized.setdefault(piece.discipline, {})
-            disc.setdefault(piece.category, []).append(piece)
-
-        for discipline, categories in sorted(organized.items()):
-            disc_label = _DISCIPLINE_LABELS.get(discipline, discipline.title())
-            disc_item = QTreeWidgetItem([f"📐  {disc_label}"])
-            disc_item.setData(0, Qt.ItemDataRole.UserRole, None)
-            disc_font = QFont()
-            disc_font.setBold(True)
-            disc_item.setFont(0, disc_font)
-            self._tree.addTopLevelItem(disc_item)
-
-            for category, pieces in sorted(categories.items()):
-                cat_label = _CATEGORY_LABELS.get(category, category.title())
-                cat_item = QTreeWidgetItem([f"  {cat_label}"])
-                cat_item.setData(0, Qt.ItemDataRole.UserRole, None)
-                disc_item.addChild(cat_item)
-
-                for piece in sorted(pieces, key=lambda p: p.display_name):
-                    piece_item = QTreeWidgetItem([f"    {piece.display_name}"])
-                    piece_item.setData(0, Qt.ItemDataRole.UserRole, piece.code)
-                    piece_item.setToolTip(0, piece.description)
-                    cat_item.addChild(piece_item)
-
-            disc_item.setExpanded(True)
-
-        # Expand all category items
+        """Attach the (shared, cached) catalog model to the tree."""
+        model = _catalog_model()
+        if self._tree.model() is not model:
+            self._tree.setModel(model)
         self._tree.expandAll()
 
     # ------------------------------------------------------------------
     # Event handlers
     # ------------------------------------------------------------------
 
-    def _on_item_double_clicked(self, item: QTreeWidgetItem, column: int) -> None:
-        piece_code = item.data(0, Qt.ItemDataRole.UserRole)
+    def _on_item_double_clicked(self, index: QModelIndex) -> None:
+        piece_code = index.data(Qt.ItemDataRole.UserRole)
         if piece_code:
             self.piece_selected.emit(piece_code)
@@ -16,12 +16,22 @@ Flujo de trabajo:
   2. Page 1 carga ParameterForm + SchematicViewer
   3. Foco en un parámetro → SchematicViewer resalta esa dimensión en el diagrama
   4. Click "Crear Diseño" → NewDesignDialog → design creado en DB
-  5. Click "Generar" → _GenerateWorker (QThread) → PieceController.generate() → result dialog
+  5. Click "Generar" → _GenerateRunnable (page thread pool) → PieceController.generate() → result dialog
 """
 
 from __future__ import annotations
 
-from PyQt6.QtCore import QThread, Qt, pyqtSignal
+from functools import lru_cache
+
+from PyQt6.QtCore import (
+    QObject,
+    QRunnable,
+    QSignalBlocker,
+    QThreadPool,
+    QTimer,
+    Qt,
+    pyqtSignal,
+)
 from PyQt6.QtGui import QAction, QFont, QKeySequence
 from PyQt6.QtWidgets import (
     QDialog,
@@ -38,6 +48,7 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
+from cad_generator.config.catalog_loader import catalog
 from cad_generator.config.settings import settings
 from cad_generator.core.piece_controller import (
     GenerationRequest,
@@ -49,24 +60,81 @@ from cad_generator.gui.new_design_dialog import NewDesignDialog
 from cad_generator.gui.parameter_form import ParameterForm
 from cad_generator.gui.schematic_viewer import SchematicViewer
 
+# Coalescing window for schematic refreshes (~2 frames at 60 Hz)
+_VIEWER_REFRESH_MS = 30
+# Widest the action-bar status text may get before it is elided
+_STATUS_MAX_PX = 320
+# Generations finishing sooner than this never show the progress dialog
+_PROGRESS_DELAY_MS = 400
+
+# Static style sheets, shared by every instance
+_SUBTITLE_QSS = "color: #666; font-size: 14px;"
+_HINT_QSS = (
+    "color: #999; font-size: 12px; "
+    "background: #F0F4FF; border-radius: 6px; padding: 10px 16px;"
+)
+_SPLITTER_HANDLE_QSS = "QSplitter::handle { background-color: #DDD; }"
+_ACTION_BAR_QSS = "background-color: #F7F7F7; border-top: 1px solid #DDD;"
+# Action-bar status label: one sheet, variant picked by the "state" property
+_STATUS_QSS = (
+    "QLabel[state='idle'] { color: #888; font-size: 11px; } "
+    "QLabel[state='design'] { color: #2E7D32; font-size: 11px; font-weight: bold; } "
+    "QLabel[state='generated'] { color: #2E7D32; font-weight: bold; }"
+)
+_GENERATE_BTN_QSS = (
+    "QPushButton:enabled { background-color: #0070C0; color: white; "
+    "border-radius: 4px; font-weight: bold; padding: 6px 12px; } "
+    "QPushButton:disabled { background-color: #CCC; color: #888; "
+    "border-radius: 4px; padding: 6px 12px; }"
+)
+
+# Generation-result message fragments, joined once per message
+_SUCCESS_HTML = "Revisión <b>{rev}</b> generada correctamente.<br><br><b>Archivos:</b>"
+_FCSTD_HTML = "<br>&nbsp;• FCStd: {path}"
+_STEP_HTML = "<br>&nbsp;• STEP:  {path}"
+_WARNINGS_HTML = "<br><br><b>Advertencias:</b><br>"
+_WARNING_ITEM_HTML = "&nbsp;⚠ {w}"
+_ELAPSED_HTML = "<br><br><i>Tiempo: {s:.1f} s</i>"
+
+
+@lru_cache(maxsize=None)
+def _font(point_size: int, bold: bool = False) -> QFont:
+    """Shared QFont per (size, weight); built lazily, after the QApplication."""
+    font = QFont()
+    font.setPointSize(point_size)
+    font.setBold(bold)
+    return font
+
 
 # ---------------------------------------------------------------------------
 # Background worker for CAD generation (keeps GUI responsive)
 # ---------------------------------------------------------------------------
 
-class _GenerateWorker(QThread):
-    """Runs PieceController.generate() in a background thread."""
-
+class _GenerateSignals(QObject):
+    # QRunnable is not a QObject, so its signals live on a companion object
     finished = pyqtSignal(object)   # emits GenerationResponse
 
+
+class _GenerateRunnable(QRunnable):
+    """
+    Runs PieceController.generate() on a QThreadPool thread (the parameter
+    page's single-thread pool), reusing it instead of a QThread per click.
+    """
+
     def __init__(self, controller: PieceController, request: GenerationRequest) -> None:
         super().__init__()
+        self.signals     = _GenerateSignals()
         self._controller = controller
         self._request    = request
 
     def run(self) -> None:
-        response = self._controller.generate(self._request)
-        self.finished.emit(response)
+        try:
+            response = self._controller.generate(self._request)
+        except Exception as exc:   # always answer, or the GUI stays blocked
+            response = GenerationResponse(
+                success=False, errors=[f"Error inesperado: {exc}"]
+            )
+        self.signals.finished.emit(response)
 
 
 # ---------------------------------------------------------------------------
@@ -81,32 +149,24 @@ class _WelcomePage(QWidget):
         layout.setSpacing(16)
 
         icon_lbl = QLabel("📐")
-        icon_font = QFont()
-        icon_font.setPointSize(48)
-        icon_lbl.setFont(icon_font)
+        icon_lbl.setFont(_font(48))
         icon_lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         title = QLabel(settings.app_name)
-        title_font = QFont()
-        title_font.setBold(True)
-        title_font.setPointSize(18)
-        title.setFont(title_font)
+        title.setFont(_font(18, bold=True))
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         subtitle = QLabel(
             "Seleccioná una pieza del catálogo para comenzar."
         )
-        subtitle.setStyleSheet("color: #666; font-size: 14px;")
+        subtitle.setStyleSheet(_SUBTITLE_QSS)
         subtitle.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         hint = QLabel(
             "Doble clic sobre una pieza del árbol lateral → "
             "se cargan sus parámetros aquí."
         )
-        hint.setStyleSheet(
-            "color: #999; font-size: 12px; "
-            "background: #F0F4FF; border-radius: 6px; padding: 10px 16px;"
-        )
+        hint.setStyleSheet(_HINT_QSS)
         hint.setAlignment(Qt.AlignmentFlag.AlignCenter)
         hint.setWordWrap(True)
         hint.setMaximumWidth(480)
@@ -128,6 +188,33 @@ class _ParameterPage(QWidget):
         self._current_piece_code: str | None = None
         self._current_design_id: int | None = None
 
+        # Viewer updates are coalesced: form signals only record the latest
+        # state and (re)arm a short single-shot timer, so a burst of
+        # keystrokes costs one schematic re-render instead of one per key.
+        self._pending_values: dict | None = None
+        self._pending_param: str | None = None
+        # One long-lived generation thread: runnables queue up in order, so
+        # two FreeCAD jobs from this page never run concurrently and no
+        # thread is created per click (expiry -1 keeps the thread parked).
+        self._gen_pool = QThreadPool(self)
+        self._gen_pool.setMaxThreadCount(1)
+        self._gen_pool.setExpiryTimeout(-1)
+        # Last dict delivered by values_changed (the form's current values)
+        self._last_values: dict | None = None
+        # What the viewer currently shows; equal updates are not re-sent
+        self._shown_focus: tuple[str, str] | None = None
+        self._shown_values: dict | None = None
+        # The viewer's only coalescing layer: SchematicViewer repaints
+        # synchronously on every set_values/set_parameter it receives
+        self._viewer_timer = QTimer(self)
+        self._viewer_timer.setSingleShot(True)
+        self._viewer_timer.setInterval(_VIEWER_REFRESH_MS)
+        self._viewer_timer.timeout.connect(self._flush_viewer)
+        # Bumped on every load_piece(); an update armed for an older piece
+        # is dropped instead of rendering stale geometry
+        self._piece_epoch = 0
+        self._pending_epoch = 0
+
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
@@ -135,7 +222,7 @@ class _ParameterPage(QWidget):
         # ── Horizontal QSplitter: ParameterForm (left) + SchematicViewer (right)
         content_splitter = QSplitter(Qt.Orientation.Horizontal)
         content_splitter.setHandleWidth(1)
-        content_splitter.setStyleSheet("QSplitter::handle { background-color: #DDD; }")
+        content_splitter.setStyleSheet(_SPLITTER_HANDLE_QSS)
 
         self._form = ParameterForm()
         self._form.validation_result_changed.connect(self._on_validation_changed)
@@ -155,15 +242,14 @@ class _ParameterPage(QWidget):
 
         # Action bar at bottom
         action_bar = QWidget()
-        action_bar.setStyleSheet(
-            "background-color: #F7F7F7; border-top: 1px solid #DDD;"
-        )
+        action_bar.setStyleSheet(_ACTION_BAR_QSS)
         action_layout = QHBoxLayout(action_bar)
         action_layout.setContentsMargins(16, 8, 16, 8)
         action_layout.setSpacing(8)
 
         self._design_status_lbl = QLabel("Sin diseño activo")
-        self._design_status_lbl.setStyleSheet("color: #888; font-size: 11px;")
+        self._design_status_lbl.setStyleSheet(_STATUS_QSS)
+        self._design_status_lbl.setProperty("state", "idle")
 
         self._btn_new_design = QPushButton("Crear Diseño…")
         self._btn_new_design.setEnabled(False)
@@ -175,12 +261,7 @@ class _ParameterPage(QWidget):
         self._btn_generate = QPushButton("⚙  Generar CAD")
         self._btn_generate.setEnabled(False)
         self._btn_generate.setMinimumWidth(140)
-        self._btn_generate.setStyleSheet(
-            "QPushButton:enabled { background-color: #0070C0; color: white; "
-            "border-radius: 4px; font-weight: bold; padding: 6px 12px; } "
-            "QPushButton:disabled { background-color: #CCC; color: #888; "
-            "border-radius: 4px; padding: 6px 12px; }"
-        )
+        self._btn_generate.setStyleSheet(_GENERATE_BTN_QSS)
         self._btn_generate.setToolTip("Semana 7+: genera modelo 3D y planos 2D.")
 
         action_layout.addWidget(self._design_status_lbl)
@@ -198,19 +279,27 @@ class _ParameterPage(QWidget):
     # ------------------------------------------------------------------
 
     def load_piece(self, piece_code: str) -> None:
+        self._piece_epoch += 1
         self._current_piece_code = piece_code
         self._current_design_id = None
-        self._form.load_piece(piece_code)   # auto-emits param_focused for first param
-        self._btn_new_design.setEnabled(True)
+        self._last_values = None
+        # Updates queued for the previous piece are stale now
+        self._viewer_timer.stop()
+        self._pending_values = self._pending_param = None
+        # The form's load-time signals (values_changed, param_focused for
+        # the first parameter) are blocked: the viewer is set once below
+        with QSignalBlocker(self._form):
+            self._form.load_piece(piece_code)
+        # validation_result_changed only fires when the verdict changes, so
+        # seed the button from the load-time result
+        result = self._form.get_last_validation_result()
+        self._btn_new_design.setEnabled(result is None or result.is_valid)
         self._btn_generate.setEnabled(False)
-        self._design_status_lbl.setText("Sin diseño activo")
-        # Set explicit initial viewer state in case param_focused fires before
-        # the viewer is wired (first load edge-case).
-        from cad_generator.config.catalog_loader import catalog as cat
-        piece = cat.get_piece(piece_code)
+        self._set_status("Sin diseño activo", "idle")
+        piece = catalog.get_piece(piece_code)
         if piece and piece.parameters:
-            self._viewer.set_parameter(
-                piece_code, piece.parameters[0].name, self._form.get_values()
+            self._show_parameter(
+                piece_code, piece.parameters[0].name, self._current_values()
             )
 
     def get_form(self) -> ParameterForm:
@@ -228,19 +317,83 @@ class _ParameterPage(QWidget):
     def _on_param_focused(self, param_name: str) -> None:
         """Relay focus change to SchematicViewer so it highlights that dimension."""
         if self._current_piece_code:
-            self._viewer.set_parameter(
-                self._current_piece_code, param_name, self._form.get_values()
-            )
+            self._pending_param = param_name
+            self._schedule_viewer()
 
     def _on_values_changed(self, values: dict) -> None:
         """Keep SchematicViewer geometry in sync when any value changes."""
-        self._viewer.set_values(values)
+        self._last_values = values
+        self._pending_values = values
+        self._schedule_viewer()
+
+    def _set_status(self, text: str, state: str) -> None:
+        """
+        Show text in the action-bar status label, elided to a fixed width
+        (full text in the tooltip) so a long design name cannot widen the
+        label and reflow the action bar.
+
+        state selects a variant of _STATUS_QSS ("idle", "design",
+        "generated"); only a state change repolishes the label, the sheet
+        itself is never re-parsed.
+        """
+        label = self._design_status_lbl
+        if label.property("state") != state:
+            label.setProperty("state", state)
+            label.style().unpolish(label)
+            label.style().polish(label)   # font/colour for the new state
+        label.setText(label.fontMetrics().elidedText(
+            text, Qt.TextElideMode.ElideRight, _STATUS_MAX_PX
+        ))
+        label.setToolTip(text)
+
+    def _schedule_viewer(self) -> None:
+        # Not restarted while active: the viewer refreshes at most once per
+        # interval even during continuous typing
+        if not self._viewer_timer.isActive():
+            self._pending_epoch = self._piece_epoch
+            self._viewer_timer.start()
+
+    def _flush_viewer(self) -> None:
+        """Apply the latest pending focus/values to the viewer in one refresh."""
+        param, values = self._pending_param, self._pending_values
+        self._pending_param = self._pending_values = None
+        if self._pending_epoch != self._piece_epoch:
+            return
+        piece_code = self._current_piece_code
+        if param is not None and piece_code and (piece_code, param) != self._shown_focus:
+            self._show_parameter(
+                piece_code,
+                param,
+                values if values is not None else self._current_values(),
+            )
+        elif values is not None and values != self._shown_values:
+            # Re-entering the focused field or re-emitting equal values
+            # (e.g. spin box re-clamped to the same number) is skipped
+            self._shown_values = values
+            self._viewer.set_values(values)
+
+    def _show_parameter(self, piece_code: str, param: str, values: dict) -> None:
+        self._shown_focus = (piece_code, param)
+        self._shown_values = values
+        self._viewer.set_parameter(piece_code, param, values)
+
+    def _current_values(self) -> dict:
+        # The form emits values_changed whenever its values change (and once
+        # on load), so after a flush() the last emitted dict is current; no
+        # need to walk the widgets again
+        if self._last_values is None:
+            self._last_values = self._form.get_values()
+        return self._last_values
 
     def _on_create_design(self) -> None:
         if not self._current_piece_code:
             return
-        from cad_generator.config.catalog_loader import catalog as cat
-        piece = cat.get_piece(self._current_piece_code)
+        # Validate edits still inside the form's debounce window; the
+        # button is disabled again if they made the parameters invalid
+        self._form.flush()
+        if not self._btn_new_design.isEnabled():
+            return
+        piece = catalog.get_piece(self._current_piece_code)
         display_name = piece.display_name if piece else self._current_piece_code
 
         dlg = NewDesignDialog(piece_display_name=display_name, parent=self)
@@ -268,12 +421,7 @@ class _ParameterPage(QWidget):
             if design.drawing_number
             else ""
         )
-        self._design_status_lbl.setText(
-            f"✓  Diseño: {design.name}{drawing_info}"
-        )
-        self._design_status_lbl.setStyleSheet(
-            "color: #2E7D32; font-size: 11px; font-weight: bold;"
-        )
+        self._set_status(f"✓  Diseño: {design.name}{drawing_info}", "design")
         self._btn_generate.setEnabled(True)
         self._btn_generate.setToolTip(
             f"Generar modelo 3D para diseño ID {design.id}."
@@ -282,10 +430,11 @@ class _ParameterPage(QWidget):
     def _on_generate(self) -> None:
         if not self._current_design_id:
             return
+        self._form.flush()   # edits still inside the form's debounce window
 
         request = GenerationRequest(
             design_id=self._current_design_id,
-            parameters=self._form.get_values(),
+            parameters=self._current_values(),
             description="Generado desde GUI",
         )
 
@@ -295,43 +444,47 @@ class _ParameterPage(QWidget):
         )
         progress.setWindowTitle("Generación CAD")
         progress.setWindowModality(Qt.WindowModality.WindowModal)
-        progress.setMinimumDuration(0)
+        # Shown only if the generation is still running after this delay;
+        # fast generations never create/paint the dialog at all
+        progress.setMinimumDuration(_PROGRESS_DELAY_MS)
         progress.setValue(0)
-        progress.show()
 
-        self._worker = _GenerateWorker(self._controller, request)
-        self._worker.finished.connect(
+        # Disabled until the result arrives: no overlapping generations
+        self._btn_generate.setEnabled(False)
+        runnable = _GenerateRunnable(self._controller, request)
+        runnable.signals.finished.connect(
             lambda resp: self._on_generation_finished(resp, progress)
         )
-        self._worker.start()
+        self._gen_pool.start(runnable)
 
     def _on_generation_finished(
         self, response: GenerationResponse, progress: QProgressDialog
     ) -> None:
+        progress.setValue(progress.maximum())
         progress.close()
+        self._btn_generate.setEnabled(self._current_design_id is not None)
 
         if response.success:
-            msg = (
-                f"Revisión <b>{response.revision_code}</b> generada correctamente."
-                f"<br><br>"
-                f"<b>Archivos:</b><br>"
-                f"&nbsp;• FCStd: {response.output_dir / f'base_plate_{response.revision_code}.FCStd'}<br>"
-                f"&nbsp;• STEP:  {response.output_dir / f'base_plate_{response.revision_code}.step'}"
-            )
+            parts = [_SUCCESS_HTML.format(rev=response.revision_code)]
+            if response.fcstd_path:
+                parts.append(_FCSTD_HTML.format(path=response.fcstd_path))
+            if response.step_path:
+                parts.append(_STEP_HTML.format(path=response.step_path))
             if response.warnings:
-                msg += "<br><br><b>Advertencias:</b><br>" + "<br>".join(
-                    f"&nbsp;⚠ {w}" for w in response.warnings
-                )
+                parts.append(_WARNINGS_HTML)
+                parts.append("<br>".join(
+                    _WARNING_ITEM_HTML.format(w=w) for w in response.warnings
+                ))
             if response.elapsed_seconds:
-                msg += f"<br><br><i>Tiempo: {response.elapsed_seconds:.1f} s</i>"
+                parts.append(_ELAPSED_HTML.format(s=response.elapsed_seconds))
 
-            QMessageBox.information(self, "Generación completada", msg)
+            QMessageBox.information(self, "Generación completada", "".join(parts))
 
-            self._design_status_lbl.setText(
+            self._set_status(
                 f"✓  Rev. {response.revision_code} generada"
-                + (f"  [{response.elapsed_seconds:.1f}s]" if response.elapsed_seconds else "")
+                + (f"  [{response.elapsed_seconds:.1f}s]" if response.elapsed_seconds else ""),
+                "generated",
             )
-            self._design_status_lbl.setStyleSheet("color: #2E7D32; font-weight: bold;")
 
         else:
             error_text = "\n".join(response.errors) or "Error desconocido."
@@ -353,7 +506,7 @@ class MainWindow(QMainWindow):
 
     def __init__(self, parent=None) -> None:
         super().__init__(parent)
-        self._controller = PieceController()
+        self._controller = PieceController(prewarm=True)
         self.setWindowTitle(settings.app_name)
         self.setMinimumSize(1100, 720)
         self._build_ui()
@@ -392,9 +545,9 @@ class MainWindow(QMainWindow):
         self._welcome_page = _WelcomePage()
         self._stack.addWidget(self._welcome_page)
 
-        # Page 1: Parameter form
-        self._param_page = _ParameterPage(self._controller)
-        self._stack.addWidget(self._param_page)
+        # Page 1: Parameter form — built on first piece selection, so a
+        # session that never opens a piece skips its widget tree entirely
+        self._param_page: _ParameterPage | None = None
 
         splitter.setSizes([220, 880])
         splitter.setCollapsible(0, False)
@@ -445,12 +598,14 @@ class MainWindow(QMainWindow):
     # ------------------------------------------------------------------
 
     def _on_piece_selected(self, piece_code: str) -> None:
-        from cad_generator.config.catalog_loader import catalog as cat
-        piece = cat.get_piece(piece_code)
+        piece = catalog.get_piece(piece_code)
         display = piece.display_name if piece else piece_code
 
+        if self._param_page is None:
+            self._param_page = _ParameterPage(self._controller)
+            self._stack.addWidget(self._param_page)
         self._param_page.load_piece(piece_code)
-        self._stack.setCurrentIndex(1)
+        self._stack.setCurrentWidget(self._param_page)
         self._status_bar.showMessage(
             f"Pieza seleccionada: {display}  —  "
             "Ajustá los parámetros y hacé clic en 'Crear Diseño'."
@@ -458,7 +613,7 @@ class MainWindow(QMainWindow):
 
     def _on_menu_new(self) -> None:
         """Jump to welcome screen so user picks a piece first."""
-        self._stack.setCurrentIndex(0)
+        self._stack.setCurrentWidget(self._welcome_page)
         self._status_bar.showMessage(
             "Seleccioná una pieza del catálogo para crear un nuevo diseño."
         )
@@ -28,6 +28,12 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
+# Allowed drawing numbers, e.g. "PB-001"
+_DRAWING_RE = re.compile(r"^[A-Za-z0-9\-_]+$")
+
+_SEPARATOR_QSS = "background-color: #DDDDDD;"
+_ERROR_LABEL_QSS = "color: #CC0000; font-size: 11px;"
+
 
 class NewDesignDialog(QDialog):
     """Dialog for entering design metadata before creating a new design."""
@@ -38,6 +44,13 @@ class NewDesignDialog(QDialog):
         self.setWindowTitle("Nuevo Diseño")
         self.setMinimumWidth(420)
         self.setModal(True)
+        # Per-field validation state; each field only re-validates itself and
+        # the OK button is touched only when the combined result flips
+        self._name_ok = False
+        self._drawing_ok = True
+        self._ok_enabled = False
+        self._last_name: Optional[str] = None
+        self._last_drawing: Optional[str] = None
         self._build_ui()
 
     # ------------------------------------------------------------------
@@ -59,7 +72,7 @@ class NewDesignDialog(QDialog):
 
         separator = QWidget()
         separator.setFixedHeight(1)
-        separator.setStyleSheet("background-color: #DDDDDD;")
+        separator.setStyleSheet(_SEPARATOR_QSS)
         layout.addWidget(separator)
 
         # Form
@@ -72,27 +85,19 @@ class NewDesignDialog(QDialog):
         self._name_edit.setPlaceholderText("Ej: Placa base columna C1")
         self._name_edit.setMinimumWidth(260)
         self._name_error = QLabel("")
-        self._name_error.setStyleSheet("color: #CC0000; font-size: 11px;")
-        name_widget = QWidget()
-        name_layout = QVBoxLayout(name_widget)
-        name_layout.setContentsMargins(0, 0, 0, 0)
-        name_layout.setSpacing(2)
-        name_layout.addWidget(self._name_edit)
-        name_layout.addWidget(self._name_error)
-        form.addRow("Nombre *:", name_widget)
+        self._name_error.setStyleSheet(_ERROR_LABEL_QSS)
+        # Error labels are their own rows (empty label column) rather than
+        # stacked with the edit inside an extra wrapper widget + layout
+        form.addRow("Nombre *:", self._name_edit)
+        form.addRow("", self._name_error)
 
         # Drawing number field (optional)
         self._drawing_edit = QLineEdit()
         self._drawing_edit.setPlaceholderText("Ej: PB-001  (opcional)")
         self._drawing_number_error = QLabel("")
-        self._drawing_number_error.setStyleSheet("color: #CC0000; font-size: 11px;")
-        drawing_widget = QWidget()
-        drawing_layout = QVBoxLayout(drawing_widget)
-        drawing_layout.setContentsMargins(0, 0, 0, 0)
-        drawing_layout.setSpacing(2)
-        drawing_layout.addWidget(self._drawing_edit)
-        drawing_layout.addWidget(self._drawing_number_error)
-        form.addRow("N° de plano:", drawing_widget)
+        self._drawing_number_error.setStyleSheet(_ERROR_LABEL_QSS)
+        form.addRow("N° de plano:", self._drawing_edit)
+        form.addRow("", self._drawing_number_error)
 
         # Description field (optional)
         self._desc_edit = QTextEdit()
@@ -113,33 +118,44 @@ class NewDesignDialog(QDialog):
         layout.addWidget(self._buttons)
 
         # Wire up live validation
-        self._name_edit.textChanged.connect(self._validate_fields)
-        self._drawing_edit.textChanged.connect(self._validate_fields)
+        self._name_edit.textChanged.connect(self._validate_name)
+        self._drawing_edit.textChanged.connect(self._validate_drawing)
 
     # ------------------------------------------------------------------
     # Validation
     # ------------------------------------------------------------------
 
     def _validate_fields(self) -> None:
-        ok = True
+        self._validate_name()
+        self._validate_drawing()
 
+    def _validate_name(self) -> None:
         name = self._name_edit.text().strip()
-        if not name:
-            self._name_error.setText("El nombre es obligatorio.")
-            ok = False
-        else:
-            self._name_error.setText("")
+        # Whitespace-only edits leave the result unchanged
+        if name == self._last_name:
+            return
+        self._last_name = name
+        self._name_ok = bool(name)
+        self._name_error.setText("" if self._name_ok else "El nombre es obligatorio.")
+        self._refresh_ok()
 
+    def _validate_drawing(self) -> None:
         drawing = self._drawing_edit.text().strip()
-        if drawing and not re.match(r"^[A-Za-z0-9\-_]+$", drawing):
-            self._drawing_number_error.setText(
-                "Solo letras, números, guiones y guiones bajos."
-            )
-            ok = False
-        else:
-            self._drawing_number_error.setText("")
-
-        self._buttons.button(QDialogButtonBox.StandardButton.Ok).setEnabled(ok and bool(name))
+        if drawing == self._last_drawing:
+            return
+        self._last_drawing = drawing
+        self._drawing_ok = not drawing or bool(_DRAWING_RE.match(drawing))
+        self._drawing_number_error.setText(
+            "" if self._drawing_ok
+            else "Solo letras, números, guiones y guiones bajos."
+        )
+        self._refresh_ok()
+
+    def _refresh_ok(self) -> None:
+        enabled = self._name_ok and self._drawing_ok
+        if enabled != self._ok_enabled:
+            self._ok_enabled = enabled
+            self._buttons.button(QDialogButtonBox.StandardButton.Ok).setEnabled(enabled)
 
     # ------------------------------------------------------------------
     # Data access
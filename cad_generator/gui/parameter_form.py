@@ -14,8 +14,15 @@ Conditional visibility:
   parameter changes value.
 
 Real-time validation:
-  On every widget change, ValidationEngine is called and the result is
-  rendered below the form as colored messages (errors red, warnings orange).
+  Spin boxes report a typed number once it is committed (Enter, focus-out,
+  arrows), not per keystroke; flush() commits any text still being typed.
+  Widget changes are coalesced (_CHANGE_DEBOUNCE_MS); once a burst of edits
+  settles, ValidationEngine is called and the result is rendered below the
+  form as colored messages (errors red, warnings orange). flush() forces
+  the pending pass to run immediately. When a piece's rules proved slow
+  (> _VALIDATE_ASYNC_MS), debounced passes validate on a worker thread and
+  only the latest request's result is shown; flush() always validates
+  synchronously.
 
 Signals:
   values_changed(dict)             — emitted on any parameter change
@@ -26,9 +33,22 @@ Signals:
 
 from __future__ import annotations
 
-from typing import Optional
-
-from PyQt6.QtCore import QEvent, QObject, Qt, pyqtSignal
+import time
+from dataclasses import replace
+from html import escape
+from typing import Any, Callable, Optional
+
+from PyQt6.QtCore import (
+    QEvent,
+    QObject,
+    QRunnable,
+    QSignalBlocker,
+    QSignalMapper,
+    QThreadPool,
+    QTimer,
+    Qt,
+    pyqtSignal,
+)
 from PyQt6.QtGui import QFont
 from PyQt6.QtWidgets import (
     QCheckBox,
@@ -43,16 +63,66 @@ from PyQt6.QtWidgets import (
 )
 
 from cad_generator.config.catalog_loader import ParameterSpec, catalog
+from cad_generator.config.settings import settings
 from cad_generator.core.validation_engine import ValidationEngine, ValidationResult
 
 
+# ---------------------------------------------------------------------------
+# Background validation (slow rule sets only)
+# ---------------------------------------------------------------------------
+
+class _ValidateSignals(QObject):
+    # QRunnable is not a QObject, so its signals live on a companion object
+    finished = pyqtSignal(int, object, object, float)   # id, values, result, s
+
+
+class _ValidateRunnable(QRunnable):
+    """Runs one ValidationEngine.validate() pass on the form's thread pool."""
+
+    def __init__(
+        self, engine: ValidationEngine, values: dict, rules: list, request_id: int
+    ) -> None:
+        super().__init__()
+        self.signals     = _ValidateSignals()
+        self._engine     = engine
+        self._values     = values
+        self._rules      = rules
+        self._request_id = request_id
+
+    def run(self) -> None:
+        start = time.perf_counter()
+        result = self._engine.validate(self._values, self._rules)
+        self.signals.finished.emit(
+            self._request_id, self._values, result, time.perf_counter() - start
+        )
+
+
 # ---------------------------------------------------------------------------
 # Styled validation message label
 # ---------------------------------------------------------------------------
 
-_STYLE_ERROR   = "color: #CC0000; font-size: 11px; padding: 2px 0;"
-_STYLE_WARNING = "color: #B8600A; font-size: 11px; padding: 2px 0;"
-_STYLE_OK      = "color: #2E7D32; font-size: 11px; padding: 2px 0;"
+# Quiet period after the last widget change before validating and emitting
+_CHANGE_DEBOUNCE_MS = 50
+# Validation results kept per form (distinct value snapshots, FIFO)
+_VALIDATION_CACHE_SIZE = 64
+# Parameter label with its description underneath, and the label column's
+# width cap (descriptions wrap instead of widening the form)
+_LABEL_HTML = (
+    "{label}:<br/>"
+    "<span style='color: #666; font-size: 10px;'>{description}</span>"
+)
+_LABEL_MAX_PX = 240
+# A validation pass slower than this moves debounced passes off the GUI thread
+_VALIDATE_ASYNC_MS = 8.0
+
+# Set once on the validation panel; each message label picks its variant
+# through the "severity" property instead of carrying its own sheet
+_VALIDATION_PANEL_QSS = (
+    "QLabel { font-size: 11px; padding: 2px 0; } "
+    "QLabel[severity='error'] { color: #CC0000; } "
+    "QLabel[severity='warning'] { color: #B8600A; } "
+    "QLabel[severity='ok'] { color: #2E7D32; }"
+)
 
 
 class _ValidationPanel(QWidget):
@@ -63,43 +133,53 @@ class _ValidationPanel(QWidget):
         self._layout = QVBoxLayout(self)
         self._layout.setContentsMargins(0, 4, 0, 0)
         self._layout.setSpacing(2)
+        self.setStyleSheet(_VALIDATION_PANEL_QSS)
+        # Labels are pooled: surplus ones are hidden, never deleted, so a
+        # spin-box drag re-texts existing labels instead of rebuilding them
         self._labels: list[QLabel] = []
+        self._shown: list[tuple[str, str]] = []   # (text, severity) per label
 
     def update(self, result: Optional[ValidationResult]) -> None:  # type: ignore[override]
-        for lbl in self._labels:
-            self._layout.removeWidget(lbl)
-            lbl.deleteLater()
-        self._labels.clear()
-
         if result is None:
+            items = []
+        elif result.is_valid and not result.warnings:
+            items = [("✓  Todos los parámetros son válidos.", "ok")]
+        else:
+            items = [(f"✗  {m.message}", "error") for m in result.errors]
+            items += [(f"⚠  {m.message}", "warning") for m in result.warnings]
+        if items == self._shown:
             return
 
-        if result.is_valid and not result.warnings:
-            lbl = QLabel("✓  Todos los parámetros son válidos.")
-            lbl.setStyleSheet(_STYLE_OK)
-            self._layout.addWidget(lbl)
-            self._labels.append(lbl)
-            return
-
-        for msg in result.errors:
-            lbl = QLabel(f"✗  {msg.message}")
-            lbl.setStyleSheet(_STYLE_ERROR)
-            lbl.setWordWrap(True)
-            self._layout.addWidget(lbl)
-            self._labels.append(lbl)
-
-        for msg in result.warnings:
-            lbl = QLabel(f"⚠  {msg.message}")
-            lbl.setStyleSheet(_STYLE_WARNING)
-            lbl.setWordWrap(True)
-            self._layout.addWidget(lbl)
-            self._labels.append(lbl)
+        for i, (text, severity) in enumerate(items):
+            if i < len(self._labels):
+                lbl = self._labels[i]
+                if lbl.text() != text:
+                    lbl.setText(text)
+                if lbl.property("severity") != severity:
+                    lbl.setProperty("severity", severity)
+                    lbl.style().unpolish(lbl)
+                    lbl.style().polish(lbl)   # colour for the new severity
+                lbl.show()
+            else:
+                lbl = QLabel(text)
+                lbl.setProperty("severity", severity)
+                lbl.setWordWrap(True)
+                self._layout.addWidget(lbl)
+                self._labels.append(lbl)
+        for lbl in self._labels[len(items):len(self._shown)]:
+            lbl.hide()
+        self._shown = items
 
 
 # ---------------------------------------------------------------------------
 # Main ParameterForm widget
 # ---------------------------------------------------------------------------
 
+def _form_layout_key(params: list[ParameterSpec]) -> list[ParameterSpec]:
+    """Everything about a parameter list that shapes the form, i.e. all but defaults."""
+    return [replace(spec, default=None) for spec in params]
+
+
 class ParameterForm(QWidget):
     """
     Parametric input form for a single piece type.
@@ -114,11 +194,54 @@ class ParameterForm(QWidget):
         super().__init__(parent)
         self._piece_code: Optional[str] = None
         self._params: list[ParameterSpec] = []
+        self._spec_by_name: dict[str, ParameterSpec] = {}
+        # controller param_name → specs whose depends_on mentions it
+        self._dependents: dict[str, list[ParameterSpec]] = {}
+        # Params changed since the last pass; only their dependents get
+        # their visibility recomputed
+        self._pending_changed: set[str] = set()
         self._widgets: dict[str, QWidget] = {}       # param_name → input widget
-        self._row_widgets: dict[str, QWidget] = {}   # param_name → row container
+        self._name_by_widget: dict[QWidget, str] = {}  # reverse, for focus events
+        # param_name → (row label, input widget), toggled together
+        self._rows: dict[str, tuple[QLabel, QWidget]] = {}
+        # Param names and bound value getters of the input widgets, in
+        # catalog order. A snapshot is the plain tuple of getter results:
+        # fixed layout per piece, so it is compared and hashed as is (cache
+        # keys, change detection) and only turned into a dict when emitted
+        self._value_names: list[str] = []
+        self._value_getters: list[Callable[[], Any]] = []
+        # Snapshot of the last pass; an identical one is not re-emitted
+        self._last_snapshot: Optional[tuple] = None
         self._focused_param: Optional[str] = None
-        self._validation_engine = ValidationEngine()
+        self._title_lbl: Optional[QLabel] = None
+        # Built on the first cache miss; opening a piece on its defaults
+        # is served by the catalog's precomputed result
+        self._validation_engine: Optional[ValidationEngine] = None
+        # Off-thread validation, used once the piece's rules proved slow.
+        # Each pass bumps _val_request_id; a worker result is applied only
+        # if it still answers the latest request.
+        self._slow_rules = False
+        self._val_request_id = 0
+        self._val_in_flight = False
+        self._val_pool = QThreadPool(self)
+        self._val_pool.setMaxThreadCount(1)
         self._last_result: Optional[ValidationResult] = None
+        # Compiled rules of the loaded piece, fetched once in load_piece so
+        # the change path never goes back to the catalog (and its stat())
+        self._val_rules: list = []
+        # Values snapshot → result for _val_rules; revisiting a state (undo,
+        # set_values of a saved dict, re-entering a value) skips the rules
+        self._val_cache: dict[tuple, ValidationResult] = {}
+        # Restarted by every widget change, so holding a spin-box arrow or
+        # typing digits runs one validation pass when the burst ends
+        self._dirty_timer = QTimer(self)
+        self._dirty_timer.setSingleShot(True)
+        self._dirty_timer.setInterval(_CHANGE_DEBOUNCE_MS)
+        self._dirty_timer.timeout.connect(self._flush_change)
+        # One C++ dispatcher for every input's change signal: it maps the
+        # sending widget to its param_name (mappings die with the widget)
+        self._change_mapper = QSignalMapper(self)
+        self._change_mapper.mappedString.connect(self._on_param_change)
         self._build_ui()
 
     # ------------------------------------------------------------------
@@ -127,24 +250,37 @@ class ParameterForm(QWidget):
 
     def load_piece(self, piece_code: str) -> None:
         """Load parameter form for the given piece code."""
+        params = catalog.get_parameters(piece_code)
+        # Re-selecting the shown piece keeps the form (and its edits); a
+        # reloaded catalog hands out new specs, so that still rebuilds
+        if piece_code == self._piece_code and params is self._params and self._widgets:
+            return
+        # A piece whose parameters differ from the shown ones only in their
+        # defaults reuses the widgets: new defaults instead of a rebuild
+        reuse = bool(self._widgets) and _form_layout_key(params) == _form_layout_key(
+            self._params
+        )
         self._piece_code = piece_code
-        self._params = catalog.get_parameters(piece_code)
-        self._rebuild_form()
+        self._params = params
+        self._spec_by_name = {spec.name: spec for spec in self._params}
+        self._dependents = {}
+        for spec in self._params:
+            for controller in spec.depends_on or ():
+                self._dependents.setdefault(controller, []).append(spec)
+        rules = catalog.get_compiled_rules(piece_code)
+        if rules is not self._val_rules:   # other piece or catalog reloaded
+            self._val_cache.clear()
+            self._val_rules = rules
+            defaults, result = catalog.get_default_validation(piece_code)
+            self._val_cache[tuple(defaults.values())] = result
+        if reuse:
+            self._reload_defaults()
+        else:
+            self._rebuild_form()
 
     def get_values(self) -> dict:
         """Return current parameter values as {name: value}."""
-        values = {}
-        for spec in self._params:
-            widget = self._widgets.get(spec.name)
-            if widget is None:
-                values[spec.name] = spec.default
-            elif spec.type == "float":
-                values[spec.name] = widget.value()
-            elif spec.type == "enum":
-                values[spec.name] = widget.currentData()
-            elif spec.type == "bool":
-                values[spec.name] = widget.isChecked()
-        return values
+        return dict(zip(self._value_names, self._snapshot()))
 
     def set_values(self, values: dict) -> None:
         """Populate form from a dict of {param_name: value}."""
@@ -165,7 +301,19 @@ class ParameterForm(QWidget):
             elif spec.type == "bool":
                 widget.setChecked(bool(value))
         self._block_signals(False)
-        self._on_any_change()
+        self._pending_changed.update(values)
+        self.flush()
+
+    def flush(self) -> None:
+        """
+        Run any pending validation/emit pass now (e.g. before saving).
+        Text still being typed into a spin box is committed first.
+        """
+        for widget in self._widgets.values():
+            if isinstance(widget, QDoubleSpinBox):
+                widget.interpretText()
+        self._dirty_timer.stop()
+        self._flush_change(sync=True)
 
     def get_focused_param(self) -> Optional[str]:
         return self._focused_param
@@ -179,11 +327,10 @@ class ParameterForm(QWidget):
 
     def eventFilter(self, watched: QObject, event: QEvent) -> bool:
         if event.type() == QEvent.Type.FocusIn:
-            for name, widget in self._widgets.items():
-                if widget is watched:
-                    self._focused_param = name
-                    self.param_focused.emit(name)
-                    break
+            name = self._name_by_widget.get(watched)
+            if name is not None:
+                self._focused_param = name
+                self.param_focused.emit(name)
         return super().eventFilter(watched, event)
 
     # ------------------------------------------------------------------
@@ -199,16 +346,7 @@ class ParameterForm(QWidget):
         self._scroll.setWidgetResizable(True)
         self._scroll.setFrameShape(QFrame.Shape.NoFrame)
 
-        self._form_container = QWidget()
-        self._form_layout = QFormLayout(self._form_container)
-        self._form_layout.setSpacing(10)
-        self._form_layout.setContentsMargins(16, 12, 16, 12)
-        self._form_layout.setLabelAlignment(
-            Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
-        )
-        self._form_layout.setFieldGrowthPolicy(
-            QFormLayout.FieldGrowthPolicy.ExpandingFieldsGrow
-        )
+        self._new_form_container()
         self._scroll.setWidget(self._form_container)
         outer.addWidget(self._scroll)
 
@@ -233,19 +371,50 @@ class ParameterForm(QWidget):
         sep.hide()
         self._val_panel.hide()
 
+    def _new_form_container(self) -> None:
+        """Create an empty, detached form container and its layout."""
+        self._form_container = QWidget()
+        self._form_layout = QFormLayout(self._form_container)
+        self._form_layout.setSpacing(10)
+        self._form_layout.setContentsMargins(16, 12, 16, 12)
+        self._form_layout.setLabelAlignment(
+            Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+        )
+        self._form_layout.setFieldGrowthPolicy(
+            QFormLayout.FieldGrowthPolicy.ExpandingFieldsGrow
+        )
+
     def _rebuild_form(self) -> None:
         """Clear and repopulate the form for the current piece."""
-        while self._form_layout.rowCount() > 0:
-            self._form_layout.removeRow(0)
+        self._dirty_timer.stop()   # pending pass belongs to the old piece
+        self._pending_changed.clear()
+        self._val_request_id += 1  # and so does any validation in flight
+        self._val_in_flight = False
+        # Drop the old container in one go instead of N removeRow() calls
+        # (each one reflows the layout); the new rows are built on a fresh,
+        # still-detached container and swapped in once they are all there
+        old = self._scroll.takeWidget()
+        if old is not None:
+            old.blockSignals(True)
+            old.deleteLater()
+        self._new_form_container()
+        self._form_container.setUpdatesEnabled(False)
         self._widgets.clear()
-        self._row_widgets.clear()
+        self._name_by_widget.clear()
+        self._rows.clear()
+        self._value_names = []
+        self._value_getters = []
+        self._last_snapshot = None
+        self._last_result = None
         self._focused_param = None
 
         if not self._params:
+            self._attach_form_container()
             return
 
         # Title
         piece = catalog.get_piece(self._piece_code)
+        self._title_lbl = None
         if piece:
             title_lbl = QLabel(piece.display_name)
             f = QFont()
@@ -253,52 +422,69 @@ class ParameterForm(QWidget):
             f.setPointSize(12)
             title_lbl.setFont(f)
             self._form_layout.addRow(title_lbl)
+            self._title_lbl = title_lbl
 
-        # One row per parameter
+        # One row per parameter. Every change signal goes through the
+        # mapper, so blocking it covers anything the inputs emit while they
+        # are populated, wired and laid out; the initial pass runs after
+        populating = QSignalBlocker(self._change_mapper)
         first_widget: Optional[QWidget] = None
         for spec in self._params:
             widget = self._create_widget(spec)
             self._widgets[spec.name] = widget
+            self._name_by_widget[widget] = spec.name
             widget.installEventFilter(self)   # focus tracking
 
+            # The description goes inside the label (rich text) rather than
+            # under the input: no per-row container widget and layout
             label_text = spec.display_name + (f"  [{spec.unit}]" if spec.unit else "")
-            label = QLabel(label_text + ":")
-            label.setToolTip(spec.description)
-
-            row_container = QWidget()
-            rl = QVBoxLayout(row_container)
-            rl.setContentsMargins(0, 0, 0, 0)
-            rl.setSpacing(2)
-            rl.addWidget(widget)
             if spec.description:
-                desc_lbl = QLabel(spec.description)
-                desc_lbl.setStyleSheet("color: #666; font-size: 10px;")
-                desc_lbl.setWordWrap(True)
-                rl.addWidget(desc_lbl)
+                label = QLabel(_LABEL_HTML.format(
+                    label=escape(label_text), description=escape(spec.description)
+                ))
+                label.setWordWrap(True)
+                label.setMaximumWidth(_LABEL_MAX_PX)
+                label.setAlignment(Qt.AlignmentFlag.AlignRight)
+            else:
+                label = QLabel(label_text + ":")
+            label.setToolTip(spec.description)
 
-            self._form_layout.addRow(label, row_container)
-            self._row_widgets[spec.name] = row_container
+            self._form_layout.addRow(label, widget)
+            self._rows[spec.name] = (label, widget)
 
-            # Change signals
+            # Value getter and change signal
+            on_change = self._change_mapper.map
+            self._change_mapper.setMapping(widget, spec.name)
             if spec.type == "float":
-                widget.valueChanged.connect(self._on_any_change)
+                getter = widget.value
+                widget.valueChanged.connect(on_change)
             elif spec.type == "enum":
-                widget.currentIndexChanged.connect(self._on_any_change)
+                getter = widget.currentData
+                widget.currentIndexChanged.connect(on_change)
             elif spec.type == "bool":
-                widget.stateChanged.connect(self._on_any_change)
+                getter = widget.isChecked
+                widget.stateChanged.connect(on_change)
+            else:
+                getter = None
+            if getter is not None:
+                self._value_names.append(spec.name)
+                self._value_getters.append(getter)
 
             if first_widget is None:
                 first_widget = widget
 
+        self._attach_form_container()
+        populating.unblock()
+
         # Show form
         self._placeholder.hide()
         self._scroll.show()
         self._sep.show()
         self._val_panel.show()
 
-        # Initial pass
-        self._on_any_change()
-        self._update_depends_on_visibility()
+        # Initial pass: every depends_on row starts from its controllers
+        self._pending_changed.update(self._dependents)
+        self.flush()
 
         # Auto-focus first parameter → drives initial schematic view
         if first_widget is not None:
@@ -308,10 +494,33 @@ class ParameterForm(QWidget):
                 self._focused_param = first_param
                 self.param_focused.emit(first_param)
 
+    def _reload_defaults(self) -> None:
+        """Point the existing widgets at the new piece's default values."""
+        self._dirty_timer.stop()
+        self._pending_changed.clear()
+        self._val_request_id += 1   # validation in flight was for the old piece
+        self._val_in_flight = False
+        # Same-layout pieces may share defaults: force the pass to run
+        self._last_snapshot = None
+        self._last_result = None
+        piece = catalog.get_piece(self._piece_code)
+        if piece and self._title_lbl is not None:
+            self._title_lbl.setText(piece.display_name)
+        # set_values() marks every input as changed, so the depends_on rows
+        # and the validation are recomputed by its flush
+        self.set_values({name: self._spec_by_name[name].default for name in self._value_names})
+
+    def _attach_form_container(self) -> None:
+        self._scroll.setWidget(self._form_container)
+        self._form_container.setUpdatesEnabled(True)
+        self._form_container.updateGeometry()
+
     def _create_widget(self, spec: ParameterSpec) -> QWidget:
         if spec.type == "float":
             spin = QDoubleSpinBox()
             spin.setDecimals(1)
+            # valueChanged on Enter / focus-out / arrows, not per keystroke
+            spin.setKeyboardTracking(False)
             if spec.min is not None:
                 spin.setMinimum(spec.min)
             if spec.max is not None:
@@ -325,8 +534,10 @@ class ParameterForm(QWidget):
 
         elif spec.type == "enum":
             combo = QComboBox()
-            for opt in spec.options:
-                combo.addItem(opt.label, userData=opt.value)
+            # One insert for all items; nothing is connected to it yet
+            combo.addItems([opt.label for opt in spec.options])
+            for i, opt in enumerate(spec.options):
+                combo.setItemData(i, opt.value)
             default_idx = combo.findData(spec.default)
             if default_idx >= 0:
                 combo.setCurrentIndex(default_idx)
@@ -347,48 +558,110 @@ class ParameterForm(QWidget):
     # Change handling & validation
     # ------------------------------------------------------------------
 
-    def _on_any_change(self) -> None:
-        values = self.get_values()
-        self._update_depends_on_visibility()
+    def _on_param_change(self, name: str) -> None:
+        self._pending_changed.add(name)
+        self._dirty_timer.start()
+
+    def _snapshot(self) -> tuple:
+        return tuple([getter() for getter in self._value_getters])
+
+    def _flush_change(self, sync: bool = False) -> None:
+        snapshot = self._snapshot()
+        if snapshot == self._last_snapshot:   # e.g. a value typed and reverted
+            self._pending_changed.clear()
+            if sync and self._val_in_flight:
+                values = dict(zip(self._value_names, snapshot))
+                self._apply_result(self._validate(values, snapshot))
+            return
+        self._last_snapshot = snapshot
+        values = dict(zip(self._value_names, snapshot))
+        if self._pending_changed:
+            self._update_depends_on_visibility(values, self._pending_changed)
+            self._pending_changed = set()
 
         if self._piece_code:
-            rules = catalog.get_validation_rules(self._piece_code)
-            self._last_result = self._validation_engine.validate(values, rules)
-            self._val_panel.update(self._last_result)
-            self.validation_result_changed.emit(self._last_result)
+            if sync or not self._slow_rules or snapshot in self._val_cache:
+                self._apply_result(self._validate(values, snapshot))
+            else:
+                self._start_validation(values)
 
         self.values_changed.emit(values)
 
-    def _update_depends_on_visibility(self) -> None:
-        current_values = self.get_values()
-        for spec in self._params:
-            if not spec.depends_on:
-                continue
-            row_container = self._row_widgets.get(spec.name)
-            if row_container is None:
+    def _apply_result(self, result: ValidationResult) -> None:
+        self._val_request_id += 1   # supersedes any worker still running
+        self._val_in_flight = False
+        # Most edits leave the verdict as it was (still valid, same
+        # messages); only a different result is rendered and emitted
+        if result != self._last_result:
+            self._last_result = result
+            self._val_panel.update(result)
+            self.validation_result_changed.emit(result)
+
+    def _engine(self) -> ValidationEngine:
+        if self._validation_engine is None:
+            self._validation_engine = ValidationEngine(jit=settings.validation_jit)
+        return self._validation_engine
+
+    def _validate(self, values: dict, snapshot: tuple) -> ValidationResult:
+        result = self._val_cache.get(snapshot)
+        if result is None:
+            start = time.perf_counter()
+            result = self._engine().validate(values, self._val_rules)
+            self._store_result(snapshot, result, time.perf_counter() - start)
+        return result
+
+    def _store_result(self, key: tuple, result: ValidationResult, elapsed: float) -> None:
+        self._slow_rules = elapsed * 1000 > _VALIDATE_ASYNC_MS
+        if len(self._val_cache) >= _VALIDATION_CACHE_SIZE:
+            del self._val_cache[next(iter(self._val_cache))]
+        self._val_cache[key] = result
+
+    def _start_validation(self, values: dict) -> None:
+        self._val_request_id += 1
+        self._val_in_flight = True
+        runnable = _ValidateRunnable(
+            self._engine(), values, self._val_rules, self._val_request_id
+        )
+        runnable.signals.finished.connect(self._on_validated)
+        self._val_pool.start(runnable)
+
+    def _on_validated(
+        self, request_id: int, values: dict, result: ValidationResult, elapsed: float
+    ) -> None:
+        if request_id != self._val_request_id:
+            return   # stale: newer values, a synchronous pass or another piece
+        self._store_result(tuple(values.values()), result, elapsed)
+        self._apply_result(result)
+
+    def _update_depends_on_visibility(
+        self, current_values: dict, changed: set[str]
+    ) -> None:
+        affected = {
+            spec.name: spec
+            for name in changed
+            for spec in self._dependents.get(name, ())
+        }
+        for spec in affected.values():
+            row = self._rows.get(spec.name)
+            if row is None:
                 continue
             visible = all(
                 current_values.get(key) == required_value
                 for key, required_value in spec.depends_on.items()
             )
-            row_container.setVisible(visible)
-            self._set_label_visibility(spec.name, visible)
-
-    def _set_label_visibility(self, param_name: str, visible: bool) -> None:
-        for i in range(self._form_layout.rowCount()):
-            field_item = self._form_layout.itemAt(i, QFormLayout.ItemRole.FieldRole)
-            label_item = self._form_layout.itemAt(i, QFormLayout.ItemRole.LabelRole)
-            if field_item and field_item.widget() is self._row_widgets.get(param_name):
-                if label_item and label_item.widget():
-                    label_item.widget().setVisible(visible)
-                break
+            label, widget = row
+            # isHidden(), not isVisible(): the latter also reflects ancestors
+            if widget.isHidden() != visible:
+                continue   # no-op toggle: skip the relayout/restyle
+            widget.setVisible(visible)
+            label.setVisible(visible)
 
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
 
     def _get_spec(self, name: str) -> Optional[ParameterSpec]:
-        return next((s for s in self._params if s.name == name), None)
+        return self._spec_by_name.get(name)
 
     def _block_signals(self, block: bool) -> None:
         for widget in self._widgets.values():
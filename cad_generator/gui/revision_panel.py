@@ -5,22 +5,106 @@ Shows a table of all revisions with their codes, timestamps, ECO status,
 and generated file links. Allows the user to view parameters of past revisions
 and change ECO status (draft → issued → obsolete).
 
-TODO Semana 12: Implement revision history table and ECO controls.
+The table is a QTableView over _RevisionTableModel: refresh() swaps the
+model's row list in one reset instead of inserting QTableWidgetItems cell
+by cell, and the view only asks for the cells it paints.
+
+TODO Semana 12: ECO controls and past-revision parameter view.
 """
 
 from __future__ import annotations
 
-from PyQt6.QtWidgets import QWidget
+from typing import Any
+
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PyQt6.QtWidgets import (
+    QAbstractItemView,
+    QHeaderView,
+    QTableView,
+    QVBoxLayout,
+    QWidget,
+)
+
+from cad_generator.core.piece_controller import PieceController
+
+# (header, row-dict key) per column
+_COLUMNS = (
+    ("Rev.", "revision_code"),
+    ("Fecha", "generated_at"),
+    ("Autor", "generated_by"),
+    ("Estado ECO", "eco_status"),
+    ("Archivo STEP", "step_path"),
+)
+_ECO_LABELS = {"draft": "Borrador", "issued": "Emitida", "obsolete": "Obsoleta"}
+
+
+class _RevisionTableModel(QAbstractTableModel):
+    """Read-only model over the dicts of PieceController.list_revisions_lite()."""
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._rows: list[dict] = []
+
+    def set_rows(self, rows: list[dict]) -> None:
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(_COLUMNS)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        key = _COLUMNS[index.column()][1]
+        value = self._rows[index.row()][key]
+        if value is None:
+            return ""
+        if key == "generated_at":
+            return value.strftime("%Y-%m-%d %H:%M")
+        if key == "eco_status":
+            return _ECO_LABELS.get(value, value)
+        return str(value)
+
+    def headerData(
+        self, section: int, orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> Any:
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return _COLUMNS[section][0]
+        return None
 
 
 class RevisionPanel(QWidget):
-    """Revision history panel. Stub for Semana 12."""
+    """Revision history table for one design."""
 
-    def __init__(self, design_id: int, parent=None) -> None:
+    def __init__(
+        self, controller: PieceController, design_id: int, parent=None
+    ) -> None:
         super().__init__(parent)
+        self._controller = controller
         self.design_id = design_id
-        # TODO: Load revisions from PieceController and display in QTableWidget
+
+        self._model = _RevisionTableModel(self)
+        self._view = QTableView()
+        self._view.setModel(self._model)
+        self._view.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self._view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self._view.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        # Fixed row height: the view never measures rows to lay them out
+        self._view.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self._view.verticalHeader().hide()
+        self._view.horizontalHeader().setStretchLastSection(True)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self._view)
+
+        self.refresh()
 
     def refresh(self) -> None:
         """Reload revision data from the database."""
-        raise NotImplementedError("RevisionPanel — implementar en Semana 12.")
+        self._model.set_rows(self._controller.list_revisions_lite(self.design_id))
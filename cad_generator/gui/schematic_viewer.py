@@ -9,6 +9,10 @@ Priority:
      → display that static image (user-provided professional illustration).
   2. Otherwise → render a dynamic QPainter diagram.
 
+Static images are decoded off the GUI thread (QImage on the global thread
+pool) and kept in Qt's shared QPixmapCache; until an image arrives the
+label is left empty.
+
 Currently implemented dynamic diagrams:
   - base_plate: top-view with holes, slots, dimension annotations.
 
@@ -20,17 +24,32 @@ Usage:
 from __future__ import annotations
 
 import math
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
-from PyQt6.QtCore import QLineF, QPointF, QRectF, Qt
+from PyQt6.QtCore import (
+    QLineF,
+    QObject,
+    QPointF,
+    QRectF,
+    QRunnable,
+    Qt,
+    QThreadPool,
+    pyqtSignal,
+)
 from PyQt6.QtGui import (
     QBrush,
     QColor,
     QFont,
+    QFontMetrics,
+    QImage,
     QPainter,
+    QPainterPath,
     QPen,
     QPixmap,
+    QPixmapCache,
     QPolygonF,
 )
 from PyQt6.QtWidgets import QLabel, QSizePolicy, QVBoxLayout, QWidget
@@ -50,12 +69,118 @@ _C_SLOT_OUT  = QColor("#546E7A")
 _C_ANNOT     = QColor("#E65100")     # active parameter annotations
 _C_DIM       = QColor("#1565C0")     # dimension arrows
 _C_BG        = QColor("#FAFAFA")
+_C_PASSIVE   = QColor("#90A4AE")     # passive dimension text
+_C_LABEL_BG  = QColor(250, 250, 250, 210)
+_C_CALLOUT_BG = QColor(255, 250, 230, 230)
+_C_BADGE_BG  = QColor(255, 248, 220, 220)
+
+# ---------------------------------------------------------------------------
+# Drawing resources, built once and reused by every paint
+# ---------------------------------------------------------------------------
+_BRUSH_PLATE    = QBrush(_C_PLATE)
+_PEN_PLATE      = QPen(_C_PLATE_OUT, 2.0)
+_PEN_ANNOT_DASH = QPen(_C_ANNOT, 2.5, Qt.PenStyle.DashLine)
+_PEN_ANNOT      = QPen(_C_ANNOT, 2.0)
+_PEN_BADGE      = QPen(_C_ANNOT, 1.0)
+# (brush, pen) for the slots: highlighted while a slot parameter is active
+_SLOT_STYLE = {
+    True:  (QBrush(QColor("#FFF3E0")), QPen(_C_ANNOT, 1.8)),
+    False: (QBrush(_C_SLOT), QPen(_C_SLOT_OUT, 1.2)),
+}
+# (brush, pen) for the holes, by active parameter; others use None
+_HOLE_STYLE = {
+    "diametro_perforacion": (QBrush(QColor("#FFF9C4")), QPen(_C_ANNOT, 1.8)),
+    "patron_perforaciones": (QBrush(QColor("#FFF9C4")), QPen(_C_ANNOT, 1.8)),
+    "margen_perforacion":   (QBrush(QColor("#E3F2FD")), QPen(_C_DIM, 1.5)),
+    None:                   (QBrush(_C_HOLE), QPen(_C_HOLE_OUT, 1.2)),
+}
+
+# Scaled static images kept per viewer (one per image, label size and
+# device pixel ratio, FIFO)
+_SCALED_CACHE_SIZE = 16
+
+
+# ---------------------------------------------------------------------------
+# Static image lookup
+# ---------------------------------------------------------------------------
+
+_STATIC_EXTS = (".png", ".jpg", ".jpeg")   # in order of preference
+
+
+@lru_cache(maxsize=4)
+def _scan_static(root: Path) -> dict[tuple[str, str], Path]:
+    """
+    Index assets/schematics/<piece_code>/<param_name>.<png|jpg|jpeg> by
+    (piece_code, param_name). The tree is listed once per root; assets
+    don't change at runtime, so focus changes never touch the disk.
+    """
+    assets = root / "cad_generator" / "assets" / "schematics"
+    if not assets.is_dir():
+        return {}
+    index: dict[tuple[str, str], Path] = {}
+    rank = {ext: i for i, ext in enumerate(_STATIC_EXTS)}
+    for p in assets.glob("*/*"):
+        ext = p.suffix.lower()
+        if ext not in rank or not p.is_file():
+            continue
+        key = (p.parent.name, p.stem)
+        other = index.get(key)
+        if other is None or rank[ext] < rank[other.suffix.lower()]:
+            index[key] = p
+    return index
+
+
+class _ImageLoadSignals(QObject):
+    # QRunnable is not a QObject, so its signals live on a companion object
+    finished = pyqtSignal(str, QImage)   # path, decoded image (null on failure)
+
+
+class _ImageLoadRunnable(QRunnable):
+    """Decodes one static schematic image on a pool thread."""
+
+    def __init__(self, path: Path) -> None:
+        super().__init__()
+        self.signals = _ImageLoadSignals()
+        self._path = str(path)
+
+    def run(self) -> None:
+        # QImage, not QPixmap: pixmaps may only be created on the GUI thread
+        self.signals.finished.emit(self._path, QImage(self._path))
 
 
 # ---------------------------------------------------------------------------
 # Drawing helpers
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=None)
+def _font(point_size: int, bold: bool = False) -> QFont:
+    """Shared QFont per (size, weight); built lazily, after the QApplication."""
+    font = QFont()
+    font.setPointSize(point_size)
+    font.setBold(bold)
+    return font
+
+
+@lru_cache(maxsize=512)
+def _text_extent(text: str, point_size: int, bold: bool = False) -> tuple[int, int]:
+    """(advance, height) of *text* in _font(point_size, bold); shaped once per label."""
+    fm = QFontMetrics(_font(point_size, bold))
+    return fm.horizontalAdvance(text), fm.height()
+
+
+@lru_cache(maxsize=None)
+def _pen(
+    rgba: int, width: float, cap: Qt.PenCapStyle = Qt.PenCapStyle.SquareCap
+) -> QPen:
+    """Shared solid QPen per (color, width, cap) for the color-parametrized helpers."""
+    return QPen(QColor.fromRgba(rgba), width, Qt.PenStyle.SolidLine, cap)
+
+
+@lru_cache(maxsize=None)
+def _brush(rgba: int) -> QBrush:
+    return QBrush(QColor.fromRgba(rgba))
+
+
 def _arrowhead(
     painter: QPainter,
     x: float, y: float,
@@ -67,7 +192,7 @@ def _arrowhead(
     p1 = QPointF(x - size * math.cos(angle - spread), y - size * math.sin(angle - spread))
     p2 = QPointF(x - size * math.cos(angle + spread), y - size * math.sin(angle + spread))
     painter.setPen(Qt.PenStyle.NoPen)
-    painter.setBrush(QBrush(color))
+    painter.setBrush(_brush(color.rgba()))
     painter.drawPolygon(QPolygonF([QPointF(x, y), p1, p2]))
 
 
@@ -89,22 +214,19 @@ def _dim_arrow(
     ax1, ay1 = x1 + nx * offset, y1 + ny * offset
     ax2, ay2 = x2 + nx * offset, y2 + ny * offset
 
-    painter.setPen(QPen(color, 1.5, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap))
+    painter.setPen(_pen(color.rgba(), 1.5, Qt.PenCapStyle.RoundCap))
     painter.drawLine(QLineF(ax1, ay1, ax2, ay2))
     angle = math.atan2(ay2 - ay1, ax2 - ax1)
     _arrowhead(painter, ax2, ay2, angle, color)
     _arrowhead(painter, ax1, ay1, angle + math.pi, color)
 
     mx, my = (ax1 + ax2) / 2, (ay1 + ay2) / 2
-    f = QFont()
-    f.setPointSize(font_size)
-    f.setBold(True)
-    painter.setFont(f)
-    fm = painter.fontMetrics()
-    tw, th = fm.horizontalAdvance(label) + 6, fm.height() + 2
+    painter.setFont(_font(font_size, bold=True))
+    tw, th = _text_extent(label, font_size, bold=True)
+    tw, th = tw + 6, th + 2
     rect = QRectF(mx - tw / 2, my - th / 2, tw, th)
-    painter.fillRect(rect, QColor(250, 250, 250, 210))
-    painter.setPen(QPen(color, 0.8))
+    painter.fillRect(rect, _C_LABEL_BG)
+    painter.setPen(_pen(color.rgba(), 0.8))
     painter.drawRect(rect)
     painter.setPen(color)
     painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, label)
@@ -120,21 +242,18 @@ def _callout(
 ) -> None:
     """Leader line from tip to label box."""
     lx, ly = tip_x + dx, tip_y + dy
-    painter.setPen(QPen(color, 1.2))
+    painter.setPen(_pen(color.rgba(), 1.2))
     painter.drawLine(QLineF(tip_x, tip_y, lx, ly))
     _arrowhead(painter, tip_x, tip_y, math.atan2(tip_y - ly, tip_x - lx), color, size=6)
 
-    f = QFont()
-    f.setPointSize(font_size)
-    f.setBold(True)
-    painter.setFont(f)
-    fm = painter.fontMetrics()
-    tw, th = fm.horizontalAdvance(label) + 8, fm.height() + 4
+    painter.setFont(_font(font_size, bold=True))
+    tw, th = _text_extent(label, font_size, bold=True)
+    tw, th = tw + 8, th + 4
     bx = lx + 2 if dx >= 0 else lx - tw - 2
     by = ly - th / 2
     rect = QRectF(bx, by, tw, th)
-    painter.fillRect(rect, QColor(255, 250, 230, 230))
-    painter.setPen(QPen(color, 0.8))
+    painter.fillRect(rect, _C_CALLOUT_BG)
+    painter.setPen(_pen(color.rgba(), 0.8))
     painter.drawRect(rect)
     painter.setPen(color)
     painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, label)
@@ -144,6 +263,92 @@ def _callout(
 # Dynamic diagram: Placa Base top view
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=256)
+def _hole_centers(
+    patron: str, largo: float, ancho: float, e: float
+) -> tuple[tuple[float, float], ...]:
+    """
+    Hole centers in model coordinates (mm) for a hole pattern. Memoized:
+    resizes re-lay out the same plate, and only the pixel mapping changes.
+    Callers pass dimensions rounded to 0.1 mm (far below a pixel at any
+    diagram scale), so near-identical values share one entry.
+    """
+    if patron == "rectangular_6":
+        return ((e, e), (largo - e, e), (e, ancho - e), (largo - e, ancho - e),
+                (largo / 2, e), (largo / 2, ancho - e))
+    if patron == "lineal_2":
+        return ((e, ancho / 2), (largo - e, ancho / 2))
+    # rectangular_4, and personalizado fallback
+    return ((e, e), (largo - e, e), (e, ancho - e), (largo - e, ancho - e))
+
+
+@dataclass(slots=True)
+class _Geom:
+    """
+    Plate geometry for one paint, in widget pixels: values read and scaled
+    once, shared by the slot, hole, annotation and passive-dimension passes.
+    """
+    px: float               # plate rect
+    py: float
+    pw: float
+    ph: float
+    scale: float            # px per mm
+    largo: float            # mm
+    ancho: float
+    e: float
+    d: float
+    r_px: float             # hole radius
+    holes: list[QPointF]    # hole centers; empty for patron "none"
+    holes_path: QPainterPath  # all holes as one path: a single draw call
+    tiene: bool
+    aw: float               # slot width / length, mm
+    lr: float
+    slot_x: float           # slot rect (x, w, h); y is the top/bottom edge
+    slot_w: float
+    slot_h: float
+    slots_path: QPainterPath  # both slot rects: a single draw call
+
+    @classmethod
+    def build(cls, values: dict, W: int, H: int) -> _Geom:
+        largo = float(values.get("largo", 300))
+        ancho = float(values.get("ancho", 200))
+
+        pad = 52
+        scale = min((W - 2 * pad) / largo, (H - 2 * pad) / ancho)
+        pw = largo * scale
+        ph = ancho * scale
+        px = (W - pw) / 2
+        py = (H - ph) / 2
+
+        e = float(values.get("margen_perforacion", 30))
+        d = float(values.get("diametro_perforacion", 18))
+        patron = values.get("patron_perforaciones", "none")
+        holes = [] if patron == "none" else [
+            QPointF(px + cx * scale, py + cy * scale)
+            for cx, cy in _hole_centers(
+                patron, round(largo, 1), round(ancho, 1), round(e, 1)
+            )
+        ]
+
+        r_px = d / 2 * scale
+        holes_path = QPainterPath()
+        for center in holes:
+            holes_path.addEllipse(center, r_px, r_px)
+
+        aw = float(values.get("ancho_ranura", 12))
+        lr = float(values.get("largo_ranura", 40))
+        slot_x, slot_w, slot_h = px + (largo - lr) / 2 * scale, lr * scale, aw * scale
+        slots_path = QPainterPath()
+        for sy in (py, py + ph - slot_h):
+            slots_path.addRect(QRectF(slot_x, sy, slot_w, slot_h))
+        return cls(
+            px=px, py=py, pw=pw, ph=ph, scale=scale, largo=largo, ancho=ancho,
+            e=e, d=d, r_px=r_px, holes=holes, holes_path=holes_path,
+            tiene=bool(values.get("tiene_ranuras", False)), aw=aw, lr=lr,
+            slot_x=slot_x, slot_w=slot_w, slot_h=slot_h, slots_path=slots_path,
+        )
+
+
 class _BasePlateDiagram(QWidget):
     """QPainter-based top-view diagram of the Placa Base."""
 
@@ -151,10 +356,19 @@ class _BasePlateDiagram(QWidget):
         super().__init__(parent)
         self._values: dict = {}
         self._active: Optional[str] = None
+        # Last rendered diagram; repaints with the same state and size
+        # (expose, focus, overlapping windows) are a single blit
+        self._cache_key: Optional[tuple] = None
+        self._cache_pix: Optional[QPixmap] = None
+        # paintEvent covers every pixel, so Qt can skip erasing the background
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground, True)
         self.setMinimumSize(260, 220)
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
 
     def update_state(self, active: Optional[str], values: dict) -> None:
+        if active == self._active and values == self._values:
+            return
         self._active = active
         self._values = values
         self.update()
@@ -162,122 +376,96 @@ class _BasePlateDiagram(QWidget):
     # -------------------------------------------------------
 
     def paintEvent(self, event) -> None:  # noqa: N802
+        rect = event.rect()
         if not self._values:
+            painter = QPainter(self)
+            painter.fillRect(rect, _C_BG)
+            painter.end()
             return
+        dpr = self.devicePixelRatioF()
+        key = (self._active, self.width(), self.height(), tuple(self._values.items()))
+        if key != self._cache_key:
+            pix = QPixmap(round(self.width() * dpr), round(self.height() * dpr))
+            pix.setDevicePixelRatio(dpr)
+            pix_painter = QPainter(pix)
+            pix_painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            self._paint(pix_painter)   # fills the whole area: no transparency needed
+            pix_painter.end()
+            self._cache_key, self._cache_pix = key, pix
+        # Blit only the exposed part; the source rect is in device pixels
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        self._paint(painter)
+        painter.drawPixmap(
+            QRectF(rect), self._cache_pix,
+            QRectF(rect.x() * dpr, rect.y() * dpr,
+                   rect.width() * dpr, rect.height() * dpr),
+        )
         painter.end()
 
     def _paint(self, painter: QPainter) -> None:
         W, H = self.width(), self.height()
-        largo = float(self._values.get("largo", 300))
-        ancho = float(self._values.get("ancho", 200))
-
-        pad = 52
-        scale = min((W - 2 * pad) / largo, (H - 2 * pad) / ancho)
-        pw = largo * scale
-        ph = ancho * scale
-        px = (W - pw) / 2
-        py = (H - ph) / 2
+        g = _Geom.build(self._values, W, H)
 
         painter.fillRect(0, 0, W, H, _C_BG)
 
         # Plate
-        painter.setBrush(QBrush(_C_PLATE))
-        painter.setPen(QPen(_C_PLATE_OUT, 2.0))
-        painter.drawRect(QRectF(px, py, pw, ph))
+        painter.setBrush(_BRUSH_PLATE)
+        painter.setPen(_PEN_PLATE)
+        painter.drawRect(QRectF(g.px, g.py, g.pw, g.ph))
 
         # Slots (if active)
-        tiene = bool(self._values.get("tiene_ranuras", False))
-        if tiene:
-            self._paint_slots(painter, px, py, pw, ph, scale, largo, ancho)
+        if g.tiene:
+            self._paint_slots(painter, g)
 
         # Holes
-        patron = self._values.get("patron_perforaciones", "none")
-        if patron != "none":
-            self._paint_holes(painter, px, py, scale, largo, ancho, patron)
+        if g.holes:
+            self._paint_holes(painter, g)
 
         # Active annotation
         if self._active:
-            self._paint_annotation(painter, px, py, pw, ph, scale, largo, ancho)
+            self._paint_annotation(painter, g)
 
         # Passive dimensions (always shown, lighter)
-        self._paint_passive(painter, px, py, pw, ph, largo, ancho)
-
-    # ---- Hole positions (model coords) ----
-
-    def _hole_pos(self, patron, largo, ancho, e, d):
-        if patron == "rectangular_4":
-            return [(e, e), (largo - e, e), (e, ancho - e), (largo - e, ancho - e)]
-        if patron == "rectangular_6":
-            return [(e, e), (largo - e, e), (e, ancho - e), (largo - e, ancho - e),
-                    (largo / 2, e), (largo / 2, ancho - e)]
-        if patron == "lineal_2":
-            return [(e, ancho / 2), (largo - e, ancho / 2)]
-        # personalizado fallback
-        return [(e, e), (largo - e, e), (e, ancho - e), (largo - e, ancho - e)]
+        self._paint_passive(painter, g)
 
     # ---- Slots ----
 
-    def _paint_slots(self, painter, px, py, pw, ph, scale, largo, ancho):
-        aw = float(self._values.get("ancho_ranura", 12))
-        lr = float(self._values.get("largo_ranura", 40))
-        active = self._active
-
-        if active in ("tiene_ranuras", "ancho_ranura", "largo_ranura"):
-            fill = QColor("#FFF3E0")
-            pen  = QPen(_C_ANNOT, 1.8)
-        else:
-            fill = _C_SLOT
-            pen  = QPen(_C_SLOT_OUT, 1.2)
-
-        painter.setBrush(QBrush(fill))
+    def _paint_slots(self, painter: QPainter, g: _Geom) -> None:
+        brush, pen = _SLOT_STYLE[
+            self._active in ("tiene_ranuras", "ancho_ranura", "largo_ranura")
+        ]
+        painter.setBrush(brush)
         painter.setPen(pen)
-        sx = px + (largo - lr) / 2 * scale
-        for sy in [py, py + ph - aw * scale]:
-            painter.drawRect(QRectF(sx, sy, lr * scale, aw * scale))
+        painter.drawPath(g.slots_path)
 
     # ---- Holes ----
 
-    def _paint_holes(self, painter, px, py, scale, largo, ancho, patron):
-        e = float(self._values.get("margen_perforacion", 30))
-        d = float(self._values.get("diametro_perforacion", 18))
-        r = d / 2 * scale
-        active = self._active
-
-        if active in ("diametro_perforacion", "patron_perforaciones"):
-            fill = QColor("#FFF9C4");  pen = QPen(_C_ANNOT, 1.8)
-        elif active == "margen_perforacion":
-            fill = QColor("#E3F2FD");  pen = QPen(_C_DIM, 1.5)
-        else:
-            fill = _C_HOLE;            pen = QPen(_C_HOLE_OUT, 1.2)
-
-        painter.setBrush(QBrush(fill))
+    def _paint_holes(self, painter: QPainter, g: _Geom) -> None:
+        brush, pen = _HOLE_STYLE.get(self._active, _HOLE_STYLE[None])
+        painter.setBrush(brush)
         painter.setPen(pen)
-        for cx_m, cy_m in self._hole_pos(patron, largo, ancho, e, d):
-            painter.drawEllipse(QPointF(px + cx_m * scale, py + cy_m * scale), r, r)
+        painter.drawPath(g.holes_path)
 
     # ---- Active annotation ----
 
-    def _paint_annotation(self, painter, px, py, pw, ph, scale, largo, ancho):
+    def _paint_annotation(self, painter: QPainter, g: _Geom) -> None:
         v = self._values
         p = self._active
-        painter.save()
+        px, py, pw, ph = g.px, g.py, g.pw, g.ph
+        # Only pen, brush and font change below: restore just those rather
+        # than snapshotting the whole painter state with save()/restore()
+        saved_pen, saved_brush, saved_font = painter.pen(), painter.brush(), painter.font()
 
         if p == "largo":
-            val = float(v.get("largo", 300))
             _dim_arrow(painter, px, py + ph + 26, px + pw, py + ph + 26,
-                       f"L = {val:.0f} mm", _C_ANNOT, font_size=10)
-            painter.setPen(QPen(_C_ANNOT, 2.5, Qt.PenStyle.DashLine))
+                       f"L = {g.largo:.0f} mm", _C_ANNOT, font_size=10)
+            painter.setPen(_PEN_ANNOT_DASH)
             painter.drawLine(QLineF(px, py, px + pw, py))
             painter.drawLine(QLineF(px, py + ph, px + pw, py + ph))
 
         elif p == "ancho":
-            val = float(v.get("ancho", 200))
             _dim_arrow(painter, px - 26, py, px - 26, py + ph,
-                       f"W = {val:.0f} mm", _C_ANNOT, font_size=10)
-            painter.setPen(QPen(_C_ANNOT, 2.5, Qt.PenStyle.DashLine))
+                       f"W = {g.ancho:.0f} mm", _C_ANNOT, font_size=10)
+            painter.setPen(_PEN_ANNOT_DASH)
             painter.drawLine(QLineF(px, py, px, py + ph))
             painter.drawLine(QLineF(px + pw, py, px + pw, py + ph))
 
@@ -286,37 +474,25 @@ class _BasePlateDiagram(QWidget):
             # Corner cross-section hint
             inset = 16
             ex, ey = px + pw, py
-            painter.setPen(QPen(_C_ANNOT, 2.0))
+            painter.setPen(_PEN_ANNOT)
             painter.drawLine(QLineF(ex - inset, ey, ex + 12, ey - 12))
-            painter.drawLine(QLineF(ex + 12, ey - 12, ex + 12, ey - 12 - t * scale * 0.4))
+            painter.drawLine(QLineF(ex + 12, ey - 12, ex + 12, ey - 12 - t * g.scale * 0.4))
             _callout(painter, ex + 12, ey - 12, f"t = {t:.0f} mm",
                      _C_ANNOT, dx=14, dy=-8)
 
         elif p == "diametro_perforacion":
-            patron = v.get("patron_perforaciones", "none")
-            if patron != "none":
-                e = float(v.get("margen_perforacion", 30))
-                d = float(v.get("diametro_perforacion", 18))
-                r = d / 2 * scale
-                pos = self._hole_pos(patron, largo, ancho, e, d)
-                if pos:
-                    cx = px + pos[0][0] * scale
-                    cy = py + pos[0][1] * scale
-                    _dim_arrow(painter, cx - r, cy, cx + r, cy,
-                                f"d = {d:.0f} mm", _C_ANNOT, offset=-(r + 10))
+            if g.holes:
+                r = g.r_px
+                cx, cy = g.holes[0].x(), g.holes[0].y()
+                _dim_arrow(painter, cx - r, cy, cx + r, cy,
+                            f"d = {g.d:.0f} mm", _C_ANNOT, offset=-(r + 10))
 
         elif p == "margen_perforacion":
-            patron = v.get("patron_perforaciones", "none")
-            if patron != "none":
-                e = float(v.get("margen_perforacion", 30))
-                d = float(v.get("diametro_perforacion", 18))
-                pos = self._hole_pos(patron, largo, ancho, e, d)
-                if pos:
-                    cx = px + pos[0][0] * scale
-                    cy = py + pos[0][1] * scale
-                    # Arrow from left edge to hole center
-                    _dim_arrow(painter, px, cy, cx, cy,
-                                f"e = {e:.0f} mm", _C_ANNOT)
+            if g.holes:
+                cx, cy = g.holes[0].x(), g.holes[0].y()
+                # Arrow from left edge to hole center
+                _dim_arrow(painter, px, cy, cx, cy,
+                            f"e = {g.e:.0f} mm", _C_ANNOT)
 
         elif p == "patron_perforaciones":
             labels = {"none": "Sin agujeros", "rectangular_4": "4 agujeros",
@@ -326,26 +502,20 @@ class _BasePlateDiagram(QWidget):
             self._center_badge(painter, px, py, pw, ph, f"Patrón: {val}")
 
         elif p == "tiene_ranuras":
-            tiene = bool(v.get("tiene_ranuras", False))
             self._center_badge(painter, px, py, pw, ph,
-                               "Ranuras: SÍ" if tiene else "Ranuras: NO")
+                               "Ranuras: SÍ" if g.tiene else "Ranuras: NO")
 
         elif p == "ancho_ranura":
-            tiene = bool(v.get("tiene_ranuras", False))
-            if tiene:
-                aw = float(v.get("ancho_ranura", 12))
-                lr = float(v.get("largo_ranura", 40))
-                sx = px + (largo - lr) / 2 * scale
-                _dim_arrow(painter, sx - 16, py, sx - 16, py + aw * scale,
-                           f"ar = {aw:.0f} mm", _C_ANNOT)
+            if g.tiene:
+                sx = g.slot_x
+                _dim_arrow(painter, sx - 16, py, sx - 16, py + g.slot_h,
+                           f"ar = {g.aw:.0f} mm", _C_ANNOT)
 
         elif p == "largo_ranura":
-            tiene = bool(v.get("tiene_ranuras", False))
-            if tiene:
-                lr = float(v.get("largo_ranura", 40))
-                sx = px + (largo - lr) / 2 * scale
-                _dim_arrow(painter, sx, py - 16, sx + lr * scale, py - 16,
-                           f"lr = {lr:.0f} mm", _C_ANNOT)
+            if g.tiene:
+                sx = g.slot_x
+                _dim_arrow(painter, sx, py - 16, sx + g.slot_w, py - 16,
+                           f"lr = {g.lr:.0f} mm", _C_ANNOT)
 
         elif p in ("material", "acabado_superficial"):
             label_map = {
@@ -359,45 +529,43 @@ class _BasePlateDiagram(QWidget):
             prefix = "Mat:" if p == "material" else "Acab:"
             self._center_badge(painter, px, py, pw, ph, f"{prefix} {friendly}")
 
-        painter.restore()
+        painter.setPen(saved_pen)
+        painter.setBrush(saved_brush)
+        painter.setFont(saved_font)
 
     @staticmethod
     def _center_badge(painter, px, py, pw, ph, text, font_size=10):
-        f = QFont()
-        f.setPointSize(font_size)
-        f.setBold(True)
-        painter.setFont(f)
-        fm = painter.fontMetrics()
-        tw, th = fm.horizontalAdvance(text) + 14, fm.height() + 8
+        painter.setFont(_font(font_size, bold=True))
+        tw, th = _text_extent(text, font_size, bold=True)
+        tw, th = tw + 14, th + 8
         rect = QRectF(px + pw / 2 - tw / 2, py + ph / 2 - th / 2, tw, th)
-        painter.fillRect(rect, QColor(255, 248, 220, 220))
-        painter.setPen(QPen(_C_ANNOT, 1.0))
+        painter.fillRect(rect, _C_BADGE_BG)
+        painter.setPen(_PEN_BADGE)
         painter.drawRect(rect)
         painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, text)
 
     # ---- Passive dimension labels ----
 
-    def _paint_passive(self, painter, px, py, pw, ph, largo, ancho):
-        painter.setPen(QColor("#90A4AE"))
-        f = QFont()
-        f.setPointSize(8)
-        painter.setFont(f)
+    def _paint_passive(self, painter: QPainter, g: _Geom) -> None:
+        px, py, pw, ph = g.px, g.py, g.pw, g.ph
+        painter.setPen(_C_PASSIVE)
+        painter.setFont(_font(8))
         if self._active != "largo":
             painter.drawText(
                 QRectF(px, py + ph + 4, pw, 16),
                 Qt.AlignmentFlag.AlignCenter,
-                f"L = {largo:.0f} mm",
+                f"L = {g.largo:.0f} mm",
             )
         if self._active != "ancho":
-            painter.save()
+            saved_tf = painter.transform()
             painter.translate(px - 12, py + ph / 2)
             painter.rotate(-90)
             painter.drawText(
                 QRectF(-36, -8, 72, 16),
                 Qt.AlignmentFlag.AlignCenter,
-                f"W = {ancho:.0f} mm",
+                f"W = {g.ancho:.0f} mm",
             )
-            painter.restore()
+            painter.setTransform(saved_tf)
 
 
 # ---------------------------------------------------------------------------
@@ -415,6 +583,14 @@ class SchematicViewer(QWidget):
         self._piece_code: Optional[str] = None
         self._active_param: Optional[str] = None
         self._values: dict = {}
+        # (piece, param, values) last shown; _refresh is a no-op while it holds
+        self._last_key: Optional[tuple] = None
+        self._static_index = _scan_static(settings.project_root)
+        # Static image on display, and images being decoded off-thread
+        self._static_path: Optional[Path] = None
+        self._loading: set[str] = set()
+        # Scaled copies of the decoded images per label size
+        self._scaled_cache: dict[tuple[Path, int, int, int], QPixmap] = {}
         self._build_ui()
         self.setMinimumWidth(250)
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
@@ -429,12 +605,12 @@ class SchematicViewer(QWidget):
     ) -> None:
         self._piece_code = piece_code
         self._active_param = param_name
-        self._values = values
+        self._values = dict(values)
         self._refresh()
 
     def set_values(self, values: dict) -> None:
         """Refresh diagram with updated values, keeping active param."""
-        self._values = values
+        self._values = dict(values)
         if self._piece_code:
             self._refresh()
 
@@ -449,10 +625,7 @@ class SchematicViewer(QWidget):
 
         # Title bar
         self._title_lbl = QLabel("Esquema")
-        f = QFont()
-        f.setBold(True)
-        f.setPointSize(10)
-        self._title_lbl.setFont(f)
+        self._title_lbl.setFont(_font(10, bold=True))
         self._title_lbl.setContentsMargins(10, 7, 10, 5)
         self._title_lbl.setStyleSheet(
             "background-color: #ECEFF1; border-bottom: 1px solid #CFD8DC;"
@@ -484,17 +657,38 @@ class SchematicViewer(QWidget):
         self._info_lbl.setWordWrap(True)
         layout.addWidget(self._info_lbl)
 
+    # ------------------------------------------------------------------
+    # Events
+    # ------------------------------------------------------------------
+
+    def resizeEvent(self, event) -> None:  # noqa: N802
+        super().resizeEvent(event)
+        # The layout has already resized the label: copies scaled for any
+        # other size will not be asked for again
+        size = self._static_lbl.size()
+        for key in [k for k in self._scaled_cache
+                    if (k[1], k[2]) != (size.width(), size.height())]:
+            del self._scaled_cache[key]
+
     # ------------------------------------------------------------------
     # Internal
     # ------------------------------------------------------------------
 
     def _refresh(self) -> None:
+        # Synchronous: the parameter page already coalesces the calls that
+        # reach set_values/set_parameter.
+        # Keystrokes and focus changes often repeat the state already shown;
+        # values are our own copy, so the key cannot go stale under us.
+        key = (self._piece_code, self._active_param, tuple(self._values.items()))
+        if key == self._last_key:
+            return
+        self._last_key = key
+
         # Update title
         piece = catalog.get_piece(self._piece_code) if self._piece_code else None
-        param_spec = next(
-            (p for p in (piece.parameters if piece else [])
-             if p.name == self._active_param),
-            None,
+        param_spec = (
+            piece.get_parameter(self._active_param)
+            if piece and self._active_param else None
         )
         if param_spec:
             unit = f"  [{param_spec.unit}]" if param_spec.unit else ""
@@ -509,13 +703,14 @@ class SchematicViewer(QWidget):
 
         # Static image override?
         static = self._find_static_image()
+        self._static_path = static
         if static:
-            pix = QPixmap(str(static))
-            self._static_lbl.setPixmap(
-                pix.scaled(self._static_lbl.size(),
-                           Qt.AspectRatioMode.KeepAspectRatio,
-                           Qt.TransformationMode.SmoothTransformation)
-            )
+            scaled = self._scaled_pixmap(static)
+            if scaled is None:
+                self._static_lbl.clear()
+                self._load_image(static)
+            else:
+                self._static_lbl.setPixmap(scaled)
             self._diagram.hide()
             self._static_lbl.show()
         else:
@@ -529,14 +724,45 @@ class SchematicViewer(QWidget):
     def _find_static_image(self) -> Optional[Path]:
         if not self._piece_code or not self._active_param:
             return None
-        assets = (
-            settings.project_root / "cad_generator" / "assets" / "schematics"
-        )
-        for ext in (".png", ".jpg", ".jpeg"):
-            p = assets / self._piece_code / f"{self._active_param}{ext}"
-            if p.exists():
-                return p
-        return None
+        return self._static_index.get((self._piece_code, self._active_param))
+
+    def _load_image(self, path: Path) -> None:
+        if str(path) in self._loading:
+            return
+        self._loading.add(str(path))
+        runnable = _ImageLoadRunnable(path)
+        runnable.signals.finished.connect(self._on_image_loaded)
+        QThreadPool.globalInstance().start(runnable)
+
+    def _on_image_loaded(self, path: str, image: QImage) -> None:
+        self._loading.discard(path)
+        pix = QPixmap.fromImage(image)
+        QPixmapCache.insert(path, pix)
+        if self._static_path is not None and str(self._static_path) == path:
+            self._static_lbl.setPixmap(self._scaled_pixmap(self._static_path, pix))
+
+    def _scaled_pixmap(
+        self, path: Path, pix: Optional[QPixmap] = None
+    ) -> Optional[QPixmap]:
+        """Image at *path* fitted to the label, or None if not decoded yet."""
+        size = self._static_lbl.size()
+        dpr = self.devicePixelRatioF()
+        key = (path, size.width(), size.height(), round(dpr * 100))
+        scaled = self._scaled_cache.get(key)
+        if scaled is None:
+            if pix is None:
+                pix = QPixmapCache.find(str(path))
+                if pix is None:
+                    return None
+            # Resampled at device resolution, so HiDPI screens get full detail
+            scaled = pix.scaled(size * dpr,
+                                Qt.AspectRatioMode.KeepAspectRatio,
+                                Qt.TransformationMode.SmoothTransformation)
+            scaled.setDevicePixelRatio(dpr)
+            if len(self._scaled_cache) >= _SCALED_CACHE_SIZE:
+                del self._scaled_cache[next(iter(self._scaled_cache))]
+            self._scaled_cache[key] = scaled
+        return scaled
 
     @staticmethod
     def _format_info(spec, values: dict) -> str:
@@ -2,32 +2,96 @@
 Application entry point.
 
 Responsibilities:
-  1. Initialize the database (create tables, seed piece catalog).
-  2. Create and show the main window.
-  3. Start the Qt event loop.
+  1. Create the QApplication and show a splash screen.
+  2. On a pool thread: initialize the database (create tables, seed piece
+     catalog) and optionally JIT-compile the validation rules
+     (settings.validation_jit).
+  3. When that finishes, create and show the main window.
+  4. Run the Qt event loop.
 
 Keep this file minimal. All initialization logic belongs in its respective module.
 """
 
 import sys
+from typing import Optional
 
-from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QObject, QRunnable, Qt, QThreadPool, pyqtSignal
+from PyQt6.QtGui import QColor, QPixmap, QPixmapCache
+from PyQt6.QtWidgets import QApplication, QMessageBox, QSplashScreen
 
+from cad_generator.config.catalog_loader import catalog
 from cad_generator.config.settings import settings
+from cad_generator.core.validation_engine import ValidationEngine
 from cad_generator.data.database import init_db
 from cad_generator.gui.main_window import MainWindow
 
 
-def main() -> int:
-    # Initialize database before creating the GUI
-    init_db()
+class _StartupSignals(QObject):
+    # QRunnable is not a QObject, so its signals live on a companion object
+    finished = pyqtSignal(object)   # None, or the exception that aborted startup
+
+
+class _StartupRunnable(QRunnable):
+    """Database initialization (and rule JIT warm-up) off the GUI thread."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.signals = _StartupSignals()
+
+    def run(self) -> None:
+        try:
+            init_db()
+            if settings.validation_jit:
+                # Pay numba's compile latency here rather than on the first keystroke
+                engine = ValidationEngine(jit=True)
+                for piece in catalog.get_all_pieces():
+                    engine.warmup(
+                        catalog.get_compiled_rules(piece.code), piece.get_defaults()
+                    )
+        except Exception as exc:  # reported on the GUI thread
+            self.signals.finished.emit(exc)
+        else:
+            self.signals.finished.emit(None)
 
+
+def main() -> int:
     app = QApplication(sys.argv)
     app.setApplicationName(settings.app_name)
     app.setApplicationVersion(settings.app_version)
+    # Shared by the decoded schematic images (KB; Qt's default is 10 MB)
+    QPixmapCache.setCacheLimit(65536)
+
+    # Something on screen at once; the main window needs the database, so
+    # it is only built when initialization has finished
+    pixmap = QPixmap(360, 120)
+    pixmap.fill(QColor("#ECEFF1"))
+    splash = QSplashScreen(pixmap)
+    splash.showMessage(
+        f"{settings.app_name} {settings.app_version}\n\nInicializando base de datos…",
+        Qt.AlignmentFlag.AlignCenter,
+    )
+    splash.show()
+    app.processEvents()
+
+    window: Optional[MainWindow] = None
+
+    def on_started(error: Optional[Exception]) -> None:
+        nonlocal window
+        if error is not None:
+            splash.close()
+            QMessageBox.critical(
+                None, "Error de inicio",
+                f"No se pudo inicializar la base de datos:\n{error}",
+            )
+            app.exit(1)
+            return
+        window = MainWindow()
+        window.show()
+        splash.finish(window)
 
-    window = MainWindow()
-    window.show()
+    startup = _StartupRunnable()
+    startup.signals.finished.connect(on_started)
+    QThreadPool.globalInstance().start(startup)
 
     return app.exec()
 
@@ -2,45 +2,115 @@
 pytest fixtures shared across all tests.
 
 Uses an in-memory SQLite database for fast, isolated test runs.
-Each test function gets a fresh database with seeded piece types.
+The schema is built once per run into a template file, which every
+(xdist worker) session copies into its in-memory database; each test runs
+inside an outer transaction on one connection that is rolled back at
+teardown, so every test still starts from an empty database.
 """
 
+import os
+import sqlite3
 from datetime import datetime, timezone
 
 import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
 
 from cad_generator.data.models import Base, PieceType
 
 
-@pytest.fixture(scope="function")
-def db_engine():
-    """In-memory SQLite engine, fresh per test function."""
+@pytest.fixture(scope="session")
+def schema_template(tmp_path_factory):
+    """
+    Path of an SQLite file holding the empty schema, built once per run.
+    xdist workers share it through their common base temp directory; a
+    worker that finds no file builds one and renames it into place, so a
+    reader never sees a half-written template.
+    """
+    root = tmp_path_factory.getbasetemp()
+    if os.environ.get("PYTEST_XDIST_WORKER"):
+        root = root.parent      # this run's directory, shared by all workers
+    path = root / "schema_template.sqlite"
+    if not path.exists():
+        partial = path.with_name(f"{path.name}.{os.getpid()}")
+        engine = create_engine(f"sqlite:///{partial}")
+        Base.metadata.create_all(engine)
+        engine.dispose()
+        os.replace(partial, path)
+    return path
+
+
+@pytest.fixture(scope="session")
+def db_engine(schema_template):
+    """
+    In-memory SQLite engine loaded from schema_template: an sqlite3 page
+    copy instead of running the DDL again in every session.
+    StaticPool hands every checkout the same connection, and so the same
+    database, from any thread; the default pool gives each thread its own
+    connection and hence an empty, schema-less database.
+    """
     engine = create_engine(
         "sqlite:///:memory:",
         connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
     )
-    Base.metadata.create_all(engine)
+
+    # Same transaction handling as cad_generator.data.database: without it
+    # the sqlite3 module delimits transactions itself and SAVEPOINTs break.
+    @event.listens_for(engine, "connect")
+    def _autocommit_driver(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _begin_transaction(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    raw = engine.raw_connection()
+    template = sqlite3.connect(schema_template)
+    try:
+        template.backup(raw.driver_connection)
+    finally:
+        template.close()
+        raw.close()     # back to the pool; StaticPool keeps it open
     yield engine
-    Base.metadata.drop_all(engine)
     engine.dispose()
 
 
 @pytest.fixture(scope="function")
-def db_session(db_engine):
-    """Transactional session; rolls back after each test."""
-    SessionFactory = sessionmaker(bind=db_engine)
-    session = SessionFactory()
+def db_connection(db_engine):
+    """
+    Connection holding an outer transaction that is rolled back after the
+    test. Sessions bound to it with join_transaction_mode="create_savepoint"
+    see each other's commits, which act on SAVEPOINTs only.
+    """
+    conn = db_engine.connect()
+    trans = conn.begin()
+    yield conn
+    trans.rollback()
+    conn.close()
+
+
+@pytest.fixture(scope="function")
+def db_session(db_connection):
+    """
+    Session on the test's rolled-back connection. expire_on_commit=False as
+    in the application's session factory (data/database.py), so reading
+    attributes after commit() does not reload them with extra SELECTs.
+    """
+    session = Session(
+        bind=db_connection,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
     yield session
-    session.rollback()
     session.close()
 
 
 @pytest.fixture(scope="function")
 def seeded_session(db_session):
     """Session with one PieceType (base_plate) pre-loaded."""
-    now = datetime.now(timezone.utc).isoformat()
+    now = datetime.now(timezone.utc)
     pt = PieceType(
         code="base_plate",
         display_name="Placa Base Estructural",
@@ -54,4 +124,11 @@ def seeded_session(db_session):
     )
     db_session.add(pt)
     db_session.commit()
+    db_session.info["base_plate_id"] = pt.id
     yield db_session
+
+
+@pytest.fixture(scope="function")
+def base_plate_id(seeded_session) -> int:
+    """Primary key of the PieceType seeded by seeded_session (no query)."""
+    return seeded_session.info["base_plate_id"]
@@ -0,0 +1,177 @@
+"""
+Tests for CatalogLoader.
+No database needed — each test loads a private copy of the real catalog.
+"""
+
+import json
+import os
+import shutil
+
+import pytest
+
+from cad_generator.config.catalog_loader import CatalogLoader
+from cad_generator.config.settings import settings
+from cad_generator.core.validation_engine import ValidationEngine
+
+
+@pytest.fixture
+def catalog_copy(tmp_path):
+    """Copy of piece_catalog.json in tmp_path, so cache files stay private."""
+    path = tmp_path / "piece_catalog.json"
+    shutil.copyfile(settings.catalog_path, path)
+    return path
+
+
+def _rename_base_plate(path):
+    """Rewrite the catalog with a new display name and a newer mtime."""
+    text = path.read_text(encoding="utf-8")
+    path.write_text(
+        text.replace('"Placa Base Estructural"', '"Placa Renombrada"', 1),
+        encoding="utf-8",
+    )
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+
+# ---------------------------------------------------------------------------
+# Basic access
+# ---------------------------------------------------------------------------
+
+class TestCatalogAccess:
+
+    def test_base_plate_present(self, catalog_copy):
+        piece = CatalogLoader(catalog_copy).get_piece("base_plate")
+        assert piece is not None
+        assert piece.get_parameter("espesor").type == "float"
+
+    def test_get_parameter_by_name(self, catalog_copy):
+        piece = CatalogLoader(catalog_copy).get_piece("base_plate")
+        for spec in piece.parameters:
+            assert piece.get_parameter(spec.name) is spec
+        assert piece.get_parameter("nope") is None
+
+    def test_unknown_piece_returns_none(self, catalog_copy):
+        assert CatalogLoader(catalog_copy).get_piece("nope") is None
+
+    def test_validation_rules_are_raw_dicts(self, catalog_copy):
+        rules = CatalogLoader(catalog_copy).get_validation_rules("base_plate")
+        assert rules
+        assert {"rule_id", "expression", "severity", "message"} <= rules[0].keys()
+
+    def test_compiled_rules_built_once(self, catalog_copy):
+        loader = CatalogLoader(catalog_copy)
+        rules = loader.get_compiled_rules("base_plate")
+        assert [r.rule_id for r in rules] == [
+            r["rule_id"] for r in loader.get_validation_rules("base_plate")
+        ]
+        assert loader.get_compiled_rules("base_plate") is rules
+
+    def test_default_validation_built_once(self, catalog_copy, monkeypatch):
+        calls = []
+        validate = ValidationEngine.validate
+
+        def counting_validate(self, *args, **kwargs):
+            calls.append(args)
+            return validate(self, *args, **kwargs)
+
+        monkeypatch.setattr(ValidationEngine, "validate", counting_validate)
+        loader = CatalogLoader(catalog_copy)
+        defaults, result = loader.get_default_validation("base_plate")
+        piece = loader.get_piece("base_plate")
+        assert defaults == {p.name: p.default for p in piece.parameters}
+        assert result.is_valid
+        assert loader.get_default_validation("base_plate") == (defaults, result)
+        assert len(calls) == 1
+
+    def test_default_validation_returns_copies(self, catalog_copy):
+        loader = CatalogLoader(catalog_copy)
+        defaults, result = loader.get_default_validation("base_plate")
+        defaults["espesor"] = 1.0
+        result.messages.append(None)
+
+        again_defaults, again_result = loader.get_default_validation("base_plate")
+        assert again_defaults["espesor"] != 1.0
+        assert again_result.messages == []
+
+
+# ---------------------------------------------------------------------------
+# Lazy per-piece parsing
+# ---------------------------------------------------------------------------
+
+class TestLazyParsing:
+
+    @pytest.fixture
+    def two_piece_catalog(self, catalog_copy):
+        raw = json.loads(catalog_copy.read_text(encoding="utf-8"))
+        raw["pieces"].append({**raw["pieces"][0], "code": "other_plate"})
+        catalog_copy.write_text(json.dumps(raw), encoding="utf-8")
+        return catalog_copy
+
+    def test_get_piece_parses_only_that_piece(self, two_piece_catalog):
+        loader = CatalogLoader(two_piece_catalog)
+        loader.get_piece("other_plate")
+        assert list(loader._pieces) == ["other_plate"]
+
+    def test_iter_pieces_sorted_parses_nothing(self, two_piece_catalog):
+        loader = CatalogLoader(two_piece_catalog)
+        rows = list(loader.iter_pieces_sorted())
+        assert [r[3] for r in rows] == ["base_plate", "other_plate"]
+        assert rows == sorted(rows)
+        assert loader._pieces == {}
+
+    def test_get_all_pieces_keeps_catalog_order(self, two_piece_catalog):
+        loader = CatalogLoader(two_piece_catalog)
+        loader.get_piece("other_plate")
+        codes = [p.code for p in loader.get_all_pieces()]
+        assert codes == ["base_plate", "other_plate"]
+
+
+# ---------------------------------------------------------------------------
+# Parsed-catalog pickle cache
+# ---------------------------------------------------------------------------
+
+class TestCatalogCache:
+
+    def test_cache_file_written_on_first_load(self, catalog_copy):
+        CatalogLoader(catalog_copy).get_all_pieces()
+        assert catalog_copy.with_suffix(".cache.pkl").exists()
+
+    def test_cached_load_matches_parsed_load(self, catalog_copy):
+        parsed = CatalogLoader(catalog_copy).get_piece("base_plate")
+        cached = CatalogLoader(catalog_copy).get_piece("base_plate")
+        assert cached == parsed
+
+    def test_stale_cache_ignored_after_json_change(self, catalog_copy):
+        CatalogLoader(catalog_copy).get_all_pieces()
+        _rename_base_plate(catalog_copy)
+
+        piece = CatalogLoader(catalog_copy).get_piece("base_plate")
+        assert piece.display_name == "Placa Renombrada"
+
+    def test_live_loader_reloads_after_json_change(self, catalog_copy):
+        loader = CatalogLoader(catalog_copy)
+        assert loader.get_piece("base_plate").display_name == "Placa Base Estructural"
+        _rename_base_plate(catalog_copy)
+
+        assert loader.get_piece("base_plate").display_name == "Placa Renombrada"
+
+    def test_corrupt_cache_falls_back_to_json(self, catalog_copy):
+        CatalogLoader(catalog_copy).get_all_pieces()
+        cache = catalog_copy.with_suffix(".cache.pkl")
+        cache.write_bytes(cache.read_bytes()[:30])
+
+        assert CatalogLoader(catalog_copy).get_piece("base_plate") is not None
+
+    def test_failed_reload_keeps_previous_catalog(self, catalog_copy):
+        loader = CatalogLoader(catalog_copy)
+        assert loader.get_piece("base_plate") is not None
+        text = catalog_copy.read_text(encoding="utf-8")
+        catalog_copy.write_text(text[: len(text) // 2], encoding="utf-8")
+
+        with pytest.raises(ValueError):
+            loader.get_piece("base_plate")
+        assert "base_plate" in loader._raw_by_code
+
+        catalog_copy.write_text(text, encoding="utf-8")
+        _rename_base_plate(catalog_copy)
+        assert loader.get_piece("base_plate").display_name == "Placa Renombrada"
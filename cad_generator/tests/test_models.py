@@ -3,54 +3,69 @@ Tests for SQLAlchemy ORM models.
 Verifies model properties, serialization, and constraints.
 """
 
-import json
+from datetime import datetime, timezone
 
 import pytest
+from sqlalchemy import insert, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateTable
 
-from cad_generator.data.models import BOMItem, Design, PieceType, Revision
+from cad_generator.data.models import (
+    BOMItem,
+    Design,
+    PieceType,
+    Revision,
+)
 
 
-class TestRevisionParametersProperty:
+def _seed_bulk(session, pt_rows: list[dict], design_rows: list[dict]) -> None:
+    """Insert parent rows through Core bulk INSERTs (no ORM unit of work)."""
+    session.execute(insert(PieceType), pt_rows)
+    session.execute(insert(Design), design_rows)
+    session.flush()
 
-    def test_parameters_setter_serializes_to_json(self, db_session):
-        now = "2026-01-01T00:00:00+00:00"
-        pt = PieceType(
-            code="test_piece",
-            display_name="Test",
-            discipline="structural",
-            category="base",
-            catalog_version="1.0",
-            created_at=now,
-            updated_at=now,
-        )
-        db_session.add(pt)
-        db_session.flush()
 
-        design = Design(
-            piece_type_id=pt.id,
-            name="Test Design",
-            created_at=now,
-            updated_at=now,
+class TestRevisionJSONColumns:
+
+    def test_parameters_round_trip_through_json_column(self, db_session):
+        now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        _seed_bulk(
+            db_session,
+            [dict(id=1, code="test_piece", display_name="Test",
+                  discipline="structural", category="base",
+                  catalog_version="1.0", created_at=now, updated_at=now)],
+            [dict(id=1, piece_type_id=1, name="Test Design",
+                  created_at=now, updated_at=now)],
         )
-        db_session.add(design)
-        db_session.flush()
 
+        params = {"largo": 300.0, "ancho": 200.0, "tiene_ranuras": False}
         rev = Revision(
-            design_id=design.id,
+            design_id=1,
             revision_code="A",
+            parameters=params,
             generated_at=now,
             generated_by="Fede",
         )
-        params = {"largo": 300.0, "ancho": 200.0, "tiene_ranuras": False}
-        rev.parameters = params
         db_session.add(rev)
         db_session.commit()
 
         retrieved = db_session.get(Revision, rev.id)
         assert retrieved.parameters == params
-        # Verify JSON is actually stored as text
-        assert isinstance(retrieved.parameters_json, str)
-        assert json.loads(retrieved.parameters_json) == params
+        # Stored as JSON text in the historical column: queryable with JSON1
+        largo = db_session.execute(
+            text("SELECT json_extract(parameters_json, '$.largo') FROM revisions")
+        ).scalar_one()
+        assert largo == 300.0
+
+    def test_json_columns_are_jsonb_on_postgresql(self):
+        ddl = str(CreateTable(Revision.__table__).compile(dialect=postgresql.dialect()))
+        assert "parameters_json JSONB NOT NULL" in ddl
+        assert "validation_warnings_json JSONB" in ddl
+
+    def test_timestamps_load_as_datetimes(self, seeded_session):
+        pt = seeded_session.query(PieceType).one()
+        seeded_session.expire(pt)
+        assert isinstance(pt.created_at, datetime)
 
     def test_validation_warnings_empty_list_when_null(self, db_session):
         now = "2026-01-01T00:00:00+00:00"
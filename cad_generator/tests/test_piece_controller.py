@@ -3,26 +3,35 @@ Tests for PieceController.generate() — full pipeline with mocked CAD engine.
 
 These are integration-ish tests: the real DB logic (repositories, models)
 runs against an in-memory SQLite, while the FreeCAD subprocess is replaced
-by a MagicMock so the test suite has no FreeCAD dependency.
+by a FakeEngine so the test suite has no FreeCAD dependency.
 """
 from __future__ import annotations
 
+import threading
 from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from typing import Sequence
+from unittest.mock import Mock, patch
 
 import pytest
-from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
-from cad_generator.cad.base_engine import GenerationResult
+from cad_generator.cad.base_engine import (
+    GenerationJob,
+    GenerationResult,
+    ICADEngine,
+)
+from cad_generator.cad.freecad_engine import FreeCADEngine
+from cad_generator.config.settings import Settings
+from cad_generator.core import piece_controller
 from cad_generator.core.piece_controller import (
     GenerationRequest,
     GenerationResponse,
     PieceController,
 )
-from cad_generator.data.models import Base, Design, PieceType, Revision
+from cad_generator.data.models import Design, PieceType, Revision
+from cad_generator.data.repositories import RevisionRepository
 
 
 # ---------------------------------------------------------------------------
@@ -55,18 +64,23 @@ INVALID_PARAMS: dict = {
 # Fixtures
 # ---------------------------------------------------------------------------
 
-@pytest.fixture
-def in_memory_db():
-    """Fresh in-memory SQLite engine with schema created and one PieceType seeded."""
-    engine = create_engine(
-        "sqlite:///:memory:", connect_args={"check_same_thread": False}
+def _seeded_factory(conn) -> sessionmaker:
+    """
+    Session factory on *conn* with one PieceType seeded; its id is in every
+    session's info["base_plate_id"]. Every session it makes joins the
+    connection's open transaction, whose rollback undoes all writes.
+    """
+    info: dict = {}     # shared by every session: Session.info
+    Factory = sessionmaker(
+        bind=conn,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+        info=info,
     )
-    Base.metadata.create_all(engine)
-    Factory = sessionmaker(bind=engine, expire_on_commit=False)
 
-    now = datetime.now(timezone.utc).isoformat()
+    now = datetime.now(timezone.utc)
     with Factory() as s:
-        s.add(PieceType(
+        pt = PieceType(
             code="base_plate",
             display_name="Placa Base Estructural",
             discipline="structural",
@@ -76,26 +90,19 @@ def in_memory_db():
             is_active=1,
             created_at=now,
             updated_at=now,
-        ))
+        )
+        s.add(pt)
         s.commit()
+        info["base_plate_id"] = pt.id
 
-    yield Factory
-
-    Base.metadata.drop_all(engine)
-    engine.dispose()
+    return Factory
 
 
-@pytest.fixture
-def patched_controller(in_memory_db, tmp_path):
-    """
-    Returns a factory(mock_engine) -> PieceController configured to:
-      - use the in-memory test DB (via patched get_session)
-      - write outputs to tmp_path (via patched settings)
-      - delegate CAD generation to the supplied mock engine
-    """
+def _session_cm(factory):
+    """get_session() replacement drawing sessions from *factory*."""
     @contextmanager
-    def _session():
-        s = in_memory_db()
+    def _session(readonly=False):
+        s = factory()
         try:
             yield s
         except Exception:
@@ -103,21 +110,104 @@ def patched_controller(in_memory_db, tmp_path):
             raise
         finally:
             s.close()
+    return _session
+
+
+def _mock_settings(outputs_dir: Path) -> Mock:
+    """Settings stand-in: unknown attribute names raise, as on the real one."""
+    # Spec by field names: spec=settings would getattr() every pydantic attribute
+    return Mock(
+        spec=list(Settings.model_fields),
+        outputs_dir=outputs_dir,
+        validation_jit=False,
+    )
+
+
+@pytest.fixture
+def in_memory_db(db_connection):
+    """Seeded session factory on the test's rolled-back connection (conftest)."""
+    return _seeded_factory(db_connection)
+
+
+def _patch_controller_module(
+    mp: pytest.MonkeyPatch, factory, outputs_dir: Path
+) -> None:
+    """
+    Point piece_controller's get_session() at *factory* and its outputs at
+    *outputs_dir*: plain attribute swaps, undone by *mp*.
+    """
+    mp.setattr(piece_controller, "get_session", _session_cm(factory))
+    mp.setattr(piece_controller, "settings", _mock_settings(outputs_dir))
 
-    mock_settings = MagicMock()
-    mock_settings.outputs_dir = tmp_path
 
-    def make_controller(mock_engine: MagicMock) -> PieceController:
+@pytest.fixture
+def patched_controller(in_memory_db, tmp_path, monkeypatch):
+    """
+    Returns a factory(mock_engine) -> PieceController configured to:
+      - use the in-memory test DB (via patched get_session)
+      - write outputs to tmp_path (via patched settings)
+      - delegate CAD generation to the supplied mock engine
+    """
+    _patch_controller_module(monkeypatch, in_memory_db, tmp_path)
+
+    def make_controller(mock_engine: ICADEngine) -> PieceController:
         ctrl = PieceController()
         ctrl._engine = mock_engine
         return ctrl
 
-    # Keep the patches active for the whole test via yield inside a with-block
-    with (
-        patch("cad_generator.core.piece_controller.get_session", _session),
-        patch("cad_generator.core.piece_controller.settings", mock_settings),
-    ):
-        yield make_controller, in_memory_db
+    return make_controller, in_memory_db
+
+
+@pytest.fixture(scope="class")
+def class_ctrl(request, db_engine, tmp_path_factory):
+    """
+    One seeded database, Design, mock engine and PieceController for a
+    whole test class. The class supplies make_engine(tmp_dir); use through
+    shared_ctrl, which rolls back each test's writes, or generated.
+    """
+    tmp = tmp_path_factory.mktemp("cad")
+    conn = db_engine.connect()
+    trans = conn.begin()
+    factory = _seeded_factory(conn)
+    design_id = _insert_design(factory)
+
+    eng = request.cls.make_engine(tmp)
+    ctrl = PieceController()
+    ctrl._engine = eng
+
+    # The monkeypatch fixture is function-scoped: use a class-long context
+    with pytest.MonkeyPatch.context() as mp:
+        _patch_controller_module(mp, factory, tmp)
+        yield conn, ctrl, design_id, eng, factory
+
+    trans.rollback()
+    conn.close()
+
+
+@pytest.fixture
+def shared_ctrl(class_ctrl):
+    """(ctrl, design_id, eng, factory) of class_ctrl, isolated per test."""
+    conn, ctrl, design_id, eng, factory = class_ctrl
+    savepoint = conn.begin_nested()
+    result = eng.result
+    yield ctrl, design_id, eng, factory
+    savepoint.rollback()
+    eng.calls.clear()
+    eng.result = result
+
+
+@pytest.fixture(scope="class")
+def generated(class_ctrl):
+    """
+    (response, engine kwargs, factory) of one ctrl.generate(VALID_PARAMS)
+    run once per class. Its writes live until the class ends, so tests
+    using it must only read.
+    """
+    _, ctrl, design_id, eng, factory = class_ctrl
+    response = ctrl.generate(
+        GenerationRequest(design_id=design_id, parameters=VALID_PARAMS)
+    )
+    return response, eng.calls[-1], factory
 
 
 # ---------------------------------------------------------------------------
@@ -127,39 +217,78 @@ def patched_controller(in_memory_db, tmp_path):
 def _insert_design(factory, design_name: str = "Placa Test") -> int:
     """Insert a Design row linked to the base_plate piece type. Returns design.id."""
     with factory() as s:
-        pt = s.query(PieceType).filter_by(code="base_plate").first()
-        d = Design(piece_type_id=pt.id, name=design_name, description="")
+        d = Design(
+            piece_type_id=s.info["base_plate_id"], name=design_name, description=""
+        )
         s.add(d)
         s.commit()
         return d.id
 
 
 # ---------------------------------------------------------------------------
-# Mock engine factories
+# Fake CAD engine
 # ---------------------------------------------------------------------------
 
-def _success_engine(tmp_path: Path, revision_code: str = "A") -> MagicMock:
-    fcstd = tmp_path / f"base_plate_{revision_code}.FCStd"
-    step  = tmp_path / f"base_plate_{revision_code}.step"
+class FakeEngine(ICADEngine):
+    """Returns a fixed result for every generation and logs the calls."""
+
+    def __init__(self, result: GenerationResult) -> None:
+        self.result = result
+        self.calls: list[dict] = []             # generate() kwargs, in order
+        self.batches: list[list[GenerationJob]] = []   # generate_many() jobs
+
+    def generate(
+        self,
+        piece_code: str,
+        parameters: dict,
+        output_dir: Path,
+        revision_code: str,
+    ) -> GenerationResult:
+        self.calls.append({
+            "piece_code": piece_code,
+            "parameters": parameters,
+            "output_dir": output_dir,
+            "revision_code": revision_code,
+        })
+        return self.result
+
+    def generate_many(self, jobs: Sequence[GenerationJob]) -> list[GenerationResult]:
+        self.batches.append(list(jobs))
+        return [self.result for _ in jobs]
+
+    def is_available(self) -> bool:
+        return True
+
+    def get_engine_name(self) -> str:
+        return "FakeEngine"
+
+
+def _touch_outputs(directory: Path) -> tuple[Path, Path]:
+    """Empty (.FCStd, .step) files standing in for a generation's outputs."""
+    fcstd = directory / "base_plate_A.FCStd"
+    step  = directory / "base_plate_A.step"
     fcstd.touch()
     step.touch()
-    eng = MagicMock()
-    eng.generate.return_value = GenerationResult(
+    return fcstd, step
+
+
+@pytest.fixture(scope="session")
+def dummy_outputs(tmp_path_factory) -> tuple[Path, Path]:
+    """_touch_outputs() once per session; no test reads the files."""
+    return _touch_outputs(tmp_path_factory.mktemp("out"))
+
+
+def _success_engine(outputs: tuple[Path, Path]) -> FakeEngine:
+    fcstd, step = outputs
+    return FakeEngine(GenerationResult(
         success=True, fcstd_path=fcstd, step_path=step, warnings=[]
-    )
-    eng.is_available.return_value = True
-    eng.get_engine_name.return_value = "MockEngine"
-    return eng
+    ))
 
 
-def _failure_engine() -> MagicMock:
-    eng = MagicMock()
-    eng.generate.return_value = GenerationResult(
+def _failure_engine() -> FakeEngine:
+    return FakeEngine(GenerationResult(
         success=False, error_message="Fallo simulado del motor CAD."
-    )
-    eng.is_available.return_value = True
-    eng.get_engine_name.return_value = "MockEngine"
-    return eng
+    ))
 
 
 # ---------------------------------------------------------------------------
@@ -168,10 +297,10 @@ def _failure_engine() -> MagicMock:
 
 class TestGenerateInvalidParams:
 
-    def test_returns_failure_with_errors(self, patched_controller, tmp_path):
+    def test_returns_failure_with_errors(self, patched_controller, dummy_outputs):
         make_ctrl, factory = patched_controller
         design_id = _insert_design(factory)
-        eng = _success_engine(tmp_path)
+        eng = _success_engine(dummy_outputs)
         ctrl = make_ctrl(eng)
 
         response = ctrl.generate(
@@ -181,20 +310,20 @@ class TestGenerateInvalidParams:
         assert response.success is False
         assert len(response.errors) > 0
 
-    def test_cad_engine_not_called(self, patched_controller, tmp_path):
+    def test_cad_engine_not_called(self, patched_controller, dummy_outputs):
         make_ctrl, factory = patched_controller
         design_id = _insert_design(factory)
-        eng = _success_engine(tmp_path)
+        eng = _success_engine(dummy_outputs)
         ctrl = make_ctrl(eng)
 
         ctrl.generate(GenerationRequest(design_id=design_id, parameters=INVALID_PARAMS))
 
-        eng.generate.assert_not_called()
+        assert eng.calls == []
 
-    def test_no_revision_created_in_db(self, patched_controller, tmp_path):
+    def test_no_revision_created_in_db(self, patched_controller, dummy_outputs):
         make_ctrl, factory = patched_controller
         design_id = _insert_design(factory)
-        eng = _success_engine(tmp_path)
+        eng = _success_engine(dummy_outputs)
         ctrl = make_ctrl(eng)
 
         ctrl.generate(GenerationRequest(design_id=design_id, parameters=INVALID_PARAMS))
@@ -210,9 +339,9 @@ class TestGenerateInvalidParams:
 
 class TestGenerateDesignNotFound:
 
-    def test_nonexistent_design_returns_error(self, patched_controller, tmp_path):
+    def test_nonexistent_design_returns_error(self, patched_controller, dummy_outputs):
         make_ctrl, factory = patched_controller
-        eng = _success_engine(tmp_path)
+        eng = _success_engine(dummy_outputs)
         ctrl = make_ctrl(eng)
 
         response = ctrl.generate(
@@ -222,14 +351,16 @@ class TestGenerateDesignNotFound:
         assert response.success is False
         assert "no encontrado" in response.errors[0].lower()
 
-    def test_cad_engine_not_called_when_design_missing(self, patched_controller, tmp_path):
+    def test_cad_engine_not_called_when_design_missing(
+        self, patched_controller, dummy_outputs
+    ):
         make_ctrl, factory = patched_controller
-        eng = _success_engine(tmp_path)
+        eng = _success_engine(dummy_outputs)
         ctrl = make_ctrl(eng)
 
         ctrl.generate(GenerationRequest(design_id=99999, parameters=VALID_PARAMS))
 
-        eng.generate.assert_not_called()
+        assert eng.calls == []
 
 
 # ---------------------------------------------------------------------------
@@ -238,35 +369,54 @@ class TestGenerateDesignNotFound:
 
 class TestGenerateSuccess:
 
-    def test_response_is_successful(self, patched_controller, tmp_path):
-        make_ctrl, factory = patched_controller
-        design_id = _insert_design(factory)
-        ctrl = make_ctrl(_success_engine(tmp_path))
-
-        response = ctrl.generate(
-            GenerationRequest(design_id=design_id, parameters=VALID_PARAMS)
-        )
+    @staticmethod
+    def make_engine(tmp_path: Path) -> FakeEngine:
+        return _success_engine(_touch_outputs(tmp_path))
 
+    def test_response_is_successful(self, generated):
+        response, _, _ = generated
         assert response.success is True
 
-    def test_first_revision_code_is_A(self, patched_controller, tmp_path):
-        make_ctrl, factory = patched_controller
-        design_id = _insert_design(factory)
-        ctrl = make_ctrl(_success_engine(tmp_path))
+    def test_first_revision_code_is_A(self, generated):
+        response, _, _ = generated
+        assert response.revision_code == "A"
 
-        response = ctrl.generate(
-            GenerationRequest(design_id=design_id, parameters=VALID_PARAMS)
-        )
+    def test_revision_persisted_in_db(self, generated):
+        response, _, factory = generated
+        with factory() as s:
+            rev = s.get(Revision, response.revision_id)
+        assert rev is not None
+        assert rev.revision_code == "A"
 
-        assert response.revision_code == "A"
+    def test_validation_passed_flag_set(self, generated):
+        response, _, factory = generated
+        with factory() as s:
+            rev = s.get(Revision, response.revision_id)
+        assert rev.validation_passed == 1
+
+    def test_output_paths_stored_in_db(self, generated):
+        response, _, factory = generated
+        with factory() as s:
+            rev = s.get(Revision, response.revision_id)
+        assert rev.fcstd_path is not None
+        assert rev.step_path is not None
+
+    def test_cad_engine_called_with_correct_args(self, generated):
+        _, kw, _ = generated
+        assert kw["piece_code"] == "base_plate"
+        assert kw["parameters"] == VALID_PARAMS
+        assert kw["revision_code"] == "A"
 
-    def test_second_generation_increments_to_B(self, patched_controller, tmp_path):
-        make_ctrl, factory = patched_controller
-        design_id = _insert_design(factory)
-        eng = _success_engine(tmp_path)
-        # Override generate to always return success (paths don't matter for code test)
-        eng.generate.return_value = GenerationResult(success=True, warnings=[])
-        ctrl = make_ctrl(eng)
+
+class TestGenerateRevisionSequence:
+
+    @staticmethod
+    def make_engine(tmp_path: Path) -> FakeEngine:
+        # Paths don't matter for the revision code
+        return FakeEngine(GenerationResult(success=True, warnings=[]))
+
+    def test_second_generation_increments_to_B(self, shared_ctrl):
+        ctrl, design_id, _, _ = shared_ctrl
 
         resp1 = ctrl.generate(GenerationRequest(design_id=design_id, parameters=VALID_PARAMS))
         resp2 = ctrl.generate(GenerationRequest(design_id=design_id, parameters=VALID_PARAMS))
@@ -274,112 +424,203 @@ class TestGenerateSuccess:
         assert resp1.revision_code == "A"
         assert resp2.revision_code == "B"
 
-    def test_revision_persisted_in_db(self, patched_controller, tmp_path):
-        make_ctrl, factory = patched_controller
-        design_id = _insert_design(factory)
-        ctrl = make_ctrl(_success_engine(tmp_path))
 
-        response = ctrl.generate(
-            GenerationRequest(design_id=design_id, parameters=VALID_PARAMS)
-        )
+# ---------------------------------------------------------------------------
+# Tests: CAD engine failure  (revision still created for traceability)
+# ---------------------------------------------------------------------------
 
+class TestGenerateCADFailure:
+
+    @staticmethod
+    def make_engine(tmp_path: Path) -> FakeEngine:
+        return _failure_engine()
+
+    def test_response_is_failure(self, generated):
+        response, _, _ = generated
+        assert response.success is False
+
+    def test_error_message_forwarded(self, generated):
+        response, _, _ = generated
+        assert "Fallo simulado" in response.errors[0]
+
+    def test_revision_still_created_for_traceability(self, generated):
+        response, _, factory = generated
         with factory() as s:
             rev = s.get(Revision, response.revision_id)
         assert rev is not None
-        assert rev.revision_code == "A"
-
-    def test_validation_passed_flag_set(self, patched_controller, tmp_path):
-        make_ctrl, factory = patched_controller
-        design_id = _insert_design(factory)
-        ctrl = make_ctrl(_success_engine(tmp_path))
-
-        response = ctrl.generate(
-            GenerationRequest(design_id=design_id, parameters=VALID_PARAMS)
-        )
 
+    def test_output_paths_null_on_cad_failure(self, generated):
+        response, _, factory = generated
         with factory() as s:
             rev = s.get(Revision, response.revision_id)
-        assert rev.validation_passed == 1
+        assert rev.fcstd_path is None
+        assert rev.step_path is None
+
+
+# ---------------------------------------------------------------------------
+# Tests: deferred commit  (revision + output paths in one transaction)
+# ---------------------------------------------------------------------------
 
-    def test_output_paths_stored_in_db(self, patched_controller, tmp_path):
+class TestGenerateDeferredCommit:
+
+    def test_paths_stored_with_revision(self, patched_controller, dummy_outputs):
         make_ctrl, factory = patched_controller
         design_id = _insert_design(factory)
-        ctrl = make_ctrl(_success_engine(tmp_path))
+        ctrl = make_ctrl(_success_engine(dummy_outputs))
 
         response = ctrl.generate(
-            GenerationRequest(design_id=design_id, parameters=VALID_PARAMS)
+            GenerationRequest(design_id=design_id, parameters=VALID_PARAMS),
+            defer_commit=True,
         )
 
+        assert response.success is True
         with factory() as s:
             rev = s.get(Revision, response.revision_id)
-        assert rev.fcstd_path is not None
         assert rev.step_path is not None
 
-    def test_cad_engine_called_with_correct_args(self, patched_controller, tmp_path):
+    def test_revision_committed_on_cad_failure(self, patched_controller):
         make_ctrl, factory = patched_controller
         design_id = _insert_design(factory)
-        eng = _success_engine(tmp_path)
-        ctrl = make_ctrl(eng)
+        ctrl = make_ctrl(_failure_engine())
 
-        ctrl.generate(GenerationRequest(design_id=design_id, parameters=VALID_PARAMS))
+        response = ctrl.generate(
+            GenerationRequest(design_id=design_id, parameters=VALID_PARAMS),
+            defer_commit=True,
+        )
 
-        kw = eng.generate.call_args.kwargs
-        assert kw["piece_code"] == "base_plate"
-        assert kw["parameters"] == VALID_PARAMS
-        assert kw["revision_code"] == "A"
+        with factory() as s:
+            assert s.get(Revision, response.revision_id) is not None
 
 
 # ---------------------------------------------------------------------------
-# Tests: CAD engine failure  (revision still created for traceability)
+# Tests: batch generation  (one generate_many call for all valid requests)
 # ---------------------------------------------------------------------------
 
-class TestGenerateCADFailure:
+class TestGenerateBatch:
 
-    def test_response_is_failure(self, patched_controller, tmp_path):
+    @staticmethod
+    def _batch_engine() -> FakeEngine:
+        return FakeEngine(GenerationResult(success=True, warnings=[]))
+
+    def test_responses_in_request_order(self, patched_controller, tmp_path):
         make_ctrl, factory = patched_controller
         design_id = _insert_design(factory)
-        ctrl = make_ctrl(_failure_engine())
+        ctrl = make_ctrl(self._batch_engine())
 
-        response = ctrl.generate(
-            GenerationRequest(design_id=design_id, parameters=VALID_PARAMS)
-        )
+        responses = ctrl.generate_batch([
+            GenerationRequest(design_id=design_id, parameters=VALID_PARAMS),
+            GenerationRequest(design_id=design_id, parameters=INVALID_PARAMS),
+            GenerationRequest(design_id=design_id, parameters=VALID_PARAMS),
+        ])
 
-        assert response.success is False
+        assert [r.success for r in responses] == [True, False, True]
+        assert responses[0].revision_code == "A"
+        assert responses[2].revision_code == "B"
 
-    def test_error_message_forwarded(self, patched_controller, tmp_path):
+    def test_engine_receives_only_valid_jobs_in_one_call(self, patched_controller, tmp_path):
         make_ctrl, factory = patched_controller
         design_id = _insert_design(factory)
-        ctrl = make_ctrl(_failure_engine())
+        eng = self._batch_engine()
+        ctrl = make_ctrl(eng)
 
-        response = ctrl.generate(
-            GenerationRequest(design_id=design_id, parameters=VALID_PARAMS)
-        )
+        ctrl.generate_batch([
+            GenerationRequest(design_id=design_id, parameters=VALID_PARAMS),
+            GenerationRequest(design_id=design_id, parameters=INVALID_PARAMS),
+            GenerationRequest(design_id=99999, parameters=VALID_PARAMS),
+        ])
 
-        assert "Fallo simulado" in response.errors[0]
+        assert len(eng.batches) == 1
+        jobs = eng.batches[0]
+        assert len(jobs) == 1
+        assert jobs[0][0] == "base_plate"
+        assert eng.calls == []
+
+
+# ---------------------------------------------------------------------------
+# Tests: lightweight list endpoints
+# ---------------------------------------------------------------------------
+
+class TestLiteListings:
+
+    def test_list_piece_types_lite_returns_dicts(self, patched_controller):
+        make_ctrl, _ = patched_controller
+        rows = make_ctrl(Mock(spec=ICADEngine)).list_piece_types_lite()
 
-    def test_revision_still_created_for_traceability(self, patched_controller, tmp_path):
+        assert rows == [{
+            "id": rows[0]["id"],
+            "code": "base_plate",
+            "display_name": "Placa Base Estructural",
+            "discipline": "structural",
+            "category": "base",
+        }]
+
+    def test_list_designs_lite_returns_dicts(self, patched_controller):
         make_ctrl, factory = patched_controller
-        design_id = _insert_design(factory)
-        ctrl = make_ctrl(_failure_engine())
+        design_id = _insert_design(factory, "Placa Lite")
 
-        response = ctrl.generate(
-            GenerationRequest(design_id=design_id, parameters=VALID_PARAMS)
-        )
+        rows = make_ctrl(Mock(spec=ICADEngine)).list_designs_lite()
 
-        with factory() as s:
-            rev = s.get(Revision, response.revision_id)
-        assert rev is not None
+        assert [(r["id"], r["name"]) for r in rows] == [(design_id, "Placa Lite")]
 
-    def test_output_paths_null_on_cad_failure(self, patched_controller, tmp_path):
+    def test_list_revisions_lite_in_revision_order(self, patched_controller):
         make_ctrl, factory = patched_controller
         design_id = _insert_design(factory)
-        ctrl = make_ctrl(_failure_engine())
+        with factory() as s:
+            repo = RevisionRepository(s)
+            repo.create(design_id, VALID_PARAMS)
+            repo.create(design_id, VALID_PARAMS)
+            s.commit()
 
-        response = ctrl.generate(
-            GenerationRequest(design_id=design_id, parameters=VALID_PARAMS)
-        )
+        rows = make_ctrl(Mock(spec=ICADEngine)).list_revisions_lite(design_id)
 
-        with factory() as s:
-            rev = s.get(Revision, response.revision_id)
-        assert rev.fcstd_path is None
-        assert rev.step_path is None
+        assert [(r["revision_code"], r["eco_status"]) for r in rows] == [
+            ("A", "draft"), ("B", "draft"),
+        ]
+
+
+# ---------------------------------------------------------------------------
+# Tests: engine pre-warming
+# ---------------------------------------------------------------------------
+
+def _wait_for_prewarm() -> None:
+    for t in threading.enumerate():
+        if t.name == "freecad-prewarm":
+            t.join(timeout=5)
+
+
+class TestEnginePrewarm:
+
+    def test_prewarm_starts_worker_in_background(self):
+        eng = Mock(spec=FreeCADEngine)
+        with patch.object(PieceController, "_create_engine", return_value=eng):
+            PieceController(prewarm=True)
+        _wait_for_prewarm()
+        eng.ensure_started.assert_called_once()
+
+    def test_dead_worker_respawned_on_engine_access(self):
+        eng = Mock(spec=FreeCADEngine)
+        eng.is_running.return_value = False
+        eng.is_available.return_value = True
+        with patch.object(PieceController, "_create_engine", return_value=eng):
+            ctrl = PieceController(prewarm=True)
+            _wait_for_prewarm()
+            assert ctrl.engine is eng
+        _wait_for_prewarm()
+        assert eng.ensure_started.call_count == 2
+
+    def test_no_respawn_in_one_shot_mode(self, monkeypatch):
+        monkeypatch.setattr(piece_controller.settings, "freecad_persistent_worker", False)
+        eng = Mock(spec=FreeCADEngine)
+        eng.is_running.return_value = False
+        eng.is_available.return_value = True
+        with patch.object(PieceController, "_create_engine", return_value=eng):
+            ctrl = PieceController(prewarm=True)
+            _wait_for_prewarm()
+            for _ in range(3):
+                assert ctrl.engine is eng
+        _wait_for_prewarm()
+        assert eng.ensure_started.call_count == 1
+
+    def test_no_prewarm_by_default(self):
+        ctrl = PieceController()
+        assert ctrl._engine is None
@@ -3,14 +3,22 @@ Tests for the repository layer.
 All tests use the in-memory database fixtures from conftest.py.
 """
 
+from datetime import datetime, timezone
+
 import pytest
+from sqlalchemy import Integer, event, inspect, literal, select, update
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import InvalidRequestError
 
+from cad_generator.data.models import PieceType, Revision
 from cad_generator.data.repositories import (
     BOMRepository,
     DesignRepository,
     PieceTypeRepository,
     RevisionRepository,
     _increment_revision_code,
+    _revision_code,
+    _revision_code_sql,
 )
 
 
@@ -37,6 +45,30 @@ class TestIncrementRevisionCode:
     def test_case_insensitive(self):
         assert _increment_revision_code("a") == "B"
 
+    def test_sequence_is_gapless(self):
+        code, seen = "A", ["A"]
+        for _ in range(26 + 26 * 26):
+            code = _increment_revision_code(code)
+            seen.append(code)
+        assert seen[26] == "AA"
+        assert seen[-1] == "AAA"
+        assert len(set(seen)) == len(seen)
+
+    def test_sql_expression_matches_python(self, db_engine):
+        seqs = [1, 26, 27, 52, 702, 703, 18278, 18279, 475254, 475255,
+                2**31 - 1, 217180147158]
+        with db_engine.connect() as conn:
+            codes = [conn.scalar(select(_revision_code_sql(literal(n)))) for n in seqs]
+        assert codes == [_revision_code(n) for n in seqs]
+
+    def test_sql_expression_uses_integer_division_on_postgresql(self):
+        sql = str(
+            select(_revision_code_sql(literal(703, Integer)))
+            .compile(dialect=postgresql.dialect())
+        )
+        assert " / " in sql
+        assert "NUMERIC" not in sql and "FLOOR" not in sql.upper()
+
 
 # ---------------------------------------------------------------------------
 # PieceTypeRepository tests
@@ -68,6 +100,52 @@ class TestPieceTypeRepository:
         results_empty = repo.get_by_discipline("electrical")
         assert len(results_empty) == 0
 
+    def test_cached_lookups_skip_the_database(self, seeded_session, db_engine):
+        PieceTypeRepository(seeded_session).get_all_active()
+        statements = []
+        event.listen(db_engine, "before_cursor_execute",
+                     lambda *args: statements.append(args[2]))
+
+        repo = PieceTypeRepository(seeded_session)
+        repo.get_by_code("base_plate")
+        repo.get_by_discipline("structural")
+
+        assert statements == []
+
+    def test_cached_instances_are_detached(self, seeded_session):
+        pt = PieceTypeRepository(seeded_session).get_by_code("base_plate")
+        assert inspect(pt).detached
+        assert pt not in seeded_session
+
+    def test_new_piece_type_invalidates_cache(self, seeded_session):
+        repo = PieceTypeRepository(seeded_session)
+        assert len(repo.get_all_active()) == 1
+        seeded_session.add(PieceType(
+            code="anchor_bolt",
+            display_name="Perno de anclaje",
+            discipline="structural",
+            category="fastener",
+        ))
+        seeded_session.commit()
+
+        assert [pt.code for pt in repo.get_all_active()] == [
+            "base_plate", "anchor_bolt",
+        ]
+
+    def test_rollback_discards_uncommitted_piece_type(self, seeded_session):
+        repo = PieceTypeRepository(seeded_session)
+        seeded_session.add(PieceType(
+            code="anchor_bolt",
+            display_name="Perno de anclaje",
+            discipline="structural",
+            category="fastener",
+        ))
+        seeded_session.flush()
+        assert repo.get_by_code("anchor_bolt") is not None
+        seeded_session.rollback()
+
+        assert repo.get_by_code("anchor_bolt") is None
+
 
 # ---------------------------------------------------------------------------
 # DesignRepository tests
@@ -75,10 +153,11 @@ class TestPieceTypeRepository:
 
 class TestDesignRepository:
 
-    def test_create_and_retrieve(self, seeded_session):
-        pt = PieceTypeRepository(seeded_session).get_by_code("base_plate")
+    def test_create_and_retrieve(self, seeded_session, base_plate_id):
         repo = DesignRepository(seeded_session)
-        design = repo.create(piece_type_id=pt.id, name="Test Design", drawing_number="PB-001")
+        design = repo.create(
+            piece_type_id=base_plate_id, name="Test Design", drawing_number="PB-001"
+        )
         seeded_session.commit()
 
         retrieved = repo.get_by_id(design.id)
@@ -86,32 +165,59 @@ class TestDesignRepository:
         assert retrieved.name == "Test Design"
         assert retrieved.drawing_number == "PB-001"
 
-    def test_get_all_returns_created(self, seeded_session):
-        pt = PieceTypeRepository(seeded_session).get_by_code("base_plate")
+    def test_get_all_returns_created(self, seeded_session, base_plate_id):
         repo = DesignRepository(seeded_session)
-        repo.create(piece_type_id=pt.id, name="Design A")
-        repo.create(piece_type_id=pt.id, name="Design B")
+        repo.create(piece_type_id=base_plate_id, name="Design A")
+        repo.create(piece_type_id=base_plate_id, name="Design B")
         seeded_session.commit()
         assert len(repo.get_all()) == 2
 
+    def test_get_all_limit_returns_most_recent(self, seeded_session, base_plate_id):
+        repo = DesignRepository(seeded_session)
+        for name in ("Uno", "Dos", "Tres"):
+            repo.create(piece_type_id=base_plate_id, name=name)
+        seeded_session.commit()
+
+        assert [d.name for d in repo.get_all(limit=2)] == ["Tres", "Dos"]
+
     def test_get_by_id_not_found(self, seeded_session):
         repo = DesignRepository(seeded_session)
         assert repo.get_by_id(9999) is None
 
-    def test_update_name(self, seeded_session):
-        pt = PieceTypeRepository(seeded_session).get_by_code("base_plate")
+    def test_update_name(self, seeded_session, base_plate_id):
         repo = DesignRepository(seeded_session)
-        design = repo.create(piece_type_id=pt.id, name="Original")
+        design = repo.create(piece_type_id=base_plate_id, name="Original")
         seeded_session.commit()
 
         repo.update_name(design.id, "Updated")
         seeded_session.commit()
         assert repo.get_by_id(design.id).name == "Updated"
 
-    def test_delete(self, seeded_session):
-        pt = PieceTypeRepository(seeded_session).get_by_code("base_plate")
+    def test_update_name_bumps_updated_at(self, seeded_session, base_plate_id):
+        repo = DesignRepository(seeded_session)
+        design = repo.create(piece_type_id=base_plate_id, name="Original")
+        created = design.updated_at
+
+        updated = repo.update_name(design.id, "Updated")
+
+        assert updated is design
+        assert updated.updated_at.replace(tzinfo=None) > created.replace(tzinfo=None)
+
+    def test_orm_update_bumps_updated_at(self, seeded_session, base_plate_id):
+        design = DesignRepository(seeded_session).create(base_plate_id, "Original")
+        created = design.updated_at
+
+        design.description = "Nueva"
+        seeded_session.flush()
+
+        assert design.updated_at.replace(tzinfo=None) > created.replace(tzinfo=None)
+
+    def test_update_name_unknown_design(self, seeded_session):
+        assert DesignRepository(seeded_session).update_name(999, "X") is None
+
+    def test_delete(self, seeded_session, base_plate_id):
         repo = DesignRepository(seeded_session)
-        design = repo.create(piece_type_id=pt.id, name="To Delete")
+        design = repo.create(piece_type_id=base_plate_id, name="To Delete")
         seeded_session.commit()
 
         result = repo.delete(design.id)
@@ -126,15 +232,14 @@ class TestDesignRepository:
 
 class TestRevisionRepository:
 
-    def _create_design(self, session):
-        pt = PieceTypeRepository(session).get_by_code("base_plate")
+    def _create_design(self, session, piece_type_id):
         repo = DesignRepository(session)
-        design = repo.create(piece_type_id=pt.id, name="Rev Test Design")
+        design = repo.create(piece_type_id=piece_type_id, name="Rev Test Design")
         session.commit()
         return design
 
-    def test_revision_codes_increment_sequentially(self, seeded_session):
-        design = self._create_design(seeded_session)
+    def test_revision_codes_increment_sequentially(self, seeded_session, base_plate_id):
+        design = self._create_design(seeded_session, base_plate_id)
         r_repo = RevisionRepository(seeded_session)
 
         rev_a = r_repo.create(design.id, {"largo": 300.0}, description="Initial")
@@ -145,8 +250,22 @@ class TestRevisionRepository:
         seeded_session.commit()
         assert rev_b.revision_code == "B"
 
-    def test_parameters_serialized_correctly(self, seeded_session):
-        design = self._create_design(seeded_session)
+    def test_create_is_single_insert(self, seeded_session, base_plate_id, db_engine):
+        design = self._create_design(seeded_session, base_plate_id)
+        r_repo = RevisionRepository(seeded_session)
+        r_repo.create(design.id, {"largo": 100.0})
+        statements = []
+        event.listen(db_engine, "before_cursor_execute",
+                     lambda *args: statements.append(args[2]))
+
+        rev = r_repo.create(design.id, {"largo": 200.0})
+
+        assert len(statements) == 1
+        assert statements[0].lstrip().upper().startswith("INSERT")
+        assert (rev.revision_seq, rev.revision_code) == (2, "B")
+
+    def test_parameters_serialized_correctly(self, seeded_session, base_plate_id):
+        design = self._create_design(seeded_session, base_plate_id)
         r_repo = RevisionRepository(seeded_session)
         params = {"largo": 300.0, "ancho": 200.0, "espesor": 12.0}
         rev = r_repo.create(design.id, params)
@@ -155,8 +274,42 @@ class TestRevisionRepository:
         retrieved = r_repo.get_by_id(rev.id)
         assert retrieved.parameters == params
 
-    def test_get_latest_for_design(self, seeded_session):
-        design = self._create_design(seeded_session)
+    def test_validation_warnings_round_trip(self, seeded_session, base_plate_id):
+        design = self._create_design(seeded_session, base_plate_id)
+        r_repo = RevisionRepository(seeded_session)
+        warned = r_repo.create(design.id, {}, validation_warnings=["Aviso"]).id
+        clean = r_repo.create(design.id, {}).id
+        seeded_session.commit()
+        seeded_session.expunge_all()
+
+        assert r_repo.get_by_id(warned).validation_warnings == ["Aviso"]
+        assert r_repo.get_by_id(clean).validation_warnings == []
+
+    def test_payload_columns_deferred_in_listings(self, seeded_session, base_plate_id):
+        design = self._create_design(seeded_session, base_plate_id)
+        r_repo = RevisionRepository(seeded_session)
+        design_id = design.id
+        r_repo.create(design_id, {"largo": 300.0})
+        seeded_session.commit()
+        seeded_session.expunge_all()
+
+        rev = r_repo.get_by_design(design_id)[0]
+        assert "parameters" in inspect(rev).unloaded
+        assert "revision_code" not in inspect(rev).unloaded
+
+    def test_get_by_id_with_payload_usable_detached(self, seeded_session, base_plate_id):
+        design = self._create_design(seeded_session, base_plate_id)
+        r_repo = RevisionRepository(seeded_session)
+        rev_id = r_repo.create(design.id, {"largo": 300.0}).id
+        seeded_session.commit()
+        seeded_session.expunge_all()
+
+        retrieved = r_repo.get_by_id(rev_id, with_payload=True)
+        seeded_session.expunge(retrieved)
+        assert retrieved.parameters == {"largo": 300.0}
+
+    def test_get_latest_for_design(self, seeded_session, base_plate_id):
+        design = self._create_design(seeded_session, base_plate_id)
         r_repo = RevisionRepository(seeded_session)
         r_repo.create(design.id, {"largo": 100.0})
         seeded_session.commit()
@@ -167,8 +320,8 @@ class TestRevisionRepository:
         assert latest is not None
         assert latest.revision_code == "B"
 
-    def test_update_eco_status_valid(self, seeded_session):
-        design = self._create_design(seeded_session)
+    def test_update_eco_status_valid(self, seeded_session, base_plate_id):
+        design = self._create_design(seeded_session, base_plate_id)
         r_repo = RevisionRepository(seeded_session)
         rev = r_repo.create(design.id, {"largo": 300.0})
         seeded_session.commit()
@@ -180,8 +333,8 @@ class TestRevisionRepository:
         assert updated.eco_status == "issued"
         assert updated.eco_number == "ECO-001"
 
-    def test_update_eco_status_invalid_raises(self, seeded_session):
-        design = self._create_design(seeded_session)
+    def test_update_eco_status_invalid_raises(self, seeded_session, base_plate_id):
+        design = self._create_design(seeded_session, base_plate_id)
         r_repo = RevisionRepository(seeded_session)
         rev = r_repo.create(design.id, {"largo": 300.0})
         seeded_session.commit()
@@ -189,8 +342,8 @@ class TestRevisionRepository:
         with pytest.raises(ValueError, match="eco_status"):
             r_repo.update_eco_status(rev.id, "invalid_status")
 
-    def test_update_output_paths(self, seeded_session):
-        design = self._create_design(seeded_session)
+    def test_update_output_paths(self, seeded_session, base_plate_id):
+        design = self._create_design(seeded_session, base_plate_id)
         r_repo = RevisionRepository(seeded_session)
         rev = r_repo.create(design.id, {"largo": 300.0})
         seeded_session.commit()
@@ -207,6 +360,27 @@ class TestRevisionRepository:
         assert updated.step_path == "/outputs/PB_A.step"
         assert updated.dxf_path is None
 
+    def test_update_is_single_statement_and_syncs_instance(
+        self, seeded_session, base_plate_id, db_engine
+    ):
+        design = self._create_design(seeded_session, base_plate_id)
+        r_repo = RevisionRepository(seeded_session)
+        rev = r_repo.create(design.id, {"largo": 300.0})
+        rev_id = rev.id
+        statements = []
+        event.listen(db_engine, "before_cursor_execute",
+                     lambda *args: statements.append(args[2]))
+
+        returned = r_repo.update_output_paths(rev_id, {"step": "/outputs/PB_A.step"})
+
+        assert len(statements) == 1
+        assert statements[0].lstrip().upper().startswith("UPDATE")
+        assert returned is rev
+        assert rev.step_path == "/outputs/PB_A.step"
+
+    def test_update_unknown_revision_returns_none(self, seeded_session):
+        assert RevisionRepository(seeded_session).update_eco_status(999, "issued") is None
+
 
 # ---------------------------------------------------------------------------
 # BOMRepository tests
@@ -214,9 +388,8 @@ class TestRevisionRepository:
 
 class TestBOMRepository:
 
-    def test_create_and_retrieve_items(self, seeded_session):
-        pt = PieceTypeRepository(seeded_session).get_by_code("base_plate")
-        design = DesignRepository(seeded_session).create(pt.id, "BOM Test")
+    def test_create_and_retrieve_items(self, seeded_session, base_plate_id):
+        design = DesignRepository(seeded_session).create(base_plate_id, "BOM Test")
         seeded_session.commit()
 
         r_repo = RevisionRepository(seeded_session)
@@ -239,3 +412,141 @@ class TestBOMRepository:
         assert len(retrieved) == 2
         assert retrieved[0].description == "Placa Base"
         assert retrieved[1].description == "Perno M20"
+
+    def test_bulk_create_returns_instances_in_order(self, seeded_session, base_plate_id):
+        design = DesignRepository(seeded_session).create(base_plate_id, "BOM Bulk")
+        rev = RevisionRepository(seeded_session).create(design.id, {"largo": 300.0})
+
+        items = [{"description": f"Item {i}"} for i in range(1, 51)]
+        created = BOMRepository(seeded_session).create_items(rev.id, items)
+
+        assert [b.item_number for b in created] == list(range(1, 51))
+        assert [b.description for b in created] == [d["description"] for d in items]
+        assert all(b.id is not None and b.unit == "UN" for b in created)
+
+    def test_create_no_items(self, seeded_session):
+        assert BOMRepository(seeded_session).create_items(1, []) == []
+
+
+# ---------------------------------------------------------------------------
+# Eager loading  (relationships are lazy="raise")
+# ---------------------------------------------------------------------------
+
+class TestEagerLoading:
+
+    @staticmethod
+    def _design_with_bom(session, piece_type_id) -> int:
+        design = DesignRepository(session).create(piece_type_id, "Eager")
+        r_repo = RevisionRepository(session)
+        for largo in (100.0, 200.0):
+            rev = r_repo.create(design.id, {"largo": largo})
+            BOMRepository(session).create_items(rev.id, [{"description": "Placa"}])
+        session.commit()
+        design_id = design.id
+        session.expunge_all()
+        return design_id
+
+    def test_revisions_ordered_by_revision_seq(self, seeded_session, base_plate_id):
+        design_id = self._design_with_bom(seeded_session, base_plate_id)
+        # Skew the clock: A now looks newer than B
+        seeded_session.execute(
+            update(Revision)
+            .where(Revision.revision_code == "A")
+            .values(generated_at=datetime(2999, 1, 1, tzinfo=timezone.utc))
+        )
+        seeded_session.expunge_all()
+
+        design = DesignRepository(seeded_session).get_with_revisions(design_id)
+        repo = RevisionRepository(seeded_session)
+
+        assert [r.revision_code for r in design.revisions] == ["A", "B"]
+        assert design.latest_revision.revision_code == "B"
+        assert [r.revision_code for r in repo.get_by_design(design_id)] == ["A", "B"]
+        assert repo.get_latest_for_design(design_id).revision_code == "B"
+
+    def test_lazy_access_raises(self, seeded_session, base_plate_id):
+        design_id = self._design_with_bom(seeded_session, base_plate_id)
+        design = DesignRepository(seeded_session).get_by_id(design_id)
+        with pytest.raises(InvalidRequestError):
+            design.revisions
+
+    def test_get_with_revisions_uses_three_queries(self, seeded_session, base_plate_id, db_engine):
+        design_id = self._design_with_bom(seeded_session, base_plate_id)
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            # The session's SAVEPOINT (test isolation) is not a query
+            if not statement.startswith("SAVEPOINT"):
+                statements.append(statement)
+
+        # The engine is session-scoped: detach the listener afterwards
+        event.listen(db_engine, "before_cursor_execute", record)
+        try:
+            design = DesignRepository(seeded_session).get_with_revisions(design_id)
+
+            assert [r.revision_code for r in design.revisions] == ["A", "B"]
+            assert all(len(r.bom_items) == 1 for r in design.revisions)
+        finally:
+            event.remove(db_engine, "before_cursor_execute", record)
+        assert len(statements) == 3
+
+    def test_get_with_bom(self, seeded_session, base_plate_id):
+        design_id = self._design_with_bom(seeded_session, base_plate_id)
+        rev = RevisionRepository(seeded_session).get_latest_for_design(design_id)
+        seeded_session.expunge_all()
+
+        rev = RevisionRepository(seeded_session).get_with_bom(rev.id)
+        assert [b.description for b in rev.bom_items] == ["Placa"]
+
+
+# ---------------------------------------------------------------------------
+# Per-session query memoization
+# ---------------------------------------------------------------------------
+
+class TestQueryMemo:
+
+    @pytest.fixture
+    def statements(self, db_engine):
+        captured = []
+        event.listen(db_engine, "before_cursor_execute",
+                     lambda *args: captured.append(args[2]))
+        return captured
+
+    def test_repeat_get_all_issues_no_sql(self, seeded_session, base_plate_id, statements):
+        repo = DesignRepository(seeded_session)
+        repo.create(base_plate_id, "Uno")
+        first = repo.get_all()
+        statements.clear()
+
+        assert repo.get_all() == first
+        assert statements == []
+
+    def test_flush_invalidates(self, seeded_session, base_plate_id):
+        repo = DesignRepository(seeded_session)
+        repo.create(base_plate_id, "Uno")
+        assert len(repo.get_all()) == 1
+        repo.create(base_plate_id, "Dos")
+        assert len(repo.get_all()) == 2
+
+    def test_bulk_update_invalidates_ordering(self, seeded_session, base_plate_id):
+        repo = DesignRepository(seeded_session)
+        older = repo.create(base_plate_id, "Viejo")
+        repo.create(base_plate_id, "Nuevo")
+        assert repo.get_all()[0].name == "Nuevo"
+
+        repo.update_name(older.id, "Renombrado")
+        assert repo.get_all()[0].name == "Renombrado"
+
+    def test_revisions_memo_sees_new_revision(self, seeded_session, base_plate_id):
+        design = DesignRepository(seeded_session).create(base_plate_id, "Revs")
+        repo = RevisionRepository(seeded_session)
+        repo.create(design.id, {"largo": 1.0})
+        assert len(repo.get_by_design(design.id)) == 1
+        repo.create(design.id, {"largo": 2.0})
+        assert [r.revision_code for r in repo.get_by_design(design.id)] == ["A", "B"]
+
+    def test_commit_clears_memo(self, seeded_session, base_plate_id):
+        DesignRepository(seeded_session).create(base_plate_id, "Uno")
+        DesignRepository(seeded_session).get_all()
+        seeded_session.commit()
+        assert "query_memo" not in seeded_session.info
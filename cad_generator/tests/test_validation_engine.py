@@ -3,13 +3,25 @@ Tests for the ValidationEngine.
 No database needed — tests are pure Python.
 """
 
+import pickle
+from collections import ChainMap
+from types import MappingProxyType
+
 import pytest
 
-from cad_generator.core.validation_engine import Severity, ValidationEngine
+from cad_generator.core import validation_engine
+from cad_generator.core.validation_engine import (
+    Severity,
+    ValidationEngine,
+    _compile_expression,
+    compile_rule,
+    compile_rules,
+)
 
 
-# Default valid parameters for Placa Base
-BASE_PARAMS = {
+# Default valid parameters for Placa Base. Read-only: tests layer their
+# overrides on top with ChainMap instead of copying it.
+BASE_PARAMS = MappingProxyType({
     "largo": 300.0,
     "ancho": 200.0,
     "espesor": 12.0,
@@ -18,7 +30,7 @@ BASE_PARAMS = {
     "tiene_ranuras": False,
     "ancho_ranura": 12.0,
     "largo_ranura": 40.0,
-}
+})
 
 # Minimal rule set for testing
 RULES = [
@@ -68,12 +80,13 @@ class TestValidationEngineValidParameters:
         engine = ValidationEngine()
         result = engine.validate(BASE_PARAMS, [])
         assert result.is_valid
+        assert result.errors == [] and result.warnings == []
 
 
 class TestValidationEngineErrors:
 
     def test_thin_plate_fails_vr_bp_01(self):
-        params = {**BASE_PARAMS, "espesor": 2.0}
+        params = ChainMap({"espesor": 2.0}, BASE_PARAMS)
         result = ValidationEngine().validate(params, RULES)
         assert not result.is_valid
         rule_ids = [m.rule_id for m in result.errors]
@@ -81,14 +94,14 @@ class TestValidationEngineErrors:
 
     def test_small_margin_fails_vr_bp_04(self):
         # margen=20 < 18*1.5=27 → error
-        params = {**BASE_PARAMS, "margen_perforacion": 20.0}
+        params = ChainMap({"margen_perforacion": 20.0}, BASE_PARAMS)
         result = ValidationEngine().validate(params, RULES)
         assert not result.is_valid
         assert any(m.rule_id == "VR-BP-04" for m in result.errors)
 
     def test_plate_too_short_fails_vr_bp_05(self):
         # largo=60 < 2*30+18=78 → error
-        params = {**BASE_PARAMS, "largo": 60.0}
+        params = ChainMap({"largo": 60.0}, BASE_PARAMS)
         result = ValidationEngine().validate(params, RULES)
         assert not result.is_valid
         assert any(m.rule_id == "VR-BP-05" for m in result.errors)
@@ -98,7 +111,7 @@ class TestValidationEngineWarnings:
 
     def test_high_aspect_ratio_gives_warning_not_error(self):
         # ratio = 3000/200 = 15 > 10 → warning only
-        params = {**BASE_PARAMS, "largo": 3000.0}
+        params = ChainMap({"largo": 3000.0}, BASE_PARAMS)
         result = ValidationEngine().validate(params, RULES)
         # Result may still be is_valid=True (no errors)
         warning_ids = [m.rule_id for m in result.warnings]
@@ -108,11 +121,133 @@ class TestValidationEngineWarnings:
         assert "VR-BP-02" not in error_ids
 
     def test_long_slot_gives_warning(self):
-        params = {**BASE_PARAMS, "tiene_ranuras": True, "largo_ranura": 250.0}
+        params = ChainMap({"tiene_ranuras": True, "largo_ranura": 250.0}, BASE_PARAMS)
         result = ValidationEngine().validate(params, RULES)
         warning_ids = [m.rule_id for m in result.warnings]
         assert "VR-BP-07" in warning_ids
 
+    def test_warnings_only_result_is_valid(self):
+        params = ChainMap({"largo": 3000.0}, BASE_PARAMS)
+        result = ValidationEngine().validate(params, RULES)
+        assert result.is_valid
+        assert result.errors == []
+        assert all(m.severity is Severity.WARNING for m in result.warnings)
+
+    def test_messages_keep_rule_order(self):
+        params = ChainMap(
+            {"espesor": 2.0, "largo": 3000.0, "margen_perforacion": 10.0}, BASE_PARAMS
+        )
+        result = ValidationEngine().validate(params, RULES)
+        assert [m.rule_id for m in result.messages] == [
+            "VR-BP-01", "VR-BP-02", "VR-BP-04",
+        ]
+        assert [m.rule_id for m in result.errors] == ["VR-BP-01", "VR-BP-04"]
+        assert [m.rule_id for m in result.warnings] == ["VR-BP-02"]
+
+
+class TestCompiledRules:
+
+    def test_compiled_rules_match_raw_dicts(self):
+        params = ChainMap({"espesor": 3.0, "largo": 3000.0}, BASE_PARAMS)
+        compiled = [compile_rule(r) for r in RULES]
+        engine = ValidationEngine()
+        assert engine.validate(params, compiled) == engine.validate(params, RULES)
+
+    def test_compiled_rule_survives_pickle(self):
+        rule = compile_rule(RULES[0])
+        clone = pickle.loads(pickle.dumps(rule))
+        assert clone.rule_id == rule.rule_id
+        assert clone.code is not None
+
+    def test_compiled_rule_set_survives_pickle(self):
+        rules = compile_rules(RULES)
+        clone = pickle.loads(pickle.dumps(rules))
+        assert clone == rules
+        assert clone.run(BASE_PARAMS) == rules.run(BASE_PARAMS)
+
+
+class TestValidationEngineFailFast:
+
+    def test_stops_at_first_error(self):
+        # Thin plate (VR-BP-01) and short plate (VR-BP-05) both fail
+        params = ChainMap({"espesor": 3.0, "largo": 50.0}, BASE_PARAMS)
+        full = ValidationEngine().validate(params, RULES)
+        fast = ValidationEngine().validate(params, RULES, fail_fast=True)
+        assert len(full.errors) > 1
+        assert [m.rule_id for m in fast.errors] == [full.errors[0].rule_id]
+        assert not fast.is_valid
+
+    def test_passing_result_keeps_warnings(self):
+        params = ChainMap({"largo": 3000.0}, BASE_PARAMS)
+        result = ValidationEngine().validate(params, RULES, fail_fast=True)
+        assert result.is_valid
+        assert "VR-BP-02" in [m.rule_id for m in result.warnings]
+
+
+class TestValidationEngineJit:
+    """jit=True must give identical results with or without numba installed."""
+
+    @pytest.mark.parametrize("overrides", [
+        {},
+        {"espesor": 3.0, "largo": 50.0},
+        {"largo": 3000.0},
+        {"tiene_ranuras": True, "largo_ranura": 250.0},
+    ])
+    def test_matches_eval_results(self, overrides):
+        params = ChainMap(overrides, BASE_PARAMS)
+        plain = ValidationEngine().validate(params, RULES)
+        jitted = ValidationEngine(jit=True).validate(params, RULES)
+        assert jitted == plain
+
+    def test_missing_parameter_reports_eval_error(self):
+        rules = [{"rule_id": "X", "expression": "nope > 1",
+                  "severity": "error", "message": "m"}]
+        result = ValidationEngine(jit=True).validate({}, rules)
+        assert "nope" in result.errors[0].message
+
+
+class TestValidationEngineBatch:
+
+    SWEEP = [BASE_PARAMS | {"espesor": e} for e in (2.0, 6.0, 12.0, 25.0)]
+
+    def test_serial_batch_matches_validate(self):
+        engine = ValidationEngine()
+        results = engine.validate_batch(self.SWEEP, RULES)
+        assert results == [engine.validate(p, RULES) for p in self.SWEEP]
+
+    def test_single_pass_matches_validate(self):
+        rules = compile_rules(RULES)
+        assert rules.run_many is not None
+        sweep = self.SWEEP + [BASE_PARAMS | {"largo": 3000.0}]
+        engine = ValidationEngine()
+        assert engine.validate_batch(sweep, rules) == [
+            engine.validate(p, rules) for p in sweep
+        ]
+
+    @pytest.mark.parametrize("expression", [
+        "nope > 0",                                     # raises in the pass
+        "all(x > 0 for x in (largo, ancho))",           # no single-pass form
+    ])
+    def test_single_pass_falls_back_per_set(self, expression):
+        rules = compile_rules(RULES + [{"rule_id": "VR-X", "expression": expression}])
+        engine = ValidationEngine()
+        assert engine.validate_batch(self.SWEEP, rules) == [
+            engine.validate(p, rules) for p in self.SWEEP
+        ]
+
+    def test_large_batch_without_jit_stays_serial(self, monkeypatch):
+        monkeypatch.setattr(validation_engine, "_PARALLEL_MIN_BATCH", 0)
+        monkeypatch.setattr(validation_engine, "ThreadPoolExecutor", None)
+        engine = ValidationEngine()
+        results = engine.validate_batch(self.SWEEP, RULES)
+        assert [r.is_valid for r in results] == [False, True, True, True]
+
+    def test_parallel_batch_keeps_order(self, monkeypatch):
+        monkeypatch.setattr(validation_engine, "_PARALLEL_MIN_BATCH", 0)
+        engine = ValidationEngine(jit=True)
+        results = engine.validate_batch(self.SWEEP, RULES, max_workers=2)
+        assert [r.is_valid for r in results] == [False, True, True, True]
+
 
 class TestValidationEngineEdgeCases:
 
@@ -130,8 +265,82 @@ class TestValidationEngineEdgeCases:
         assert any(m.rule_id == "VR-BAD" for m in result.errors)
 
     def test_slot_rule_skipped_when_no_slots(self):
-        params = {**BASE_PARAMS, "tiene_ranuras": False, "largo_ranura": 999.0}
+        params = ChainMap({"tiene_ranuras": False, "largo_ranura": 999.0}, BASE_PARAMS)
         result = ValidationEngine().validate(params, RULES)
         # VR-BP-07: not tiene_ranuras or ... → True because tiene_ranuras=False
         warning_ids = [m.rule_id for m in result.warnings]
         assert "VR-BP-07" not in warning_ids
+
+    def test_syntax_error_becomes_error_message(self):
+        bad_rules = [
+            {
+                "rule_id": "VR-SYNTAX",
+                "expression": "espesor >=",
+                "severity": "warning",
+                "message": "Broken rule.",
+            }
+        ]
+        result = ValidationEngine().validate(BASE_PARAMS, bad_rules)
+        assert not result.is_valid
+        assert any(m.rule_id == "VR-SYNTAX" for m in result.errors)
+
+    def test_eval_globals_never_mutated(self):
+        before_id = id(validation_engine._SAFE_GLOBALS)
+        before = dict(validation_engine._SAFE_GLOBALS)
+        ValidationEngine().validate(BASE_PARAMS, RULES)
+        assert id(validation_engine._SAFE_GLOBALS) == before_id
+        assert validation_engine._SAFE_GLOBALS == before
+
+    def test_expressions_compiled_once(self):
+        engine = ValidationEngine()
+        engine.validate(BASE_PARAMS, RULES)
+        hits_before = _compile_expression.cache_info().hits
+        engine.validate(BASE_PARAMS, RULES)
+        assert _compile_expression.cache_info().hits - hits_before == len(RULES)
+
+    @pytest.mark.parametrize("overrides", [
+        {}, {"espesor": 1.0}, {"largo": 3000.0, "ancho": 100.0},
+        {"tiene_ranuras": True, "largo_ranura": 999.0},
+    ])
+    def test_rule_functions_match_eval(self, overrides):
+        params = ChainMap(overrides, BASE_PARAMS)
+        for raw in RULES:
+            rule = compile_rule(raw)
+            assert rule.func is not None
+            assert bool(rule.func(params)) == bool(
+                eval(rule.code, validation_engine._SAFE_GLOBALS, params)
+            )
+
+    @pytest.mark.parametrize("overrides", [{}, {"espesor": 1.0}, {"largo": 3000.0}])
+    def test_ruleset_function_matches_rule_functions(self, overrides):
+        params = ChainMap(overrides, BASE_PARAMS)
+        rules = [compile_rule(raw) for raw in RULES]
+        run = validation_engine._ruleset_function(tuple(r.expression for r in rules))
+        assert run(params) == [bool(r.func(params)) for r in rules]
+
+    def test_ruleset_function_defers_failing_rules(self):
+        run = validation_engine._ruleset_function(
+            ("largo > 0", "nope > 0", "all(x > 0 for x in (largo,))", "largo >")
+        )
+        assert run({"largo": 1.0}) == [True, None, None, None]
+
+    @pytest.mark.parametrize("params, valid", [({"pi": 20}, True), ({}, False)])
+    def test_parameter_shadows_math_name_as_in_eval(self, params, valid):
+        raw = {"rule_id": "VR-PI", "expression": "pi > 10"}
+        rule = compile_rule(raw)
+        assert bool(rule.func(params)) is valid
+        assert bool(eval(rule.code, validation_engine._SAFE_GLOBALS, params)) is valid
+        engine = ValidationEngine()
+        assert engine.validate(params, [raw]).is_valid is valid
+        assert [r.is_valid for r in engine.validate_batch([params], [raw])] == [valid]
+
+    def test_comprehension_rule_stays_on_eval(self):
+        rule = compile_rule({
+            "rule_id": "VR-GEN",
+            "expression": "all(x > 0 for x in (largo, ancho))",
+        })
+        assert rule.func is None
+
+    def test_missing_parameter_message_matches_eval(self):
+        result = ValidationEngine().validate({}, RULES[:1])
+        assert "name 'espesor' is not defined" in result.errors[0].message